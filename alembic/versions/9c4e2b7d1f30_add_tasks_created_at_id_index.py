@@ -0,0 +1,25 @@
+"""Add tasks created_at id index
+
+Revision ID: 9c4e2b7d1f30
+Revises: 3a86b89facd7
+Create Date: 2026-10-18 15:55:12.418305
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+revision: str = "9c4e2b7d1f30"
+down_revision: Union[str, None] = "3a86b89facd7"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_index(
+        "ix_tasks_created_at_id", "tasks", ["created_at", "id"], unique=False
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_tasks_created_at_id", table_name="tasks")
@@ -0,0 +1,78 @@
+import argparse
+import asyncio
+import random
+from concurrent.futures import ThreadPoolExecutor
+from typing import List
+
+from benchmarks.utils import (clear_database, create_reference_rows,
+                              iter_task_rows, measure, report)
+from src.db.db import (async_engine, async_session_factory, session,
+                       session_factory)
+from src.db.loader import copy_rows
+from tests.actions.tasks import AsyncTaskActions, TaskActions
+
+
+def threaded_filter_by(task_ids: List[int], concurrency: int) -> None:
+    def lookup(worker_ids: List[int]) -> None:
+        with session_factory() as worker_session:
+            task_actions = TaskActions(worker_session)
+            for task_id in worker_ids:
+                task_actions.get_task_by_id(task_id)
+
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        list(executor.map(lookup, split(task_ids, concurrency)))
+
+
+async def async_filter_by(task_ids: List[int], concurrency: int) -> None:
+    async def lookup(worker_ids: List[int]) -> None:
+        async with async_session_factory() as worker_session:
+            task_actions = AsyncTaskActions(worker_session)
+            for task_id in worker_ids:
+                await task_actions.get_task_by_id(task_id)
+
+    await asyncio.gather(*(lookup(ids) for ids in split(task_ids, concurrency)))
+    await async_engine.dispose()
+
+
+def split(task_ids: List[int], parts: int) -> List[List[int]]:
+    return [task_ids[index::parts] for index in range(parts)]
+
+
+def run(rows: int, lookups: int, concurrency: int) -> None:
+    clear_database()
+    try:
+        reference = create_reference_rows()
+        copy_rows(
+            "tasks",
+            iter_task_rows(
+                rows,
+                reference["user_id"],
+                reference["priority_id"],
+                reference["status_id"],
+            ),
+        )
+        tasks = TaskActions(session).get_all_tasks_by_filter(
+            "creator_id", reference["user_id"]
+        )
+        task_ids = random.sample([task["id"] for task in tasks], min(lookups, rows))
+        session.commit()
+
+        _, elapsed = measure(threaded_filter_by, task_ids, concurrency)
+        report(
+            f"filter_by {concurrency} threads, sync sessions", len(task_ids), elapsed
+        )
+        _, elapsed = measure(asyncio.run, async_filter_by(task_ids, concurrency))
+        report(f"filter_by {concurrency} tasks, async sessions", len(task_ids), elapsed)
+    finally:
+        clear_database()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Concurrent filter_by lookups with threads versus asyncio"
+    )
+    parser.add_argument("--rows", type=int, default=10_000)
+    parser.add_argument("--lookups", type=int, default=5000)
+    parser.add_argument("--concurrency", type=int, default=20)
+    arguments = parser.parse_args()
+    run(arguments.rows, arguments.lookups, arguments.concurrency)
@@ -0,0 +1,48 @@
+import argparse
+
+from benchmarks.utils import (build_task_rows, build_user_rows, clear_database,
+                              create_reference_rows, measure, report)
+from src.db.db import session
+from tests.actions.tasks import TaskActions
+from tests.actions.users import UserActions
+
+
+def run(rows: int, batch_size: int) -> None:
+    clear_database()
+    try:
+        reference = create_reference_rows()
+        user_actions = UserActions(session)
+        task_actions = TaskActions(session)
+
+        users = build_user_rows(rows, reference["role_id"])
+        _, elapsed = measure(lambda: [user_actions.create_user(row) for row in users])
+        report("users create_instance per row", rows, elapsed)
+
+        users = build_user_rows(rows, reference["role_id"])
+        _, elapsed = measure(user_actions.create_users, users, batch_size)
+        report(f"users create_instances batch_size={batch_size}", rows, elapsed)
+
+        task_ids = (
+            reference["user_id"],
+            reference["priority_id"],
+            reference["status_id"],
+        )
+        tasks = build_task_rows(rows, *task_ids)
+        _, elapsed = measure(lambda: [task_actions.create_task(row) for row in tasks])
+        report("tasks create_instance per row", rows, elapsed)
+
+        tasks = build_task_rows(rows, *task_ids)
+        _, elapsed = measure(task_actions.create_tasks, tasks, batch_size)
+        report(f"tasks create_instances batch_size={batch_size}", rows, elapsed)
+    finally:
+        clear_database()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Per-row versus batched INSERT ... RETURNING"
+    )
+    parser.add_argument("--rows", type=int, default=10_000)
+    parser.add_argument("--batch-size", type=int, default=1000)
+    arguments = parser.parse_args()
+    run(arguments.rows, arguments.batch_size)
@@ -0,0 +1,85 @@
+import argparse
+import random
+
+from benchmarks.utils import measure, report, truncate_database
+from src.db.db import session
+from src.db.instrumentation import QueryRecorder
+from src.logger.logger import logger
+from tests.actions.statuses import StatusActions
+from tests.actions.tasks import TaskActions
+from tests.factories.generation import generate_dataset
+
+
+def run(tasks: int, per_row_updates: int, batch_size: int) -> None:
+    truncate_database()
+    try:
+        generate_dataset(
+            {
+                "roles": 10,
+                "users": 1000,
+                "priorities": 100,
+                "statuses": 100,
+                "tasks": tasks,
+            },
+            processes=1,
+        )
+        task_actions = TaskActions(session)
+        task_ids = [task["id"] for task in task_actions.get_all_tasks()]
+        status_ids = [
+            status["id"] for status in StatusActions(session).get_all_statuses()
+        ]
+        session.commit()
+
+        sample_ids = random.sample(task_ids, per_row_updates)
+        with QueryRecorder() as recorder:
+            _, elapsed = measure(
+                lambda: [
+                    task_actions.update_task_field(
+                        "id", task_id, "status_id", random.choice(status_ids)
+                    )
+                    for task_id in sample_ids
+                ]
+            )
+        report("update_field per task", per_row_updates, elapsed)
+        logger.info(
+            "[benchmark] update_field per task: %d queries, ~%.1fs extrapolated to %d tasks",
+            len(recorder),
+            elapsed / per_row_updates * tasks,
+            tasks,
+        )
+
+        with QueryRecorder() as recorder:
+            updated_count, elapsed = measure(
+                task_actions.update_tasks_where,
+                {},
+                {"status_id": status_ids[0]},
+                allow_all=True,
+            )
+        report(f"update_where ({len(recorder)} queries)", updated_count, elapsed)
+
+        tasks_data = [
+            {"id": task_id, "status_id": random.choice(status_ids)}
+            for task_id in task_ids
+        ]
+        with QueryRecorder() as recorder:
+            updated, elapsed = measure(
+                task_actions.bulk_update_tasks, tasks_data, batch_size
+            )
+        report(
+            f"bulk_update_rows batch_size={batch_size} ({len(recorder)} queries)",
+            updated,
+            elapsed,
+        )
+    finally:
+        truncate_database()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Updating task status_id row by row, set-based and via UPDATE ... FROM VALUES"
+    )
+    parser.add_argument("--tasks", type=int, default=50_000)
+    parser.add_argument("--per-row-updates", type=int, default=1000)
+    parser.add_argument("--batch-size", type=int, default=1000)
+    arguments = parser.parse_args()
+    run(arguments.tasks, arguments.per_row_updates, arguments.batch_size)
@@ -0,0 +1,91 @@
+import argparse
+import threading
+import time
+from typing import Callable, List
+
+from sqlalchemy import text
+
+from benchmarks.utils import measure, report, truncate_database
+from src.db.db import engine, session
+from src.logger.logger import logger
+from tests.actions.tasks import TaskActions
+from tests.factories.generation import generate_dataset
+
+
+def generate_tasks(tasks: int) -> None:
+    truncate_database()
+    generate_dataset(
+        {
+            "roles": 10,
+            "users": 1000,
+            "priorities": 100,
+            "statuses": 100,
+            "tasks": tasks,
+        },
+        processes=1,
+    )
+
+
+def probe_row_locks(
+    ready: threading.Event, stop: threading.Event, latencies: List[float]
+) -> None:
+    with engine.connect() as connection:
+        last_id = connection.execute(text("SELECT max(id) FROM tasks")).scalar()
+        connection.commit()
+        ready.set()
+        while not stop.is_set():
+            started_at = time.perf_counter()
+            connection.execute(
+                text("UPDATE tasks SET title = title WHERE id = :id"), {"id": last_id}
+            )
+            connection.commit()
+            latencies.append(time.perf_counter() - started_at)
+            time.sleep(0.01)
+
+
+def measure_with_probe(label: str, tasks: int, delete: Callable) -> None:
+    ready = threading.Event()
+    stop = threading.Event()
+    latencies: List[float] = []
+    probe = threading.Thread(target=probe_row_locks, args=(ready, stop, latencies))
+    probe.start()
+    ready.wait()
+    try:
+        _, elapsed = measure(delete)
+    finally:
+        stop.set()
+        probe.join()
+    report(label, tasks, elapsed)
+    logger.info(
+        "[benchmark] %s: concurrent single-row UPDATE waited up to %.3fs",
+        label,
+        max(latencies, default=0.0),
+    )
+
+
+def run(tasks: int, chunk_size: int) -> None:
+    task_actions = TaskActions(session)
+    try:
+        generate_tasks(tasks)
+        measure_with_probe("delete_all", tasks, task_actions.delete_all_tasks)
+
+        generate_tasks(tasks)
+        measure_with_probe(
+            f"delete_in_chunks chunk_size={chunk_size}",
+            tasks,
+            lambda: task_actions.delete_tasks_in_chunks(
+                chunk_size=chunk_size, allow_all=True
+            ),
+        )
+    finally:
+        truncate_database()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Clearing tasks with one DELETE versus id-bounded chunks"
+    )
+    parser.add_argument("--tasks", type=int, default=200_000)
+    parser.add_argument("--chunk-size", type=int, default=10_000)
+    arguments = parser.parse_args()
+    run(arguments.tasks, arguments.chunk_size)
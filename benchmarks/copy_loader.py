@@ -0,0 +1,55 @@
+import argparse
+
+from benchmarks.utils import (build_task_rows, build_user_rows, clear_database,
+                              create_reference_rows, measure, report)
+from src.db.db import session
+from src.db.loader import copy_rows
+from src.logger.logger import logger
+from tests.actions.tasks import TaskActions
+from tests.actions.users import UserActions
+
+
+def run(rows: int, batch_size: int) -> None:
+    clear_database()
+    try:
+        reference = create_reference_rows()
+        task_ids = (
+            reference["user_id"],
+            reference["priority_id"],
+            reference["status_id"],
+        )
+
+        users = build_user_rows(rows, reference["role_id"])
+        _, elapsed = measure(UserActions(session).create_users, users, batch_size)
+        report(f"users create_instances batch_size={batch_size}", rows, elapsed)
+
+        users = build_user_rows(rows, reference["role_id"])
+        load_report = copy_rows("users", users)
+        report("users COPY FROM STDIN", load_report.rows, load_report.elapsed)
+
+        tasks = build_task_rows(rows, *task_ids)
+        _, elapsed = measure(TaskActions(session).create_tasks, tasks, batch_size)
+        report(f"tasks create_instances batch_size={batch_size}", rows, elapsed)
+
+        tasks = build_task_rows(rows, *task_ids)
+        load_report = copy_rows("tasks", tasks)
+        report("tasks COPY FROM STDIN", load_report.rows, load_report.elapsed)
+
+        tasks = build_task_rows(rows, *task_ids)
+        load_report = copy_rows("tasks", tasks, trace_memory=True)
+        logger.info(
+            f"[benchmark] tasks COPY FROM STDIN peak traced memory "
+            f"{load_report.peak_memory_mb:.1f} MB"
+        )
+    finally:
+        clear_database()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Batched INSERT ... RETURNING versus COPY FROM STDIN"
+    )
+    parser.add_argument("--rows", type=int, default=100_000)
+    parser.add_argument("--batch-size", type=int, default=1000)
+    arguments = parser.parse_args()
+    run(arguments.rows, arguments.batch_size)
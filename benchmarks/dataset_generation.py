@@ -0,0 +1,43 @@
+import argparse
+
+from benchmarks.utils import measure, report, truncate_database
+from tests.factories.generation import generate_dataset
+
+
+def run(users: int, tasks: int, processes: list[int], shard_size: int) -> None:
+    counts = {
+        "roles": 3,
+        "users": users,
+        "priorities": 3,
+        "statuses": 5,
+        "tasks": tasks,
+    }
+    for process_count in processes:
+        truncate_database()
+        try:
+            reports, elapsed = measure(
+                generate_dataset,
+                counts,
+                seed=0,
+                processes=process_count,
+                shard_size=shard_size,
+            )
+            report(
+                f"generate_dataset with {process_count} processes",
+                sum(load_report.rows for load_report in reports),
+                elapsed,
+            )
+        finally:
+            truncate_database()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Sharded, seeded dataset generation across a process pool"
+    )
+    parser.add_argument("--users", type=int, default=100_000)
+    parser.add_argument("--tasks", type=int, default=500_000)
+    parser.add_argument("--processes", type=int, nargs="+", default=[1, 2, 4])
+    parser.add_argument("--shard-size", type=int, default=50_000)
+    arguments = parser.parse_args()
+    run(arguments.users, arguments.tasks, arguments.processes, arguments.shard_size)
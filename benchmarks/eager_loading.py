@@ -0,0 +1,79 @@
+import argparse
+from typing import Any, Dict, List, Optional
+
+from benchmarks.utils import measure, truncate_database
+from src.db.db import session
+from src.db.instrumentation import QueryRecorder
+from src.logger.logger import logger
+from tests.actions.loading import LoadStrategy
+from tests.actions.tasks import TASK_RELATIONSHIPS, TaskActions
+from tests.factories.generation import generate_dataset
+
+
+def per_task_relationships(task_actions: TaskActions) -> List[Dict[str, Any]]:
+    tasks = task_actions.get_all_tasks()
+    for task in tasks:
+        for relationship_name in TASK_RELATIONSHIPS:
+            task[relationship_name] = task_actions.get_task_relationship(
+                "id", task["id"], relationship_name
+            )
+    return tasks
+
+
+def with_strategy(
+    task_actions: TaskActions, strategy: Optional[LoadStrategy]
+) -> List[Dict[str, Any]]:
+    strategies = (
+        {relationship_name: strategy for relationship_name in TASK_RELATIONSHIPS}
+        if strategy is not None
+        else None
+    )
+    return task_actions.get_tasks_with_relations(strategies=strategies)
+
+
+def run(users: int, tasks: int) -> None:
+    truncate_database()
+    try:
+        generate_dataset(
+            {
+                "roles": 10,
+                "users": users,
+                "priorities": 100,
+                "statuses": 100,
+                "tasks": tasks,
+            },
+            processes=1,
+        )
+        task_actions = TaskActions(session)
+        paths = {
+            "get_relationship per task": lambda: per_task_relationships(task_actions),
+            "lazyload": lambda: with_strategy(task_actions, LoadStrategy.LAZY),
+            "selectinload": lambda: with_strategy(task_actions, LoadStrategy.SELECTIN),
+            "joinedload (TaskActions default)": lambda: with_strategy(
+                task_actions, None
+            ),
+        }
+        for label, path in paths.items():
+            with QueryRecorder() as recorder:
+                _, elapsed = measure(path)
+            session.expunge_all()
+            logger.info(
+                "[benchmark] %s: %d tasks with relations in %.3fs, %d queries",
+                label,
+                tasks,
+                elapsed,
+                len(recorder),
+            )
+        session.commit()
+    finally:
+        truncate_database()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Reading tasks with priority, status, creator and assignee"
+    )
+    parser.add_argument("--users", type=int, default=1000)
+    parser.add_argument("--tasks", type=int, default=5000)
+    arguments = parser.parse_args()
+    run(arguments.users, arguments.tasks)
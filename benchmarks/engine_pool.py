@@ -0,0 +1,74 @@
+import argparse
+import os
+import subprocess
+import sys
+
+from sqlalchemy import create_engine, text
+from sqlalchemy.orm import sessionmaker
+
+from benchmarks.utils import measure, report
+from config import DB, settings
+from src.db.db import get_engine_options
+from src.logger.logger import logger
+
+POOL_CLASSES = ("QueuePool", "NullPool", "StaticPool")
+
+
+def run_test_body(engine) -> None:
+    with sessionmaker(bind=engine)() as test_session:
+        test_session.execute(text("SELECT 1"))
+        test_session.commit()
+        test_session.execute(text("SELECT count(*) FROM users"))
+        test_session.commit()
+
+
+def engine_per_test(tests: int) -> None:
+    for _ in range(tests):
+        engine = create_engine(settings.db.uri)
+        run_test_body(engine)
+        engine.dispose()
+
+
+def shared_engine(tests: int, pool_class: str) -> None:
+    db_settings = DB(pool_class=pool_class)
+    engine = create_engine(settings.db.uri, **get_engine_options(db_settings))
+    for _ in range(tests):
+        run_test_body(engine)
+    engine.dispose()
+
+
+def suite_walltime(pool_class: str) -> float:
+    environment = dict(os.environ, POSTGRES_POOL_CLASS=pool_class)
+    _, elapsed = measure(
+        subprocess.run,
+        [sys.executable, "-m", "pytest", "-q", "-p", "no:cacheprovider"],
+        env=environment,
+        check=True,
+        stdout=subprocess.DEVNULL,
+    )
+    return elapsed
+
+
+def run(tests: int, suite: bool) -> None:
+    _, elapsed = measure(engine_per_test, tests)
+    report("fixture lifecycle, engine per test", tests, elapsed)
+    for pool_class in POOL_CLASSES:
+        _, elapsed = measure(shared_engine, tests, pool_class)
+        report(f"fixture lifecycle, shared engine with {pool_class}", tests, elapsed)
+    if suite:
+        for pool_class in POOL_CLASSES:
+            logger.info(
+                "[benchmark] pytest suite with %s: %.3fs",
+                pool_class,
+                suite_walltime(pool_class),
+            )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Per-test engines versus a shared, pooled engine"
+    )
+    parser.add_argument("--tests", type=int, default=500)
+    parser.add_argument("--suite", action="store_true")
+    arguments = parser.parse_args()
+    run(arguments.tests, arguments.suite)
@@ -0,0 +1,86 @@
+import argparse
+from datetime import timedelta, timezone
+from typing import Any, Dict, List
+
+from benchmarks.utils import measure, truncate_database
+from src.db.db import session
+from src.db.instrumentation import QueryRecorder
+from src.logger.logger import logger
+from tests.actions.filters import FilterOperator, FilterSpec
+from tests.actions.tasks import TaskActions
+from tests.factories.generation import DATASET_EPOCH, generate_dataset
+
+ASSIGNEE_ID: int = 1
+STATUS_IDS: List[int] = [1, 2, 3]
+WINDOW_START = DATASET_EPOCH.replace(tzinfo=timezone.utc)
+WINDOW = (WINDOW_START, WINDOW_START + timedelta(days=60))
+
+
+def filter_in_python(task_actions: TaskActions, limit: int) -> List[Dict[str, Any]]:
+    tasks = task_actions.get_all_tasks_by_filter("assignee_id", ASSIGNEE_ID) or []
+    matching = [
+        task
+        for task in tasks
+        if task["deadline"] is not None
+        and WINDOW[0] <= task["deadline"] <= WINDOW[1]
+        and task["status_id"] in STATUS_IDS
+    ]
+    return sorted(matching, key=lambda task: task["deadline"])[:limit]
+
+
+def filter_in_sql(task_actions: TaskActions, limit: int) -> List[Dict[str, Any]]:
+    spec = (
+        FilterSpec()
+        .where("assignee_id", FilterOperator.EQ, ASSIGNEE_ID)
+        .where("deadline", FilterOperator.BETWEEN, WINDOW)
+        .where("status_id", FilterOperator.IN, STATUS_IDS)
+        .order("deadline")
+        .take(limit)
+    )
+    return task_actions.get_all_tasks_by_filter(spec) or []
+
+
+def run(users: int, tasks: int, limit: int, repeats: int) -> None:
+    truncate_database()
+    try:
+        generate_dataset(
+            {
+                "roles": 10,
+                "users": users,
+                "priorities": 10,
+                "statuses": 10,
+                "tasks": tasks,
+            },
+            processes=1,
+        )
+        task_actions = TaskActions(session)
+        for label, action in (
+            ("filter_by + Python filtering", filter_in_python),
+            ("FilterSpec", filter_in_sql),
+        ):
+            with QueryRecorder() as recorder:
+                matching, elapsed = measure(
+                    lambda: [action(task_actions, limit) for _ in range(repeats)]
+                )
+            logger.info(
+                "[benchmark] %s: %d tasks per call, %.2fms per call, %d queries",
+                label,
+                len(matching[0]),
+                elapsed / repeats * 1000,
+                len(recorder),
+            )
+        session.commit()
+    finally:
+        truncate_database()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Filtering tasks in Python versus one compiled filter statement"
+    )
+    parser.add_argument("--users", type=int, default=10)
+    parser.add_argument("--tasks", type=int, default=200_000)
+    parser.add_argument("--limit", type=int, default=20)
+    parser.add_argument("--repeats", type=int, default=20)
+    arguments = parser.parse_args()
+    run(arguments.users, arguments.tasks, arguments.limit, arguments.repeats)
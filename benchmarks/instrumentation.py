@@ -0,0 +1,61 @@
+import argparse
+import random
+from typing import List
+
+from benchmarks.utils import (create_reference_rows, iter_task_rows, measure,
+                              report, truncate_database)
+from src.db.db import engine, session
+from src.db.instrumentation import instrument, query_registry, uninstrument
+from src.db.loader import copy_rows
+from src.logger.logger import logger
+from tests.actions.tasks import TaskActions
+
+
+def lookup_tasks(task_actions: TaskActions, task_ids: List[int]) -> None:
+    for task_id in task_ids:
+        task_actions.get_task_by_id(task_id)
+
+
+def run(rows: int, lookups: int) -> None:
+    truncate_database()
+    try:
+        reference = create_reference_rows()
+        copy_rows(
+            "tasks",
+            iter_task_rows(
+                rows,
+                reference["user_id"],
+                reference["priority_id"],
+                reference["status_id"],
+            ),
+        )
+        task_actions = TaskActions(session)
+        tasks = task_actions.get_all_tasks_by_filter("creator_id", reference["user_id"])
+        task_ids = random.choices([task["id"] for task in tasks], k=lookups)
+        session.commit()
+
+        uninstrument(engine)
+        _, elapsed = measure(lookup_tasks, task_actions, task_ids)
+        report("filter_by without instrumentation", lookups, elapsed)
+
+        instrument(engine)
+        query_registry.reset()
+        _, elapsed = measure(lookup_tasks, task_actions, task_ids)
+        report("filter_by with instrumentation", lookups, elapsed)
+        logger.info(
+            "[benchmark] TaskActions.filter_by: %s",
+            query_registry.action_summary("TaskActions.filter_by"),
+        )
+        session.commit()
+    finally:
+        truncate_database()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Per-statement overhead of the cursor execute instrumentation"
+    )
+    parser.add_argument("--rows", type=int, default=10_000)
+    parser.add_argument("--lookups", type=int, default=5000)
+    arguments = parser.parse_args()
+    run(arguments.rows, arguments.lookups)
@@ -0,0 +1,78 @@
+import argparse
+from typing import Callable
+
+from sqlalchemy import Connection, delete, insert, text
+
+from benchmarks.utils import build_task_rows, build_user_rows, measure
+from src.db.db import engine
+from src.db.models import Base, Priority, Status, Task, User
+from src.logger.logger import logger
+
+
+def seed(connection: Connection, size: int) -> None:
+    user_id = connection.execute(
+        insert(User).returning(User.id), build_user_rows(1)
+    ).scalar_one()
+    priority_id = connection.execute(
+        insert(Priority)
+        .values(priority_name="High", creator_id=user_id)
+        .returning(Priority.id)
+    ).scalar_one()
+    status_id = connection.execute(
+        insert(Status)
+        .values(status_name="Pending", permissions="[]", creator_id=user_id)
+        .returning(Status.id)
+    ).scalar_one()
+    connection.execute(
+        insert(Task), build_task_rows(size, user_id, priority_id, status_id)
+    )
+
+
+def rollback_teardown(size: int) -> float:
+    with engine.connect() as connection:
+        transaction = connection.begin()
+        seed(connection, size)
+        _, elapsed = measure(transaction.rollback)
+    return elapsed
+
+
+def committed_teardown(size: int, clear: Callable[[Connection], None]) -> float:
+    with engine.connect() as connection:
+        with connection.begin():
+            seed(connection, size)
+        with connection.begin():
+            _, elapsed = measure(clear, connection)
+    return elapsed
+
+
+def truncate_all(connection: Connection) -> None:
+    table_names = ", ".join(table.name for table in Base.metadata.sorted_tables)
+    connection.execute(text(f"TRUNCATE TABLE {table_names} CASCADE"))
+
+
+def delete_all(connection: Connection) -> None:
+    for table in reversed(Base.metadata.sorted_tables):
+        connection.execute(delete(table))
+
+
+def run(sizes: list[int]) -> None:
+    with engine.begin() as connection:
+        truncate_all(connection)
+    for size in sizes:
+        logger.info(
+            "[benchmark] teardown after %d tasks: rollback %.4fs, "
+            "truncate %.4fs, delete_all %.4fs",
+            size,
+            rollback_teardown(size),
+            committed_teardown(size, truncate_all),
+            committed_teardown(size, delete_all),
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Per-test teardown cost of each test isolation mode"
+    )
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10, 1000, 100_000])
+    arguments = parser.parse_args()
+    run(arguments.sizes)
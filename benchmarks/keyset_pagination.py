@@ -0,0 +1,81 @@
+import argparse
+from typing import Optional
+
+from benchmarks.utils import measure, truncate_database
+from src.db.db import session
+from src.db.models import Task
+from src.logger.logger import logger
+from tests.actions.mappers import get_row_mapper
+from tests.actions.pagination import encode_cursor, get_order_columns
+from tests.actions.tasks import TASK_PAGE_ORDER, TaskActions
+from tests.factories.generation import generate_dataset
+
+
+def offset_page(page: int, limit: int) -> int:
+    mapper = get_row_mapper(Task)
+    columns = get_order_columns(mapper, TASK_PAGE_ORDER)
+    statement = (
+        mapper.statement.order_by(*columns).offset((page - 1) * limit).limit(limit)
+    )
+    return len(session.execute(statement).all())
+
+
+def cursor_before_page(page: int, limit: int) -> Optional[str]:
+    if page == 1:
+        return None
+    mapper = get_row_mapper(Task)
+    columns = get_order_columns(mapper, TASK_PAGE_ORDER)
+    row = session.execute(
+        mapper.statement.order_by(*columns).offset((page - 1) * limit - 1).limit(1)
+    ).one()
+    return encode_cursor(columns, mapper.to_dict(row))
+
+
+def keyset_page(task_actions: TaskActions, cursor: Optional[str], limit: int) -> int:
+    return len(task_actions.paginate_tasks(after=cursor, limit=limit).items)
+
+
+def run(tasks: int, limit: int, deep_page: int, repeats: int) -> None:
+    truncate_database()
+    try:
+        generate_dataset(
+            {
+                "roles": 10,
+                "users": 1000,
+                "priorities": 10,
+                "statuses": 10,
+                "tasks": tasks,
+            },
+            processes=1,
+        )
+        task_actions = TaskActions(session)
+        for page in (1, deep_page):
+            cursor = cursor_before_page(page, limit)
+            for label, action, args in (
+                ("OFFSET", offset_page, (page, limit)),
+                ("keyset", keyset_page, (task_actions, cursor, limit)),
+            ):
+                action(*args)
+                elapsed = min(measure(action, *args)[1] for _ in range(repeats))
+                logger.info(
+                    "[benchmark] %s page %d of %d tasks: %.2fms",
+                    label,
+                    page,
+                    limit,
+                    elapsed * 1000,
+                )
+        session.commit()
+    finally:
+        truncate_database()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Per-page latency of OFFSET versus keyset pagination over tasks"
+    )
+    parser.add_argument("--tasks", type=int, default=1_000_000)
+    parser.add_argument("--limit", type=int, default=100)
+    parser.add_argument("--deep-page", type=int, default=10_000)
+    parser.add_argument("--repeats", type=int, default=5)
+    arguments = parser.parse_args()
+    run(arguments.tasks, arguments.limit, arguments.deep_page, arguments.repeats)
@@ -0,0 +1,51 @@
+import argparse
+import uuid
+
+from factory import Sequence
+
+from benchmarks.utils import (clear_database, create_reference_rows, measure,
+                              report)
+from src.db.db import session
+from tests.factories.factories import UserFactory, fake
+from tests.factories.factory_utils import (PasswordHashMode,
+                                           get_precomputed_hashes,
+                                           hash_passwords)
+
+FULL_COST_MODES = (PasswordHashMode.BCRYPT, PasswordHashMode.PROCESS_POOL)
+
+
+def run(users: int, bcrypt_users: int) -> None:
+    get_precomputed_hashes()
+    for mode in PasswordHashMode:
+        count = bcrypt_users if mode in FULL_COST_MODES else users
+        passwords = [fake.password(length=16) for _ in range(count)]
+        _, elapsed = measure(hash_passwords, passwords, mode)
+        report(f"hash_passwords {mode.value}", count, elapsed)
+
+    clear_database()
+    try:
+        create_reference_rows()
+        for mode in PasswordHashMode:
+            count = bcrypt_users if mode in FULL_COST_MODES else users
+            run_token = uuid.uuid4().hex[:6]
+            _, elapsed = measure(
+                UserFactory.create_batch,
+                count,
+                password_hash_mode=mode,
+                username=Sequence(lambda index: f"u{run_token}{index}"),
+                email=Sequence(lambda index: f"u{run_token}{index}@example.com"),
+            )
+            report(f"UserFactory.create_batch {mode.value}", count, elapsed)
+            session.commit()
+    finally:
+        clear_database()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Users per second for each factory password hash mode"
+    )
+    parser.add_argument("--users", type=int, default=2000)
+    parser.add_argument("--bcrypt-users", type=int, default=50)
+    arguments = parser.parse_args()
+    run(arguments.users, arguments.bcrypt_users)
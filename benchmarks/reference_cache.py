@@ -0,0 +1,91 @@
+import argparse
+from typing import Any, Dict, List
+
+from benchmarks.utils import measure, truncate_database
+from src.db.db import session
+from src.db.instrumentation import QueryRecorder
+from src.db.models import Task
+from src.logger.logger import logger
+from tests.actions.mappers import get_row_mapper
+from tests.actions.priorities import PriorityActions
+from tests.actions.reference_cache import (invalidate_reference_caches,
+                                           reference_cache_stats)
+from tests.actions.statuses import StatusActions
+from tests.actions.tasks import TaskActions
+from tests.factories.generation import generate_dataset
+
+REFERENCE_RELATIONSHIPS: List[str] = ["priority", "status"]
+
+
+def joined_references(task_actions: TaskActions, tasks: List[Dict[str, Any]]) -> None:
+    mapper = get_row_mapper(Task)
+    for task in tasks:
+        for relationship_name in REFERENCE_RELATIONSHIPS:
+            task_actions.get_task_by_id(task["id"])
+            session.execute(
+                mapper.relationship_statement(relationship_name),
+                {"parent_id": task["id"]},
+            ).first()
+
+
+def cached_references(task_actions: TaskActions, tasks: List[Dict[str, Any]]) -> None:
+    for task in tasks:
+        for relationship_name in REFERENCE_RELATIONSHIPS:
+            task_actions.get_task_relationship("id", task["id"], relationship_name)
+
+
+def run(tasks: int, reads: int) -> None:
+    truncate_database()
+    try:
+        generate_dataset(
+            {
+                "roles": 10,
+                "users": 1000,
+                "priorities": 50,
+                "statuses": 50,
+                "tasks": tasks,
+            },
+            processes=1,
+        )
+        task_actions = TaskActions(session)
+        sample = task_actions.get_all_tasks()[:reads]
+
+        with QueryRecorder() as recorder:
+            _, elapsed = measure(joined_references, task_actions, sample)
+        logger.info(
+            "[benchmark] task row + join query: %d reads in %.3fs, %d queries",
+            len(sample) * len(REFERENCE_RELATIONSHIPS),
+            elapsed,
+            len(recorder),
+        )
+
+        invalidate_reference_caches()
+        _, warm_elapsed = measure(
+            lambda: (
+                PriorityActions(session).warm_priorities_cache(),
+                StatusActions(session).warm_statuses_cache(),
+            )
+        )
+        with QueryRecorder() as recorder:
+            _, elapsed = measure(cached_references, task_actions, sample)
+        logger.info(
+            "[benchmark] task row + reference cache: %d reads in %.3fs, %d queries (warm-up %.3fs)",
+            len(sample) * len(REFERENCE_RELATIONSHIPS),
+            elapsed,
+            len(recorder),
+            warm_elapsed,
+        )
+        logger.info("[benchmark] reference cache stats: %s", reference_cache_stats())
+        session.commit()
+    finally:
+        truncate_database()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Resolving task priorities and statuses with and without the reference cache"
+    )
+    parser.add_argument("--tasks", type=int, default=20_000)
+    parser.add_argument("--reads", type=int, default=5000)
+    arguments = parser.parse_args()
+    run(arguments.tasks, arguments.reads)
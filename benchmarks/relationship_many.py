@@ -0,0 +1,65 @@
+import argparse
+
+from benchmarks.utils import measure, truncate_database
+from src.db.db import session
+from src.db.instrumentation import QueryRecorder
+from src.logger.logger import logger
+from tests.actions.users import UserActions
+from tests.factories.generation import generate_dataset
+
+
+def run(users: int, tasks: int, chunk_size: int) -> None:
+    truncate_database()
+    try:
+        generate_dataset(
+            {
+                "roles": 10,
+                "users": users,
+                "priorities": 100,
+                "statuses": 100,
+                "tasks": tasks,
+            },
+            processes=1,
+        )
+        user_actions = UserActions(session)
+        user_ids = [user["id"] for user in user_actions.get_all_users()]
+
+        with QueryRecorder() as recorder:
+            _, elapsed = measure(
+                lambda: {
+                    user_id: user_actions.get_user_assigned_tasks("id", user_id)
+                    for user_id in user_ids
+                }
+            )
+        logger.info(
+            "[benchmark] get_relationship per user: %d users in %.3fs, %d queries",
+            users,
+            elapsed,
+            len(recorder),
+        )
+
+        with QueryRecorder() as recorder:
+            _, elapsed = measure(
+                user_actions.get_users_assigned_tasks, user_ids, chunk_size
+            )
+        logger.info(
+            "[benchmark] get_relationship_many (chunk_size=%d): %d users in %.3fs, %d queries",
+            chunk_size,
+            users,
+            elapsed,
+            len(recorder),
+        )
+        session.commit()
+    finally:
+        truncate_database()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Assigned tasks of many users: one query per user versus ANY(array) batches"
+    )
+    parser.add_argument("--users", type=int, default=10_000)
+    parser.add_argument("--tasks", type=int, default=50_000)
+    parser.add_argument("--chunk-size", type=int, default=1000)
+    arguments = parser.parse_args()
+    run(arguments.users, arguments.tasks, arguments.chunk_size)
@@ -0,0 +1,79 @@
+import argparse
+import random
+from typing import Any, Dict, List
+
+from benchmarks.utils import (clear_database, create_reference_rows,
+                              iter_task_rows, measure, report)
+from src.db.db import session
+from src.db.loader import copy_rows
+from src.db.models import Task
+from tests.actions.mappers import get_row_mapper
+
+
+def orm_to_dict(instance: Task) -> Dict[str, Any]:
+    return {
+        column.name: getattr(instance, column.name)
+        for column in instance.__table__.columns
+    }
+
+
+def orm_get_all() -> List[Dict[str, Any]]:
+    return [orm_to_dict(instance) for instance in session.query(Task).all()]
+
+
+def mapper_get_all() -> List[Dict[str, Any]]:
+    mapper = get_row_mapper(Task)
+    return mapper.to_dicts(session.execute(mapper.statement).all())
+
+
+def orm_filter_by(task_ids: List[int]) -> None:
+    for task_id in task_ids:
+        orm_to_dict(session.query(Task).filter_by(id=task_id).first())
+
+
+def mapper_filter_by(task_ids: List[int]) -> None:
+    mapper = get_row_mapper(Task)
+    for task_id in task_ids:
+        row = session.execute(mapper.statement.filter_by(id=task_id).limit(1)).first()
+        mapper.to_dict(row)
+
+
+def run(rows: int, lookups: int) -> None:
+    clear_database()
+    try:
+        reference = create_reference_rows()
+        copy_rows(
+            "tasks",
+            iter_task_rows(
+                rows,
+                reference["user_id"],
+                reference["priority_id"],
+                reference["status_id"],
+            ),
+        )
+
+        tasks, elapsed = measure(orm_get_all)
+        report("get_all ORM instances + column walk", len(tasks), elapsed)
+        session.expunge_all()
+        tasks, elapsed = measure(mapper_get_all)
+        report("get_all Core select + row mapper", len(tasks), elapsed)
+
+        task_ids = random.sample([task["id"] for task in tasks], min(lookups, rows))
+        _, elapsed = measure(orm_filter_by, task_ids)
+        report("filter_by ORM instance + column walk", len(task_ids), elapsed)
+        session.expunge_all()
+        _, elapsed = measure(mapper_filter_by, task_ids)
+        report("filter_by Core select + row mapper", len(task_ids), elapsed)
+        session.commit()
+    finally:
+        clear_database()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="ORM instance to dict conversion versus the cached row mapper"
+    )
+    parser.add_argument("--rows", type=int, default=100_000)
+    parser.add_argument("--lookups", type=int, default=5000)
+    arguments = parser.parse_args()
+    run(arguments.rows, arguments.lookups)
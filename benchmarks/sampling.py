@@ -0,0 +1,48 @@
+import argparse
+
+from benchmarks.utils import (clear_database, create_reference_rows,
+                              iter_task_rows, measure, report)
+from src.db.db import session
+from src.db.loader import copy_rows
+from src.db.models import Task
+from src.logger.logger import logger
+from tests.actions.sampling import SamplingStrategy, sample_row
+
+
+def run(sizes: list[int], samples: int) -> None:
+    clear_database()
+    try:
+        reference = create_reference_rows()
+        loaded = 0
+        for size in sorted(sizes):
+            copy_rows(
+                "tasks",
+                iter_task_rows(
+                    size - loaded,
+                    reference["user_id"],
+                    reference["priority_id"],
+                    reference["status_id"],
+                ),
+            )
+            loaded = size
+            session.connection().exec_driver_sql("ANALYZE tasks")
+            session.commit()
+            logger.info("[benchmark] sampling %d rows from %d tasks", samples, size)
+            for strategy in SamplingStrategy:
+                _, elapsed = measure(
+                    lambda: [
+                        sample_row(session, Task, strategy) for _ in range(samples)
+                    ]
+                )
+                report(f"{strategy.value} at {size} rows", samples, elapsed)
+                session.commit()
+    finally:
+        clear_database()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Random row sampling strategies")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10_000, 1_000_000])
+    parser.add_argument("--samples", type=int, default=200)
+    arguments = parser.parse_args()
+    run(arguments.sizes, arguments.samples)
@@ -0,0 +1,51 @@
+import argparse
+from dataclasses import replace
+
+from benchmarks.utils import measure
+from src.db.snapshots import SnapshotManager
+from src.logger.logger import logger
+from tests.factories.seeds import SEEDED_TASKS
+
+
+def run(users: int, tasks: int, clones: int) -> None:
+    snapshot_manager = SnapshotManager()
+    spec = replace(
+        SEEDED_TASKS, name="benchmark", params={"users": users, "tasks": tasks}
+    )
+    database_names = [f"benchmark_clone_{index}" for index in range(clones)]
+    snapshot_manager.drop_snapshots(spec)
+    try:
+        _, elapsed = measure(snapshot_manager.ensure_snapshot, spec)
+        logger.info(
+            "[benchmark] migrate + seed %d users, %d tasks: %.3fs",
+            users,
+            tasks,
+            elapsed,
+        )
+        _, elapsed = measure(snapshot_manager.ensure_snapshot, spec)
+        logger.info("[benchmark] up-to-date snapshot check: %.3fs", elapsed)
+        _, elapsed = measure(
+            lambda: [
+                snapshot_manager.clone(spec, database_name)
+                for database_name in database_names
+            ]
+        )
+        logger.info(
+            "[benchmark] CREATE DATABASE ... TEMPLATE: %.3fs per clone",
+            elapsed / clones,
+        )
+    finally:
+        for database_name in database_names:
+            snapshot_manager.drop(database_name)
+        snapshot_manager.drop_snapshots(spec)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Seeding a database from scratch versus cloning a template snapshot"
+    )
+    parser.add_argument("--users", type=int, default=1000)
+    parser.add_argument("--tasks", type=int, default=200_000)
+    parser.add_argument("--clones", type=int, default=5)
+    arguments = parser.parse_args()
+    run(arguments.users, arguments.tasks, arguments.clones)
@@ -0,0 +1,97 @@
+import argparse
+from typing import Any, Callable, List
+
+from sqlalchemy import lambda_stmt, select
+
+from benchmarks.utils import (build_task_rows, create_reference_rows, measure,
+                              truncate_database)
+from src.db.db import session
+from src.db.models import Task
+from src.logger.logger import logger
+from tests.actions.filters import compile_filter, to_filter_spec
+from tests.actions.mappers import get_row_mapper
+from tests.actions.tasks import TaskActions
+
+
+def query_field_value(task_id: int) -> Any:
+    instance = session.query(Task).filter_by(**{"id": task_id}).first()
+    return instance.title
+
+
+def lambda_field_value(task_id: int) -> Any:
+    statement = lambda_stmt(
+        lambda: select(Task.title).where(Task.id == task_id).limit(1)
+    )
+    return session.execute(statement).scalar()
+
+
+def build_query_statement(task_id: int) -> Any:
+    return (
+        session.query(Task)
+        .filter_by(**{"id": task_id})
+        .limit(1)
+        .statement._generate_cache_key()
+    )
+
+
+def build_lambda_statement(task_id: int) -> Any:
+    statement = lambda_stmt(
+        lambda: select(Task.title).where(Task.id == task_id).limit(1)
+    )
+    return statement._generate_cache_key()
+
+
+def build_registry_statement(task_id: int) -> Any:
+    return compile_filter(
+        get_row_mapper(Task), to_filter_spec("id", task_id).take(1), "title"
+    )
+
+
+def per_call(action: Callable[[int], Any], task_ids: List[int]) -> float:
+    _, elapsed = measure(lambda: [action(task_id) for task_id in task_ids])
+    return elapsed / len(task_ids) * 1_000_000
+
+
+def run(tasks: int, calls: int) -> None:
+    truncate_database()
+    try:
+        reference = create_reference_rows()
+        task_actions = TaskActions(session)
+        task_ids = task_actions.create_tasks(
+            build_task_rows(
+                tasks,
+                reference["user_id"],
+                reference["priority_id"],
+                reference["status_id"],
+            )
+        )
+        called_ids = [task_ids[index % len(task_ids)] for index in range(calls)]
+
+        for label, action in (
+            ("statement only: session.query + cache key", build_query_statement),
+            ("statement only: lambda_stmt + cache key", build_lambda_statement),
+            ("statement only: registry lookup", build_registry_statement),
+            ("get_field_value: session.query", query_field_value),
+            ("get_field_value: lambda_stmt", lambda_field_value),
+            (
+                "get_field_value: registry",
+                lambda task_id: task_actions.get_task_field("id", task_id, "title"),
+            ),
+        ):
+            action(called_ids[0])
+            logger.info(
+                "[benchmark] %s: %.1fus per call", label, per_call(action, called_ids)
+            )
+        session.commit()
+    finally:
+        truncate_database()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Per-call overhead of rebuilt versus registered statements"
+    )
+    parser.add_argument("--tasks", type=int, default=1000)
+    parser.add_argument("--calls", type=int, default=5000)
+    arguments = parser.parse_args()
+    run(arguments.tasks, arguments.calls)
@@ -0,0 +1,79 @@
+import argparse
+import tracemalloc
+from typing import Any, Callable, Tuple
+
+from benchmarks.utils import (clear_database, create_reference_rows,
+                              iter_task_rows, measure, report)
+from src.db.db import session
+from src.db.loader import copy_rows
+from src.logger.logger import logger
+from tests.actions.tasks import TaskActions
+
+
+def measure_peak_memory(action: Callable, *args, **kwargs) -> Tuple[Any, float]:
+    tracing = tracemalloc.is_tracing()
+    if not tracing:
+        tracemalloc.start()
+    tracemalloc.reset_peak()
+    started_memory = tracemalloc.get_traced_memory()[0]
+    try:
+        result = action(*args, **kwargs)
+        peak_memory = tracemalloc.get_traced_memory()[1]
+    finally:
+        if not tracing:
+            tracemalloc.stop()
+    return result, (peak_memory - started_memory) / 1024 / 1024
+
+
+def run(rows: int, chunk_size: int, max_growth_mb: float) -> None:
+    clear_database()
+    try:
+        reference = create_reference_rows()
+        copy_rows(
+            "tasks",
+            iter_task_rows(
+                rows,
+                reference["user_id"],
+                reference["priority_id"],
+                reference["status_id"],
+            ),
+        )
+        task_actions = TaskActions(session)
+
+        def scan_tasks() -> int:
+            return sum(1 for _ in task_actions.iter_all_tasks(chunk_size))
+
+        scanned, elapsed = measure(scan_tasks)
+        report(f"tasks iter_all chunk_size={chunk_size}", scanned, elapsed)
+        tasks, elapsed = measure(task_actions.get_all_tasks)
+        report("tasks get_all", len(tasks), elapsed)
+        del tasks
+
+        _, streaming_growth_mb = measure_peak_memory(scan_tasks)
+        logger.info(
+            f"[benchmark] iter_all peak traced memory growth {streaming_growth_mb:.1f} MB"
+        )
+        _, materialised_growth_mb = measure_peak_memory(
+            lambda: len(task_actions.get_all_tasks())
+        )
+        logger.info(
+            f"[benchmark] get_all peak traced memory growth {materialised_growth_mb:.1f} MB"
+        )
+
+        assert scanned == rows, f"Scanned {scanned} of {rows} rows"
+        assert (
+            streaming_growth_mb <= max_growth_mb
+        ), f"iter_all grew peak traced memory by {streaming_growth_mb:.1f} MB"
+    finally:
+        clear_database()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Server-side cursor streaming versus get_all materialisation"
+    )
+    parser.add_argument("--rows", type=int, default=500_000)
+    parser.add_argument("--chunk-size", type=int, default=1000)
+    parser.add_argument("--max-growth-mb", type=float, default=32.0)
+    arguments = parser.parse_args()
+    run(arguments.rows, arguments.chunk_size, arguments.max_growth_mb)
@@ -0,0 +1,68 @@
+import argparse
+from typing import Any, Dict, List
+
+from benchmarks.utils import (build_user_rows, create_reference_rows, measure,
+                              report, truncate_database)
+from src.db.db import session
+from src.db.instrumentation import QueryRecorder
+from src.logger.logger import logger
+from tests.actions.users import UserActions
+from tests.factories.factories import fake
+
+
+def build_import(
+    user_actions: UserActions, existing: int, new: int, role_id: int
+) -> List[Dict[str, Any]]:
+    existing_rows = build_user_rows(existing, role_id)
+    user_actions.create_users(existing_rows)
+    return [
+        row | {"full_name": fake.name()} for row in existing_rows
+    ] + build_user_rows(new, role_id)
+
+
+def import_row_by_row(user_actions: UserActions, rows: List[Dict[str, Any]]) -> None:
+    for row in rows:
+        user = user_actions.get_user_by_username(row["username"])
+        if user is None:
+            user_actions.create_user(row)
+        else:
+            user_actions.update_user_fields("id", user["id"], row)
+
+
+def run(existing: int, new: int, batch_size: int) -> None:
+    truncate_database()
+    try:
+        role_id = create_reference_rows()["role_id"]
+        user_actions = UserActions(session)
+
+        rows = build_import(user_actions, existing, new, role_id)
+        with QueryRecorder() as recorder:
+            _, elapsed = measure(import_row_by_row, user_actions, rows)
+        report(
+            f"filter_by + create/update ({len(recorder)} queries)", len(rows), elapsed
+        )
+
+        rows = build_import(user_actions, existing, new, role_id)
+        with QueryRecorder() as recorder:
+            upsert_report, elapsed = measure(
+                user_actions.upsert_users, rows, batch_size=batch_size
+            )
+        report(f"upsert_many ({len(recorder)} queries)", len(rows), elapsed)
+        logger.info(
+            "[benchmark] upsert_many: %d inserted, %d updated",
+            upsert_report.inserted,
+            upsert_report.updated,
+        )
+    finally:
+        truncate_database()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Re-importing users keyed on username row by row versus ON CONFLICT"
+    )
+    parser.add_argument("--existing", type=int, default=5000)
+    parser.add_argument("--new", type=int, default=5000)
+    parser.add_argument("--batch-size", type=int, default=1000)
+    arguments = parser.parse_args()
+    run(arguments.existing, arguments.new, arguments.batch_size)
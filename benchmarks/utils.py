@@ -0,0 +1,111 @@
+import time
+from typing import Any, Callable, Dict, Iterator, List, Tuple
+
+from sqlalchemy import text
+
+from src.db.db import engine, session
+from src.db.models import Base
+from src.logger.logger import logger
+from tests.actions.priorities import PriorityActions
+from tests.actions.roles import RoleActions
+from tests.actions.statuses import StatusActions
+from tests.actions.tasks import TaskActions
+from tests.actions.users import UserActions
+from tests.factories.factories import fake
+from tests.factories.factory_utils import (get_current_datetime,
+                                           get_updated_datetime, pwd_context)
+from tests.factories.value_pools import (emails, full_names, ipaddresses,
+                                         usernames)
+
+HASHED_PASSWORD: str = pwd_context.hash("benchmark-password")
+
+
+def measure(action: Callable, *args, **kwargs) -> Tuple[Any, float]:
+    started_at = time.perf_counter()
+    result = action(*args, **kwargs)
+    elapsed = time.perf_counter() - started_at
+    return result, elapsed
+
+
+def report(label: str, rows: int, elapsed: float) -> None:
+    rows_per_second = rows / elapsed if elapsed else float("inf")
+    logger.info(
+        f"[benchmark] {label}: {rows} rows in {elapsed:.3f}s "
+        f"({rows_per_second:.0f} rows/sec)"
+    )
+
+
+def iter_user_rows(count: int, role_id: int | None = None) -> Iterator[Dict[str, Any]]:
+    for _ in range(count):
+        yield {
+            "username": usernames(),
+            "full_name": full_names(),
+            "email": emails(),
+            "hashed_password": HASHED_PASSWORD,
+            "role_id": role_id,
+            "is_active": True,
+            "is_superuser": False,
+            "ipaddress": ipaddresses(),
+            "last_login_at": get_updated_datetime(days=1, hours=1, minutes=30),
+            "updated_at": get_updated_datetime(days=2, hours=3, minutes=10),
+            "registered_at": get_current_datetime(),
+        }
+
+
+def build_user_rows(count: int, role_id: int | None = None) -> List[Dict[str, Any]]:
+    return list(iter_user_rows(count, role_id))
+
+
+def iter_task_rows(
+    count: int, user_id: int, priority_id: int, status_id: int
+) -> Iterator[Dict[str, Any]]:
+    for index in range(count):
+        yield {
+            "title": f"Benchmark task {index}",
+            "description": fake.text(max_nb_chars=255),
+            "deadline": get_updated_datetime(days=1, hours=1, minutes=30),
+            "priority_id": priority_id,
+            "status_id": status_id,
+            "assignee_id": user_id,
+            "creator_id": user_id,
+            "created_at": get_current_datetime(),
+        }
+
+
+def build_task_rows(
+    count: int, user_id: int, priority_id: int, status_id: int
+) -> List[Dict[str, Any]]:
+    return list(iter_task_rows(count, user_id, priority_id, status_id))
+
+
+def create_reference_rows() -> Dict[str, int]:
+    role = RoleActions(session).create_role(
+        {"role_name": "Admin", "permissions": "[]", "creator_id": 0}
+    )
+    user_id = UserActions(session).create_users(build_user_rows(1, role["id"]))[0]
+    priority = PriorityActions(session).create_priority(
+        {"priority_name": "High", "creator_id": user_id}
+    )
+    status = StatusActions(session).create_status(
+        {"status_name": "Pending", "permissions": "[]", "creator_id": user_id}
+    )
+    return {
+        "role_id": role["id"],
+        "user_id": user_id,
+        "priority_id": priority["id"],
+        "status_id": status["id"],
+    }
+
+
+def clear_database() -> None:
+    TaskActions(session).delete_all_tasks()
+    UserActions(session).delete_all_users()
+    RoleActions(session).delete_all_roles()
+    PriorityActions(session).delete_all_priorities()
+    StatusActions(session).delete_all_statuses()
+
+
+def truncate_database() -> None:
+    table_names = ", ".join(table.name for table in Base.metadata.sorted_tables)
+    with engine.begin() as connection:
+        connection.execute(text(f"TRUNCATE TABLE {table_names} CASCADE"))
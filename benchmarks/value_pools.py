@@ -0,0 +1,68 @@
+import argparse
+from typing import Any, Dict, List
+
+from benchmarks.utils import measure, report
+from src.logger.logger import logger
+from tests.factories.factories import fake
+from tests.factories.value_pools import (emails, full_names, ipaddresses,
+                                         usernames)
+
+
+def faker_user_values(count: int) -> List[Dict[str, Any]]:
+    return [
+        {
+            "username": fake.user_name(),
+            "full_name": fake.name(),
+            "email": fake.email(),
+            "ipaddress": fake.ipv4(),
+        }
+        for _ in range(count)
+    ]
+
+
+def pooled_user_values(count: int) -> List[Dict[str, Any]]:
+    return [
+        {
+            "username": username,
+            "full_name": full_name,
+            "email": email,
+            "ipaddress": ipaddress,
+        }
+        for username, full_name, email, ipaddress in zip(
+            usernames.take(count),
+            full_names.take(count),
+            emails.take(count),
+            ipaddresses.take(count),
+        )
+    ]
+
+
+def log_duplicates(label: str, values: List[Dict[str, Any]]) -> None:
+    logger.info(
+        "[benchmark] %s: %d duplicate usernames, %d duplicate emails",
+        label,
+        len(values) - len({value["username"] for value in values}),
+        len(values) - len({value["email"] for value in values}),
+    )
+
+
+def run(users: int, faker_users: int) -> None:
+    values, elapsed = measure(faker_user_values, faker_users)
+    report("per-attribute Faker calls", len(values), elapsed)
+    log_duplicates("per-attribute Faker calls", values)
+
+    for pool in (usernames, emails, full_names, ipaddresses):
+        pool.fill()
+    values, elapsed = measure(pooled_user_values, users)
+    report("value pools", len(values), elapsed)
+    log_duplicates("value pools", values)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Generating unique user values with Faker versus value pools"
+    )
+    parser.add_argument("--users", type=int, default=1_000_000)
+    parser.add_argument("--faker-users", type=int, default=50_000)
+    arguments = parser.parse_args()
+    run(arguments.users, arguments.faker_users)
@@ -1,5 +1,6 @@
 from functools import cached_property
 from pathlib import Path
+from typing import Literal
 
 from pydantic import model_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
@@ -24,6 +25,13 @@ class DB(BaseSettings):
     host: str
     port: int
 
+    pool_class: Literal["QueuePool", "NullPool", "StaticPool"] = "QueuePool"
+    pool_size: int = 5
+    max_overflow: int = 10
+    pool_timeout: float = 30.0
+    pool_recycle: int = -1
+    pool_pre_ping: bool = False
+
     @cached_property
     def uri(self) -> str:
         user = self.username
@@ -33,6 +41,10 @@ class DB(BaseSettings):
         db = self.database
         return f"postgresql://{user}:{password}@{host}:{port}/{db}"
 
+    @cached_property
+    def async_uri(self) -> str:
+        return self.uri.replace("postgresql://", "postgresql+asyncpg://", 1)
+
     @model_validator(mode="after")
     def check_username_is_set(self) -> Self:
         if self.username is None and self.user is None:
@@ -70,4 +82,4 @@ class Settings(BaseSettings):
     root_path: str = str(Path(__file__).resolve().parent)
 
 
-settings: Settings = Settings()
\ No newline at end of file
+settings: Settings = Settings()
@@ -1,10 +1,60 @@
-from sqlalchemy import create_engine
+from typing import Any, Dict
+
+from sqlalchemy import Engine, NullPool, StaticPool, create_engine, event
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
 from sqlalchemy.orm import scoped_session, sessionmaker
 
-from config import settings
+from config import DB, settings
+from src.db.instrumentation import instrument
 
 database_url = settings.db.uri
+async_database_url = settings.db.async_uri
+
+pool_classes = {"NullPool": NullPool, "StaticPool": StaticPool}
+
+
+def get_engine_options(
+    db_settings: DB = settings.db, is_async: bool = False
+) -> Dict[str, Any]:
+    options: Dict[str, Any] = {
+        "pool_pre_ping": db_settings.pool_pre_ping,
+        "pool_recycle": db_settings.pool_recycle,
+    }
+    pool_class = db_settings.pool_class
+    if is_async and pool_class == "StaticPool":
+        # asyncpg connections are bound to the event loop that opened them
+        pool_class = "NullPool"
+    if pool_class == "QueuePool":
+        options.update(
+            pool_size=db_settings.pool_size,
+            max_overflow=db_settings.max_overflow,
+            pool_timeout=db_settings.pool_timeout,
+        )
+    else:
+        options["poolclass"] = pool_classes[pool_class]
+    return options
+
 
-engine = create_engine(database_url)
+def use_search_path(engine: Engine, search_path: str) -> None:
+    @event.listens_for(engine, "connect", insert=True)
+    def set_search_path(dbapi_connection, connection_record) -> None:
+        autocommit = dbapi_connection.autocommit
+        dbapi_connection.autocommit = True
+        cursor = dbapi_connection.cursor()
+        cursor.execute(f"SET SESSION search_path TO {search_path}")
+        cursor.close()
+        dbapi_connection.autocommit = autocommit
+
+    engine.dispose()
+
+
+engine = create_engine(database_url, **get_engine_options())
+instrument(engine)
 session_factory = sessionmaker(bind=engine)
 session = scoped_session(session_factory)
+
+async_engine = create_async_engine(
+    async_database_url, **get_engine_options(is_async=True)
+)
+instrument(async_engine.sync_engine)
+async_session_factory = async_sessionmaker(bind=async_engine, expire_on_commit=False)
@@ -0,0 +1,329 @@
+import json
+import math
+import re
+import threading
+import time
+import traceback
+from collections import Counter
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import (Any, AsyncGenerator, AsyncIterator, Callable, Coroutine,
+                    Dict, Generator, Iterator, List, Optional, Tuple)
+
+from sqlalchemy import Engine, event
+
+from src.logger.logger import logger
+
+UNTRACKED_ACTION: str = "untracked"
+PERCENTILES: Tuple[int, ...] = (50, 95, 99)
+N_PLUS_ONE_THRESHOLD: int = 3
+STACK_LIMIT: int = 12
+BIND_PARAMETER_PATTERN = re.compile(r"%\(\w+\)s|\$\d+|\?")
+BIND_PARAMETER_LIST_PATTERN = re.compile(r"\?(?:, \?)+")
+SAVEPOINT_PATTERN = re.compile(
+    r"^\s*(?:RELEASE |ROLLBACK TO )?SAVEPOINT\b", re.IGNORECASE
+)
+
+
+@dataclass
+class ActionCall:
+    name: str
+    shapes: Counter = field(default_factory=Counter)
+    batch: int = 0
+
+
+@dataclass
+class QueryRecord:
+    action: str
+    statement: str
+    stack: List[str]
+
+
+@dataclass
+class NPlusOneViolation:
+    call: ActionCall
+    shape: Tuple[int, str]
+    statement: str
+    stack: List[str]
+
+    @property
+    def count(self) -> int:
+        return self.call.shapes[self.shape]
+
+    def describe(self) -> str:
+        return (
+            f"{self.call.name} issued {self.count} statements of the same shape:\n"
+            f"{self.statement}\n" + "".join(self.stack)
+        )
+
+
+current_action: ContextVar[Optional[ActionCall]] = ContextVar(
+    "current_action", default=None
+)
+query_recorders: ContextVar[Tuple["QueryRecorder", ...]] = ContextVar(
+    "query_recorders", default=()
+)
+n_plus_one_detectors: ContextVar[Tuple["NPlusOneDetector", ...]] = ContextVar(
+    "n_plus_one_detectors", default=()
+)
+
+
+def statement_shape(statement: str) -> str:
+    shape = BIND_PARAMETER_PATTERN.sub("?", " ".join(statement.split()))
+    return BIND_PARAMETER_LIST_PATTERN.sub("?", shape)
+
+
+def get_call_stack() -> List[str]:
+    frames = [
+        frame
+        for frame in traceback.extract_stack()
+        if "site-packages" not in frame.filename
+        and not frame.filename.startswith("<")
+        and frame.filename != __file__
+    ]
+    return traceback.format_list(frames[-STACK_LIMIT:])
+
+
+def percentile(sorted_values: List[float], rank: int) -> float:
+    if not sorted_values:
+        return 0.0
+    index = max(math.ceil(rank / 100 * len(sorted_values)) - 1, 0)
+    return sorted_values[index]
+
+
+@dataclass
+class StatementStats:
+    action: str
+    statement: str
+    latencies: List[float] = field(default_factory=list)
+    rows: int = 0
+
+    def record(self, latency: float, rowcount: int) -> None:
+        self.latencies.append(latency)
+        if rowcount > 0:
+            self.rows += rowcount
+
+    def summary(self) -> Dict[str, Any]:
+        return summarize(self.latencies, self.rows) | {
+            "action": self.action,
+            "statement": self.statement,
+        }
+
+
+def summarize(latencies: List[float], rows: int) -> Dict[str, Any]:
+    sorted_latencies = sorted(latencies)
+    summary = {
+        "count": len(sorted_latencies),
+        "rows": rows,
+        "total_ms": round(sum(sorted_latencies) * 1000, 3),
+    }
+    for rank in PERCENTILES:
+        summary[f"p{rank}_ms"] = round(percentile(sorted_latencies, rank) * 1000, 3)
+    return summary
+
+
+class QueryRegistry:
+    def __init__(self) -> None:
+        self.stats: Dict[Tuple[str, str], StatementStats] = {}
+        self.lock = threading.Lock()
+
+    def record(
+        self, action: str, statement: str, latency: float, rowcount: int
+    ) -> None:
+        key = (action, statement)
+        with self.lock:
+            stats = self.stats.get(key)
+            if stats is None:
+                stats = self.stats[key] = StatementStats(action, statement)
+            stats.record(latency, rowcount)
+
+    def reset(self) -> None:
+        with self.lock:
+            self.stats.clear()
+
+    def statement_summaries(self) -> List[Dict[str, Any]]:
+        with self.lock:
+            summaries = [stats.summary() for stats in self.stats.values()]
+        return sorted(summaries, key=lambda summary: -summary["total_ms"])
+
+    def action_summaries(self) -> Dict[str, Dict[str, Any]]:
+        latencies: Dict[str, List[float]] = {}
+        rows: Dict[str, int] = {}
+        with self.lock:
+            for stats in self.stats.values():
+                latencies.setdefault(stats.action, []).extend(stats.latencies)
+                rows[stats.action] = rows.get(stats.action, 0) + stats.rows
+        return {
+            action: summarize(action_latencies, rows[action])
+            for action, action_latencies in latencies.items()
+        }
+
+    def action_summary(self, action: str) -> Dict[str, Any]:
+        return self.action_summaries().get(action, summarize([], 0))
+
+    def dump(self, path: str) -> None:
+        report = {
+            "actions": self.action_summaries(),
+            "statements": self.statement_summaries(),
+        }
+        Path(path).write_text(json.dumps(report, indent=2), encoding="utf-8")
+        logger.info(
+            f"Dumped SQL statement stats for {len(report['actions'])} actions to {path}"
+        )
+
+
+query_registry = QueryRegistry()
+
+
+class QueryRecorder:
+    def __init__(self) -> None:
+        self.queries: List[QueryRecord] = []
+
+    def __enter__(self) -> "QueryRecorder":
+        self.token = query_recorders.set(query_recorders.get() + (self,))
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        query_recorders.reset(self.token)
+
+    def __len__(self) -> int:
+        return len(self.queries)
+
+    def describe(self) -> str:
+        return "\n".join(
+            f"{index}. [{query.action}] {query.statement}\n" + "".join(query.stack)
+            for index, query in enumerate(self.queries, start=1)
+        )
+
+
+class NPlusOneDetector:
+    def __init__(self, threshold: int = N_PLUS_ONE_THRESHOLD) -> None:
+        self.threshold = threshold
+        self.violations: List[NPlusOneViolation] = []
+
+    def __enter__(self) -> "NPlusOneDetector":
+        self.token = n_plus_one_detectors.set(n_plus_one_detectors.get() + (self,))
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        n_plus_one_detectors.reset(self.token)
+
+    def check(self, call: ActionCall, shape: Tuple[int, str], statement: str) -> None:
+        if call.shapes[shape] == self.threshold + 1:
+            self.violations.append(
+                NPlusOneViolation(call, shape, statement, get_call_stack())
+            )
+
+    def describe(self) -> str:
+        return "\n".join(violation.describe() for violation in self.violations)
+
+
+def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    conn.info.setdefault("query_started_at", []).append((context, time.perf_counter()))
+
+
+def after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+    latency = time.perf_counter() - conn.info["query_started_at"].pop()[1]
+    call = current_action.get()
+    action_name = call.name if call is not None else UNTRACKED_ACTION
+    query_registry.record(action_name, statement, latency, cursor.rowcount)
+    if SAVEPOINT_PATTERN.match(statement):
+        return
+    recorders = query_recorders.get()
+    if recorders:
+        record = QueryRecord(action_name, statement, get_call_stack())
+        for recorder in recorders:
+            recorder.queries.append(record)
+    if call is not None:
+        shape = (call.batch, statement_shape(statement))
+        call.shapes[shape] += 1
+        for detector in n_plus_one_detectors.get():
+            detector.check(call, shape, statement)
+
+
+def handle_error(exception_context) -> None:
+    connection = exception_context.connection
+    started_at = (
+        connection.info.get("query_started_at") if connection is not None else None
+    )
+    if started_at and started_at[-1][0] is exception_context.execution_context:
+        started_at.pop()
+
+
+def instrument(engine: Engine) -> None:
+    if not event.contains(engine, "before_cursor_execute", before_cursor_execute):
+        event.listen(engine, "before_cursor_execute", before_cursor_execute)
+        event.listen(engine, "after_cursor_execute", after_cursor_execute)
+        event.listen(engine, "handle_error", handle_error)
+
+
+def uninstrument(engine: Engine) -> None:
+    if event.contains(engine, "before_cursor_execute", before_cursor_execute):
+        event.remove(engine, "before_cursor_execute", before_cursor_execute)
+        event.remove(engine, "after_cursor_execute", after_cursor_execute)
+        event.remove(engine, "handle_error", handle_error)
+
+
+def start_batch() -> None:
+    call = current_action.get()
+    if call is not None:
+        call.batch += 1
+
+
+def _track_iterator(call: ActionCall, iterator: Generator) -> Iterator:
+    try:
+        while True:
+            token = current_action.set(call)
+            try:
+                item = next(iterator)
+            except StopIteration:
+                return
+            finally:
+                current_action.reset(token)
+            yield item
+    finally:
+        iterator.close()
+
+
+async def _track_async_iterator(
+    call: ActionCall, iterator: AsyncGenerator
+) -> AsyncIterator:
+    try:
+        while True:
+            token = current_action.set(call)
+            try:
+                item = await iterator.__anext__()
+            except StopAsyncIteration:
+                return
+            finally:
+                current_action.reset(token)
+            yield item
+    finally:
+        await iterator.aclose()
+
+
+async def _track_coroutine(call: ActionCall, coroutine: Coroutine) -> Any:
+    token = current_action.set(call)
+    try:
+        return await coroutine
+    finally:
+        current_action.reset(token)
+
+
+def track_action(action_name: str, action: Callable, *args, **kwargs) -> Any:
+    if current_action.get() is not None:
+        return action(*args, **kwargs)
+    call = ActionCall(action_name)
+    token = current_action.set(call)
+    try:
+        result = action(*args, **kwargs)
+    finally:
+        current_action.reset(token)
+    if isinstance(result, Coroutine):
+        return _track_coroutine(call, result)
+    if isinstance(result, Generator):
+        return _track_iterator(call, result)
+    if isinstance(result, AsyncGenerator):
+        return _track_async_iterator(call, result)
+    return result
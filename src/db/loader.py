@@ -0,0 +1,236 @@
+import io
+import json
+import time
+import tracemalloc
+from contextlib import closing
+from dataclasses import dataclass
+from datetime import date, datetime
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Mapping, Optional
+
+from psycopg2 import Error as DBAPIError
+from psycopg2 import sql
+from sqlalchemy import JSON, Column, Engine, Table
+from sqlalchemy.sql.schema import ScalarElementColumnDefault
+
+from src.db.db import engine as default_engine
+from src.db.models import Base
+from src.logger.logger import logger
+
+DEFAULT_BUFFER_SIZE: int = 1024 * 1024
+NULL: str = "\\N"
+
+RowSource = Iterable[Any] | str | Path
+
+
+@dataclass
+class LoadReport:
+    table_name: str
+    rows: int
+    elapsed: float
+    peak_memory_mb: Optional[float] = None
+
+    @property
+    def rows_per_second(self) -> float:
+        return self.rows / self.elapsed if self.elapsed else float("inf")
+
+
+def get_table(table_name: str) -> Table:
+    table = Base.metadata.tables.get(table_name)
+    if table is None:
+        error_message = f"Table {table_name} is not defined in Base.metadata"
+        logger.error(error_message)
+        raise ValueError(error_message)
+    return table
+
+
+def get_copy_columns(
+    table: Table, column_names: Optional[List[str]] = None
+) -> List[Column]:
+    if column_names is not None:
+        return [table.columns[column_name] for column_name in column_names]
+    return [
+        column for column in table.columns if column is not table.autoincrement_column
+    ]
+
+
+def sort_table_names(table_names: Iterable[str]) -> List[str]:
+    requested = set(table_names)
+    for table_name in requested:
+        get_table(table_name)
+    return [
+        table.name for table in Base.metadata.sorted_tables if table.name in requested
+    ]
+
+
+def format_value(value: Any) -> str:
+    if value is None:
+        return NULL
+    if isinstance(value, bool):
+        return "t" if value else "f"
+    if isinstance(value, (datetime, date)):
+        value = value.isoformat()
+    return (
+        str(value)
+        .replace("\\", "\\\\")
+        .replace("\t", "\\t")
+        .replace("\n", "\\n")
+        .replace("\r", "\\r")
+    )
+
+
+class RowStream(io.TextIOBase):
+    def __init__(
+        self,
+        rows: Iterable[Any],
+        columns: List[Column],
+        buffer_size: int = DEFAULT_BUFFER_SIZE,
+    ) -> None:
+        super().__init__()
+        self.rows: Iterator[Any] = iter(rows)
+        self.columns = columns
+        self.buffer_size = buffer_size
+        self.buffer: str = ""
+        self.defaults: Dict[str, Any] = {
+            column.name: column.default.arg
+            for column in columns
+            if isinstance(column.default, ScalarElementColumnDefault)
+        }
+        self.json_columns: List[bool] = [
+            isinstance(column.type, JSON) for column in columns
+        ]
+
+    def readable(self) -> bool:
+        return True
+
+    def read(self, size: Optional[int] = -1) -> str:
+        if size is None or size < 0:
+            size = self.buffer_size
+        lines = [self.buffer]
+        buffered = len(self.buffer)
+        while buffered < size:
+            row = next(self.rows, None)
+            if row is None:
+                break
+            line = self.format_row(row)
+            lines.append(line)
+            buffered += len(line)
+        data = "".join(lines)
+        self.buffer = data[size:]
+        return data[:size]
+
+    def format_row(self, row: Any) -> str:
+        if not isinstance(row, Mapping):
+            row = vars(row)
+        values = [
+            row.get(column.name, self.defaults.get(column.name))
+            for column in self.columns
+        ]
+        fields = [
+            format_value(json.dumps(value) if is_json and value is not None else value)
+            for value, is_json in zip(values, self.json_columns)
+        ]
+        return "\t".join(fields) + "\n"
+
+
+def _copy(
+    table: Table,
+    columns: List[Column],
+    copy_options: str,
+    stream: io.TextIOBase,
+    buffer_size: int,
+    engine: Engine,
+    trace_memory: bool,
+) -> LoadReport:
+    statement = sql.SQL("COPY {table} ({columns}) FROM STDIN WITH ({options})").format(
+        table=sql.Identifier(table.name),
+        columns=sql.SQL(", ").join(sql.Identifier(column.name) for column in columns),
+        options=sql.SQL(copy_options),
+    )
+    connection = engine.raw_connection()
+    tracing = tracemalloc.is_tracing()
+    if trace_memory:
+        if not tracing:
+            tracemalloc.start()
+        tracemalloc.reset_peak()
+        started_memory = tracemalloc.get_traced_memory()[0]
+    started_at = time.perf_counter()
+    try:
+        with closing(connection.cursor()) as cursor:
+            cursor.copy_expert(statement, stream, size=buffer_size)
+            rows = cursor.rowcount
+        connection.commit()
+    except DBAPIError as e:
+        connection.rollback()
+        error_message = f"Failed to copy rows into {table.name} table: {str(e)}"
+        logger.error(error_message)
+        raise ValueError(error_message)
+    finally:
+        connection.close()
+        if trace_memory:
+            peak_memory = tracemalloc.get_traced_memory()[1] - started_memory
+            if not tracing:
+                tracemalloc.stop()
+    elapsed = time.perf_counter() - started_at
+    report = LoadReport(table.name, rows, elapsed)
+    if trace_memory:
+        report.peak_memory_mb = peak_memory / (1024 * 1024)
+    logger.info(
+        f"Copied {report.rows} rows into {report.table_name} table in "
+        f"{report.elapsed:.3f}s ({report.rows_per_second:.0f} rows/sec)"
+    )
+    return report
+
+
+def copy_rows(
+    table_name: str,
+    rows: Iterable[Any],
+    column_names: Optional[List[str]] = None,
+    buffer_size: int = DEFAULT_BUFFER_SIZE,
+    engine: Engine = default_engine,
+    trace_memory: bool = False,
+) -> LoadReport:
+    table = get_table(table_name)
+    columns = get_copy_columns(table, column_names)
+    stream = RowStream(rows, columns, buffer_size)
+    return _copy(
+        table, columns, "FORMAT text", stream, buffer_size, engine, trace_memory
+    )
+
+
+def copy_csv(
+    table_name: str,
+    path: str | Path,
+    column_names: Optional[List[str]] = None,
+    header: bool = True,
+    buffer_size: int = DEFAULT_BUFFER_SIZE,
+    engine: Engine = default_engine,
+    trace_memory: bool = False,
+) -> LoadReport:
+    table = get_table(table_name)
+    columns = get_copy_columns(table, column_names)
+    copy_options = f"FORMAT csv, HEADER {'true' if header else 'false'}"
+    with open(path, encoding="utf-8", newline="") as csv_file:
+        return _copy(
+            table, columns, copy_options, csv_file, buffer_size, engine, trace_memory
+        )
+
+
+def copy_tables(
+    sources: Mapping[str, RowSource],
+    buffer_size: int = DEFAULT_BUFFER_SIZE,
+    engine: Engine = default_engine,
+) -> List[LoadReport]:
+    reports = []
+    for table_name in sort_table_names(sources):
+        source = sources[table_name]
+        if isinstance(source, (str, Path)):
+            report = copy_csv(
+                table_name, source, buffer_size=buffer_size, engine=engine
+            )
+        else:
+            report = copy_rows(
+                table_name, source, buffer_size=buffer_size, engine=engine
+            )
+        reports.append(report)
+    return reports
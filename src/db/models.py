@@ -1,7 +1,7 @@
 from datetime import datetime
 
-from sqlalchemy import (JSON, Boolean, Column, DateTime, ForeignKey, Integer,
-                        String)
+from sqlalchemy import (JSON, Boolean, Column, DateTime, ForeignKey, Index,
+                        Integer, String)
 from sqlalchemy.orm import declarative_base, relationship
 
 Base = declarative_base()
@@ -83,7 +83,11 @@ class Task(Base):
     assignee_id = Column(
         Integer, ForeignKey("users.id", ondelete="CASCADE"), nullable=True
     )
-    created_at = Column(DateTime(timezone=True), default=datetime.now())
+    created_at = Column(
+        DateTime(timezone=True),
+        default=datetime.now(),
+        nullable=False,
+    )
 
     priority = relationship("Priority", back_populates="tasks")
     status = relationship("Status", back_populates="tasks")
@@ -92,4 +96,6 @@ class Task(Base):
     )
     assignee = relationship(
         "User", back_populates="assigned_tasks", foreign_keys="Task.assignee_id"
-    )
\ No newline at end of file
+    )
+
+    __table_args__ = (Index("ix_tasks_created_at_id", "created_at", "id"),)
@@ -0,0 +1,196 @@
+import hashlib
+import importlib
+import inspect
+import json
+import os
+import subprocess
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from sqlalchemy import (Connection, Engine, NullPool, create_engine, func,
+                        select, text)
+from sqlalchemy.exc import SQLAlchemyError
+
+from config import settings
+from src.db.db import engine as default_engine
+from src.logger.logger import logger
+
+MIGRATIONS_PATH: Path = Path(settings.root_path) / "alembic" / "versions"
+SNAPSHOT_PREFIX: str = "snapshot"
+
+
+@dataclass(frozen=True)
+class SeedSpec:
+    name: str
+    seed: Callable[..., None]
+    params: Dict[str, Any] = field(default_factory=dict)
+    version: int = 1
+    modules: Tuple[str, ...] = ()
+
+
+def get_seed_sources(spec: SeedSpec) -> List[str]:
+    names = (spec.seed.__module__,) + spec.modules
+    return [inspect.getsource(importlib.import_module(name)) for name in names]
+
+
+def get_schema_revision(migrations_path: Path = MIGRATIONS_PATH) -> str:
+    digest = hashlib.sha256()
+    for migration in sorted(migrations_path.glob("*.py")):
+        digest.update(migration.name.encode())
+        digest.update(migration.read_bytes())
+    return digest.hexdigest()
+
+
+def migrate(database_name: str) -> None:
+    environment = dict(os.environ, POSTGRES_DATABASE=database_name)
+    result = subprocess.run(
+        ["alembic", "upgrade", "head"],
+        cwd=settings.root_path,
+        env=environment,
+        capture_output=True,
+        text=True,
+    )
+    if result.returncode != 0:
+        error_message = f"Failed to migrate {database_name} database: {result.stderr}"
+        logger.error(error_message)
+        raise ValueError(error_message)
+
+
+class SnapshotManager:
+    def __init__(self, engine: Engine = default_engine) -> None:
+        self.engine = engine
+
+    def snapshot_key(self, spec: SeedSpec) -> str:
+        digest = hashlib.sha256()
+        digest.update(get_schema_revision().encode())
+        digest.update(spec.name.encode())
+        digest.update(json.dumps(spec.params, sort_keys=True, default=str).encode())
+        digest.update(str(spec.version).encode())
+        for source in get_seed_sources(spec):
+            digest.update(source.encode())
+        return digest.hexdigest()[:16]
+
+    def snapshot_name(self, spec: SeedSpec) -> str:
+        return f"{SNAPSHOT_PREFIX}_{spec.name}_{self.snapshot_key(spec)}"
+
+    def database_url(self, database_name: str) -> str:
+        return self.engine.url.set(database=database_name).render_as_string(
+            hide_password=False
+        )
+
+    def ensure_snapshot(self, spec: SeedSpec) -> str:
+        snapshot_name = self.snapshot_name(spec)
+        with self._admin_connection() as connection:
+            connection.execute(select(func.pg_advisory_lock(func.hashtext(spec.name))))
+            try:
+                if snapshot_name not in self._databases(connection):
+                    self._drop_snapshots(connection, spec, keep=snapshot_name)
+                    self._build_snapshot(connection, spec, snapshot_name)
+            finally:
+                connection.execute(
+                    select(func.pg_advisory_unlock(func.hashtext(spec.name)))
+                )
+        return snapshot_name
+
+    def clone(self, spec: SeedSpec, database_name: str) -> str:
+        snapshot_name = self.ensure_snapshot(spec)
+        started_at = time.perf_counter()
+        try:
+            with self._admin_connection() as connection:
+                self._drop_database(connection, database_name)
+                connection.execute(
+                    text(
+                        f'CREATE DATABASE "{database_name}" TEMPLATE "{snapshot_name}"'
+                    )
+                )
+        except SQLAlchemyError as e:
+            error_message = f"Failed to clone snapshot {snapshot_name} into {database_name}: {str(e)}"
+            logger.error(error_message)
+            raise ValueError(error_message)
+        logger.info(
+            f"Cloned snapshot {snapshot_name} into {database_name} "
+            f"in {time.perf_counter() - started_at:.3f}s"
+        )
+        return self.database_url(database_name)
+
+    def drop(self, database_name: str) -> None:
+        with self._admin_connection() as connection:
+            self._drop_database(connection, database_name)
+
+    def drop_snapshots(self, spec: SeedSpec) -> None:
+        with self._admin_connection() as connection:
+            self._drop_snapshots(connection, spec)
+
+    def _admin_connection(self) -> Connection:
+        return self.engine.connect().execution_options(isolation_level="AUTOCOMMIT")
+
+    def _databases(self, connection: Connection) -> List[str]:
+        return list(
+            connection.execute(text("SELECT datname FROM pg_database")).scalars()
+        )
+
+    def _drop_database(self, connection: Connection, database_name: str) -> None:
+        connection.execute(
+            text(f'DROP DATABASE IF EXISTS "{database_name}" WITH (FORCE)')
+        )
+
+    def _drop_snapshots(
+        self, connection: Connection, spec: SeedSpec, keep: Optional[str] = None
+    ) -> None:
+        prefix = f"{SNAPSHOT_PREFIX}_{spec.name}_"
+        for database_name in self._databases(connection):
+            if database_name.startswith(prefix) and database_name != keep:
+                connection.execute(
+                    text(f'ALTER DATABASE "{database_name}" WITH IS_TEMPLATE false')
+                )
+                self._drop_database(connection, database_name)
+                logger.info(f"Dropped snapshot {database_name}")
+
+    def _build_snapshot(
+        self, connection: Connection, spec: SeedSpec, snapshot_name: str
+    ) -> None:
+        building_name = f"{snapshot_name}_building"
+        started_at = time.perf_counter()
+        try:
+            self._drop_database(connection, building_name)
+            connection.execute(
+                text(f'CREATE DATABASE "{building_name}" TEMPLATE template0')
+            )
+            migrate(building_name)
+            snapshot_engine = create_engine(
+                self.database_url(building_name), poolclass=NullPool
+            )
+            try:
+                spec.seed(snapshot_engine, **spec.params)
+            finally:
+                snapshot_engine.dispose()
+            connection.execute(
+                text(f'ALTER DATABASE "{building_name}" RENAME TO "{snapshot_name}"')
+            )
+            connection.execute(
+                text(f'ALTER DATABASE "{snapshot_name}" WITH IS_TEMPLATE true')
+            )
+        except SQLAlchemyError as e:
+            self._drop_partial_snapshot(connection, building_name, snapshot_name)
+            error_message = f"Failed to build snapshot {snapshot_name}: {str(e)}"
+            logger.error(error_message)
+            raise ValueError(error_message)
+        except Exception:
+            self._drop_partial_snapshot(connection, building_name, snapshot_name)
+            raise
+        logger.info(
+            f"Built snapshot {snapshot_name} in {time.perf_counter() - started_at:.3f}s"
+        )
+
+    def _drop_partial_snapshot(
+        self, connection: Connection, building_name: str, snapshot_name: str
+    ) -> None:
+        for database_name in (building_name, snapshot_name):
+            try:
+                self._drop_database(connection, database_name)
+            except SQLAlchemyError as e:
+                logger.error(
+                    f"Failed to drop partially built {database_name} database: {str(e)}"
+                )
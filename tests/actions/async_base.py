@@ -0,0 +1,869 @@
+import asyncio
+import time
+from typing import (Any, AsyncIterator, Dict, Iterable, List, Optional, Tuple,
+                    Type, Union)
+
+from sqlalchemy import (Executable, Result, Row, Select, delete, func, insert,
+                        select, update)
+from sqlalchemy.exc import IntegrityError, NoResultFound, SQLAlchemyError
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import RelationshipProperty
+
+from src.db.instrumentation import start_batch
+from src.db.models import Base
+from src.logger.logger import logger
+from tests.actions.base import (DELETE_WHERE_WARNING_ROWS, DeleteReport,
+                                UpsertReport, batched, check_field_names,
+                                check_filters, check_session, deduplicate_rows,
+                                get_upsert_columns, group_row_positions,
+                                group_update_rows, order_upserted_ids)
+from tests.actions.filters import FilterSpec, compile_filter, to_filter_spec
+from tests.actions.loading import (LoadStrategy, build_loader_options,
+                                   get_relationships, to_related_dict)
+from tests.actions.mappers import get_row_mapper
+from tests.actions.pagination import (DEFAULT_PAGE_SIZE, Page, decode_cursor,
+                                      encode_cursor, get_order_columns,
+                                      keyset_statement)
+from tests.actions.reference_cache import (fill_reference_cache,
+                                           get_reference_cache,
+                                           has_pending_writes,
+                                           reference_key_column)
+from tests.actions.sampling import SamplingStrategy, sample_row
+from tests.actions.statements import get_statement_registry
+
+
+class AsyncBaseActions:
+    sampling_strategy: SamplingStrategy = SamplingStrategy.ID_RANGE
+    load_strategies: Dict[str, LoadStrategy] = {}
+
+    def __init__(self, model: Type[Base], session: AsyncSession) -> None:
+        self.model = model
+        self.session = session
+        self.mapper = get_row_mapper(model)
+        self.statements = get_statement_registry(model)
+
+    @check_session
+    async def create_table(self) -> str:
+        try:
+            connection = await self.session.connection()
+            await connection.run_sync(self.model.__table__.create)
+            await self.session.commit()
+            message = f"Table for {self.model.__name__} model created successfully"
+            logger.info(message)
+            return message
+        except SQLAlchemyError as error:
+            await self.session.rollback()
+            error_message = f"Failed to create the table for {self.model.__name__} model: {str(error)}"
+            logger.error(error_message)
+            raise ValueError(error_message)
+
+    @check_session
+    async def drop_table(self) -> str:
+        try:
+            connection = await self.session.connection()
+            await connection.run_sync(self.model.__table__.drop)
+            await self.session.commit()
+            message = f"Table for {self.model.__name__} model dropped successfully"
+            logger.info(message)
+            return message
+        except SQLAlchemyError as error:
+            await self.session.rollback()
+            error_message = f"Failed to drop the table for {self.model.__name__} model: {str(error)}"
+            logger.error(error_message)
+            raise ValueError(error_message)
+
+    @check_session
+    async def create_instance(self, instance_data: Dict[str, Any]) -> Dict[str, Any]:
+        try:
+            instance = self.model(**instance_data)
+            self.session.add(instance)
+            await self.session.flush()
+            instance_dict = self.mapper.from_instance(instance)
+            await self.session.commit()
+            message = f"Created a new instance of {self.model.__name__} model"
+            logger.info(message)
+            return instance_dict
+        except SQLAlchemyError as e:
+            await self.session.rollback()
+            error_message = f"Failed to create a new instance of {self.model.__name__} model: {str(e)}"
+            logger.error(error_message)
+            raise ValueError(error_message)
+
+    @check_session
+    async def create_instances(
+        self, instances_data: Iterable[Dict[str, Any]], batch_size: int = 1000
+    ) -> List[int]:
+        if batch_size < 1:
+            error_message = f"Batch size must be a positive integer, got {batch_size}"
+            logger.error(error_message)
+            raise ValueError(error_message)
+        table = self.model.__table__
+        statement = insert(table).returning(table.c.id, sort_by_parameter_order=True)
+        instance_ids = []
+        try:
+            for batch in batched(instances_data, batch_size):
+                start_batch()
+                batch_ids: List[Any] = [None] * len(batch)
+                for positions in group_row_positions(batch).values():
+                    result = await self.session.execute(
+                        statement, [batch[position] for position in positions]
+                    )
+                    for position, instance_id in zip(positions, result.scalars().all()):
+                        batch_ids[position] = instance_id
+                instance_ids.extend(batch_ids)
+                await self.session.commit()
+            message = f"Created {len(instance_ids)} new instances of {self.model.__name__} model"
+            logger.info(message)
+            return instance_ids
+        except SQLAlchemyError as e:
+            await self.session.rollback()
+            error_message = (
+                f"Failed to create new instances of {self.model.__name__} model "
+                f"after {len(instance_ids)} committed rows: {str(e)}"
+            )
+            logger.error(error_message)
+            raise ValueError(error_message)
+
+    @check_session
+    async def upsert_many(
+        self,
+        rows: Iterable[Dict[str, Any]],
+        conflict_columns: Iterable[str],
+        update_columns: Optional[Iterable[str]] = None,
+        batch_size: int = 1000,
+    ) -> UpsertReport:
+        if batch_size < 1:
+            error_message = f"Batch size must be a positive integer, got {batch_size}"
+            logger.error(error_message)
+            raise ValueError(error_message)
+        conflict_columns = tuple(conflict_columns)
+        check_field_names(self.mapper, conflict_columns)
+        report = UpsertReport(self.mapper.table.name, 0, 0, [])
+        try:
+            for batch in batched(rows, batch_size):
+                start_batch()
+                batch = deduplicate_rows(self.mapper, batch, conflict_columns)
+                results = []
+                for positions in group_row_positions(batch).values():
+                    group = [batch[position] for position in positions]
+                    statement = self.mapper.upsert_statement(
+                        conflict_columns,
+                        get_upsert_columns(
+                            self.mapper, group[0], conflict_columns, update_columns
+                        ),
+                    )
+                    result = await self.session.execute(statement, group)
+                    results.extend(result.all())
+                await self.session.commit()
+                inserted = sum(1 for result_row in results if result_row.inserted)
+                report.inserted += inserted
+                report.updated += len(results) - inserted
+                report.ids.extend(order_upserted_ids(batch, conflict_columns, results))
+            message = (
+                f"Upserted instances of {self.model.__name__} model: "
+                f"{report.inserted} inserted, {report.updated} updated"
+            )
+            logger.info(message)
+            return report
+        except SQLAlchemyError as e:
+            await self.session.rollback()
+            error_message = (
+                f"Failed to upsert instances of {self.model.__name__} model "
+                f"after {len(report.ids)} committed rows: {str(e)}"
+            )
+            logger.error(error_message)
+            raise ValueError(error_message)
+
+    @check_session
+    async def get_all(self) -> Optional[List[Dict[str, Any]]]:
+        try:
+            rows = (await self.session.execute(self.mapper.statement)).all()
+            if rows:
+                message = f"Retrieved all instances of {self.model.__name__} model"
+                logger.info(message)
+                return self.mapper.to_dicts(rows)
+            else:
+                message = f"No instances found for {self.model.__name__} model"
+                logger.info(message)
+                return None
+        except SQLAlchemyError as e:
+            await self.session.rollback()
+            error_message = (
+                f"Failed to retrieve instances of {self.model.__name__} model: {str(e)}"
+            )
+            logger.error(error_message)
+            raise ValueError(error_message)
+
+    @check_session
+    async def get_all_by_filter(
+        self, filter_param: Union[str, FilterSpec], filter_value: Any = None
+    ) -> Optional[List[Dict[str, Any]]]:
+        spec = to_filter_spec(filter_param, filter_value)
+        statement, params = compile_filter(self.mapper, spec)
+        try:
+            result = await self.session.execute(statement, params)
+            rows = result.all()
+            if rows:
+                message = (
+                    f"Retrieved instances of {self.model.__name__} model with {spec}."
+                )
+                logger.info(message)
+                return self.mapper.to_dicts(rows)
+            else:
+                message = (
+                    f"No instances found for {self.model.__name__} model with {spec}."
+                )
+                logger.info(message)
+                return None
+        except SQLAlchemyError as e:
+            await self.session.rollback()
+            error_message = (
+                f"Failed to retrieve instances of {self.model.__name__}: {str(e)}"
+            )
+            logger.error(error_message)
+            raise ValueError(error_message)
+
+    @check_session
+    async def get_all_with_relationships(
+        self,
+        relationship_names: Iterable[str],
+        filter_param: Optional[str] = None,
+        filter_value: Any = None,
+        strategies: Optional[Dict[str, LoadStrategy]] = None,
+    ) -> Optional[List[Dict[str, Any]]]:
+        relationships = get_relationships(self.model, relationship_names)
+        statement = select(self.model).options(
+            *build_loader_options(
+                relationships, {**self.load_strategies, **(strategies or {})}
+            )
+        )
+        if filter_param is not None:
+            statement = statement.filter_by(**{filter_param: filter_value})
+        try:
+            result = await self.session.execute(statement)
+            instances = result.unique().scalars().all()
+            if instances:
+                message = f"Retrieved instances of {self.model.__name__} model with {', '.join(relationship.key for relationship in relationships)}."
+                logger.info(message)
+                return [
+                    to_related_dict(self.mapper, instance, relationships)
+                    for instance in instances
+                ]
+            else:
+                message = f"No instances found for {self.model.__name__} model."
+                logger.info(message)
+                return None
+        except SQLAlchemyError as e:
+            await self.session.rollback()
+            error_message = f"Failed to retrieve instances of {self.model.__name__} model with relationships: {str(e)}"
+            logger.error(error_message)
+            raise ValueError(error_message)
+
+    @check_session
+    async def paginate(
+        self,
+        filters: Optional[Dict[str, Any]] = None,
+        order_by: Iterable[str] = ("id",),
+        after: Optional[str] = None,
+        limit: int = DEFAULT_PAGE_SIZE,
+        descending: bool = False,
+    ) -> Page:
+        if limit < 1:
+            error_message = f"Page size must be a positive integer, got {limit}"
+            logger.error(error_message)
+            raise ValueError(error_message)
+        filters = filters or {}
+        check_field_names(self.mapper, filters)
+        columns = get_order_columns(self.mapper, order_by)
+        after_values = decode_cursor(after, columns) if after is not None else None
+        statement = keyset_statement(
+            self.mapper, filters, columns, after_values, limit, descending
+        )
+        try:
+            result = await self.session.execute(statement)
+            rows = result.all()
+            items = self.mapper.to_dicts(rows[:limit])
+            next_cursor = (
+                encode_cursor(columns, items[-1]) if len(rows) > limit else None
+            )
+            message = f"Retrieved a page of {len(items)} instances of {self.model.__name__} model"
+            logger.info(message)
+            return Page(items, next_cursor)
+        except SQLAlchemyError as e:
+            await self.session.rollback()
+            error_message = (
+                f"Failed to paginate instances of {self.model.__name__} model: {str(e)}"
+            )
+            logger.error(error_message)
+            raise ValueError(error_message)
+
+    @check_session
+    def iter_all(self, chunk_size: int = 1000) -> AsyncIterator[Dict[str, Any]]:
+        return self._iter_rows(self.mapper.statement, chunk_size)
+
+    @check_session
+    def iter_by_filter(
+        self,
+        filter_param: Union[str, FilterSpec],
+        filter_value: Any = None,
+        chunk_size: int = 1000,
+    ) -> AsyncIterator[Dict[str, Any]]:
+        spec = to_filter_spec(filter_param, filter_value)
+        statement, params = compile_filter(self.mapper, spec)
+        return self._iter_rows(statement, chunk_size, params)
+
+    @check_session
+    async def filter_by(
+        self, filter_param: Union[str, FilterSpec], filter_value: Any = None
+    ) -> Optional[Dict[str, Any]]:
+        spec = to_filter_spec(filter_param, filter_value)
+        try:
+            row = await self._first_row(spec)
+            if row:
+                message = (
+                    f"Retrieved an instance of {self.model.__name__} model with {spec}."
+                )
+                logger.info(message)
+                return self.mapper.to_dict(row)
+            else:
+                error_message = (
+                    f"No instance found for {self.model.__name__} model with {spec}"
+                )
+                logger.error(error_message)
+                return None
+        except SQLAlchemyError as e:
+            await self.session.rollback()
+            error_message = f"Failed to retrieve an instance of {self.model.__name__} model: {str(e)}"
+            logger.error(error_message)
+            raise ValueError(error_message)
+
+    @check_session
+    async def get_cached(self, primary_key_value: Any) -> Optional[Dict[str, Any]]:
+        cache = get_reference_cache(self.model, self.session.sync_session)
+        cached = cache.get(primary_key_value) if cache is not None else None
+        if cached is not None:
+            message = f"Retrieved a cached instance of {self.model.__name__} model with {self.mapper.primary_key.name}={primary_key_value}."
+            logger.info(message)
+            return cached
+        instance = await self.filter_by(self.mapper.primary_key.name, primary_key_value)
+        if cache is not None and instance is not None:
+            fill_reference_cache(
+                self.session.sync_session, self.model, primary_key_value, instance
+            )
+        return instance
+
+    @check_session
+    async def warm_cache(self) -> int:
+        cache = get_reference_cache(self.model, self.session.sync_session)
+        if cache is None:
+            error_message = (
+                f"The {self.model.__name__} model is not a cached reference model"
+            )
+            logger.error(error_message)
+            raise ValueError(error_message)
+        if has_pending_writes(self.session.sync_session, self.model):
+            error_message = f"Cannot warm the {self.model.__name__} cache with uncommitted changes; commit first"
+            logger.error(error_message)
+            raise ValueError(error_message)
+        return cache.warm(await self.get_all() or [])
+
+    @check_session
+    async def get_random(
+        self, strategy: Optional[SamplingStrategy] = None
+    ) -> Optional[Dict[str, Any]]:
+        try:
+            random_row = await self.session.run_sync(
+                sample_row, self.model, strategy or self.sampling_strategy
+            )
+            if random_row:
+                message = f"Retrieved a random instance of {self.model.__name__} model"
+                logger.info(message)
+                return self.mapper.to_dict(random_row)
+            else:
+                error_message = f"No instance found for {self.model.__name__} model"
+                logger.error(error_message)
+                return None
+        except SQLAlchemyError as e:
+            await self.session.rollback()
+            error_message = f"Failed to retrieve a random instance of {self.model.__name__} model: {str(e)}"
+            logger.error(error_message)
+            raise ValueError(error_message)
+
+    @check_session
+    async def get_field_value(
+        self, filter_param: str, filter_value: Any, field_name: str
+    ) -> Any:
+        try:
+            row = await self._first_row(filter_param, filter_value, field_name)
+            if row:
+                field_value = row[0]
+                if field_value:
+                    message = (
+                        f"Retrieved the value of the instance field '{field_name}'"
+                        f"for {self.model.__name__} model with {filter_param}={filter_value}."
+                    )
+                    logger.info(message)
+                    return field_value
+                else:
+                    error_message = (
+                        f"Could not retrieve the value of the instance field '{field_name}'"
+                        f"for {self.model.__name__} model with {filter_param}={filter_value}."
+                        f"The field value is not available."
+                    )
+                    logger.error(error_message)
+                    return None
+            else:
+                error_message = f"No instance found for {self.model.__name__} model with {filter_param}={filter_value}"
+                logger.error(error_message)
+                raise NoResultFound(error_message)
+        except SQLAlchemyError as e:
+            await self.session.rollback()
+            error_message = (
+                f"Failed to retrieve the value of the instance field"
+                f"of {self.model.__name__} model: {str(e)}"
+            )
+            logger.error(error_message)
+            raise ValueError(error_message)
+
+    @check_session
+    async def update_field(
+        self, filter_param: str, filter_value: Any, field_name: str, field_value: Any
+    ) -> Dict[str, Any]:
+        try:
+            row = await self._first_row(filter_param, filter_value)
+            if row:
+                if field_name in self.mapper.keys:
+                    updated_row = await self._update_row(row, {field_name: field_value})
+                    message = (
+                        f"Updated the field '{field_name}'"
+                        f"for {self.model.__name__} with {filter_param}={filter_value}."
+                    )
+                    logger.info(message)
+                    return self.mapper.to_dict(updated_row)
+                else:
+                    error_message = (
+                        f"The instance of {self.model.__name__} model"
+                        f"does not have a field named {field_name}"
+                    )
+                    logger.error(error_message)
+                    raise ValueError(error_message)
+            else:
+                error_message = f"No instance found for {self.model.__name__} model with {filter_param}={filter_value}"
+                logger.error(error_message)
+                raise NoResultFound(error_message)
+        except SQLAlchemyError as e:
+            await self.session.rollback()
+            error_message = f"Failed to update the field {field_name} for {self.model.__name__} model: {str(e)}"
+            logger.error(error_message)
+            raise ValueError(error_message)
+
+    @check_session
+    async def update_fields(
+        self, filter_param: str, filter_value: Any, updated_data: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        try:
+            row = await self._first_row(filter_param, filter_value)
+            if row:
+                for field_name in updated_data:
+                    if field_name not in self.mapper.keys:
+                        error_message = (
+                            f"The model {self.model.__name__} model"
+                            f"does not have a field named {field_name}"
+                        )
+                        logger.error(error_message)
+                        raise ValueError(error_message)
+                updated_row = await self._update_row(row, updated_data)
+                message = (
+                    f"Updated multiple fields for {self.model.__name__} model"
+                    f"with {filter_param}={filter_value}."
+                )
+                logger.info(message)
+                return self.mapper.to_dict(updated_row)
+            else:
+                error_message = f"No instance found for {self.model.__name__} model with {filter_param}={filter_value}"
+                logger.error(error_message)
+                raise NoResultFound(error_message)
+        except SQLAlchemyError as e:
+            await self.session.rollback()
+            error_message = f"Failed to update multiple fields for {self.model.__name__} model: {str(e)}"
+            logger.error(error_message)
+            raise ValueError(error_message)
+
+    @check_session
+    async def update_where(
+        self, filters: Dict[str, Any], values: Dict[str, Any], allow_all: bool = False
+    ) -> int:
+        check_filters(self.mapper, filters, "update", allow_all)
+        if not values:
+            error_message = f"No values to update for {self.model.__name__} model"
+            logger.error(error_message)
+            raise ValueError(error_message)
+        check_field_names(self.mapper, values)
+        statement = update(self.mapper.table).filter_by(**filters).values(**values)
+        try:
+            result = await self.session.execute(statement)
+            updated_count = result.rowcount
+            await self.session.commit()
+            message = f"Updated {updated_count} instances of {self.model.__name__} model with {filters}."
+            logger.info(message)
+            return updated_count
+        except SQLAlchemyError as e:
+            await self.session.rollback()
+            error_message = f"Failed to update instances of {self.model.__name__} model with {filters}: {str(e)}"
+            logger.error(error_message)
+            raise ValueError(error_message)
+
+    @check_session
+    async def bulk_update_rows(
+        self, rows: Iterable[Dict[str, Any]], batch_size: int = 1000
+    ) -> int:
+        if batch_size < 1:
+            error_message = f"Batch size must be a positive integer, got {batch_size}"
+            logger.error(error_message)
+            raise ValueError(error_message)
+        updated = 0
+        try:
+            for batch in batched(rows, batch_size):
+                start_batch()
+                batch_updated = 0
+                for field_names, group in group_update_rows(self.mapper, batch).items():
+                    result = await self.session.execute(
+                        self.mapper.bulk_update_statement(field_names, group)
+                    )
+                    batch_updated += result.rowcount
+                await self.session.commit()
+                updated += batch_updated
+            message = f"Updated {updated} instances of {self.model.__name__} model"
+            logger.info(message)
+            return updated
+        except SQLAlchemyError as e:
+            await self.session.rollback()
+            error_message = (
+                f"Failed to update instances of {self.model.__name__} model "
+                f"after {updated} committed rows: {str(e)}"
+            )
+            logger.error(error_message)
+            raise ValueError(error_message)
+
+    @check_session
+    async def delete(self, filter_param: str, filter_value: Any) -> str:
+        try:
+            instance = await self._first_instance(filter_param, filter_value)
+            if instance:
+                await self.session.delete(instance)
+                await self.session.commit()
+                message = "The instance was successfully deleted."
+                logger.info(message)
+                return message
+            else:
+                error_message = f"No instance found for {self.model.__name__} model with {filter_param}={filter_value}"
+                logger.error(error_message)
+                raise NoResultFound(error_message)
+        except IntegrityError:
+            await self.session.rollback()
+            error_message = "Cannot delete the instance due to integrity constraints."
+            logger.error(error_message)
+            raise ValueError(error_message)
+        except SQLAlchemyError as e:
+            await self.session.rollback()
+            error_message = f"Failed to delete the instance for {self.model.__name__} model: {str(e)}"
+            logger.error(error_message)
+            raise ValueError(error_message)
+
+    @check_session
+    async def delete_all(self) -> str:
+        try:
+            await self.session.execute(delete(self.model))
+            await self.session.commit()
+            message = f"All instances with {self.model.__name__} model were successfully deleted."
+            logger.info(message)
+            return message
+        except SQLAlchemyError as e:
+            await self.session.rollback()
+            error_message = f"Failed to delete all records for {self.model.__name__} model: {str(e)}"
+            logger.error(error_message)
+            raise ValueError(error_message)
+
+    @check_session
+    async def delete_where(
+        self, filters: Dict[str, Any], allow_all: bool = False
+    ) -> List[Any]:
+        check_filters(self.mapper, filters, "delete", allow_all)
+        statement = (
+            delete(self.mapper.table)
+            .filter_by(**filters)
+            .returning(self.mapper.primary_key)
+        )
+        try:
+            result = await self.session.execute(statement)
+            deleted_ids = list(result.scalars().all())
+            await self.session.commit()
+            message = f"Deleted {len(deleted_ids)} instances of {self.model.__name__} model with {filters}."
+            logger.info(message)
+            if len(deleted_ids) > DELETE_WHERE_WARNING_ROWS:
+                logger.warning(
+                    f"delete_where held all {len(deleted_ids)} deleted ids of {self.model.__name__} model "
+                    f"in memory, use delete_in_chunks for large deletes."
+                )
+            return deleted_ids
+        except IntegrityError:
+            await self.session.rollback()
+            error_message = "Cannot delete the instances due to integrity constraints."
+            logger.error(error_message)
+            raise ValueError(error_message)
+        except SQLAlchemyError as e:
+            await self.session.rollback()
+            error_message = f"Failed to delete instances of {self.model.__name__} model with {filters}: {str(e)}"
+            logger.error(error_message)
+            raise ValueError(error_message)
+
+    @check_session
+    async def delete_in_chunks(
+        self,
+        filters: Optional[Dict[str, Any]] = None,
+        chunk_size: int = 10_000,
+        pause: float = 0.0,
+        allow_all: bool = False,
+    ) -> DeleteReport:
+        if chunk_size < 1:
+            error_message = f"Chunk size must be a positive integer, got {chunk_size}"
+            logger.error(error_message)
+            raise ValueError(error_message)
+        filters = filters or {}
+        check_filters(self.mapper, filters, "delete", allow_all)
+        primary_key = self.mapper.primary_key
+        statement = self.mapper.delete_chunk_statement(filters, chunk_size)
+        report = DeleteReport(self.mapper.table.name, 0, 0, 0.0, 0.0)
+        started_at = time.perf_counter()
+        try:
+            result = await self.session.execute(
+                select(func.min(primary_key)).filter_by(**filters)
+            )
+            first_id = result.scalar()
+            last_id = first_id - 1 if first_id is not None else None
+            while last_id is not None:
+                start_batch()
+                chunk_started_at = time.perf_counter()
+                result = await self.session.execute(statement, {"last_id": last_id})
+                deleted_count, max_id = result.one()
+                await self.session.commit()
+                if not deleted_count:
+                    break
+                last_id = max_id
+                report.rows += deleted_count
+                report.chunks += 1
+                report.longest_chunk = max(
+                    report.longest_chunk, time.perf_counter() - chunk_started_at
+                )
+                if deleted_count < chunk_size:
+                    break
+                if pause:
+                    await asyncio.sleep(pause)
+            report.elapsed = time.perf_counter() - started_at
+            message = (
+                f"Deleted {report.rows} instances of {self.model.__name__} model in "
+                f"{report.chunks} chunks ({report.rows_per_second:.0f} rows/sec)"
+            )
+            logger.info(message)
+            return report
+        except IntegrityError:
+            await self.session.rollback()
+            error_message = (
+                f"Cannot delete the instances due to integrity constraints "
+                f"after {report.rows} committed rows."
+            )
+            logger.error(error_message)
+            raise ValueError(error_message)
+        except SQLAlchemyError as e:
+            await self.session.rollback()
+            error_message = (
+                f"Failed to delete instances of {self.model.__name__} model "
+                f"after {report.rows} committed rows: {str(e)}"
+            )
+            logger.error(error_message)
+            raise ValueError(error_message)
+
+    @check_session
+    async def get_relationship(
+        self, filter_param: str, filter_value: Any, relationship_name: str
+    ) -> Optional[Any]:
+        try:
+            row = await self._first_row(filter_param, filter_value)
+            if row:
+                relationship = self.mapper.get_relationship(relationship_name)
+                related = None
+                if relationship is not None:
+                    related = await self._load_relationship(relationship, row)
+                if related is not None:
+                    message = f"Retrieved {relationship_name} for {self.model.__name__} instance."
+                    logger.info(message)
+                    return related
+                else:
+                    message = f"No relationship found for {self.model.__name__} model with name {relationship_name}."
+                    logger.info(message)
+                    return None
+            else:
+                error_message = f"No instance found for {self.model.__name__} model with {filter_param}={filter_value}"
+                logger.error(error_message)
+                raise NoResultFound(error_message)
+        except SQLAlchemyError as e:
+            await self.session.rollback()
+            error_message = (
+                f"Failed to retrieve relationship {relationship_name} for {self.model.__name__} model:"
+                f"{str(e)}"
+            )
+            logger.error(error_message)
+            raise ValueError(error_message)
+
+    @check_session
+    async def get_relationship_many(
+        self, parent_ids: Iterable[Any], relationship_name: str, chunk_size: int = 1000
+    ) -> Dict[Any, Optional[List[Dict[str, Any]] | Dict[str, Any]]]:
+        return {
+            parent_id: related
+            async for parent_id, related in self.iter_relationship_many(
+                parent_ids, relationship_name, chunk_size
+            )
+        }
+
+    @check_session
+    def iter_relationship_many(
+        self, parent_ids: Iterable[Any], relationship_name: str, chunk_size: int = 1000
+    ) -> AsyncIterator[Tuple[Any, Optional[List[Dict[str, Any]] | Dict[str, Any]]]]:
+        relationship = get_relationships(self.model, [relationship_name])[0]
+        return self._iter_relationship_many(relationship, parent_ids, chunk_size)
+
+    @check_session
+    async def execute_query(self, query: Executable) -> Result:
+        try:
+            result = await self.session.execute(query)
+            message = "Executed SQL query successfully."
+            logger.info(message)
+            return result
+        except SQLAlchemyError as e:
+            await self.session.rollback()
+            error_message = f"Failed to execute SQL query: {str(e)}"
+            logger.error(error_message)
+            raise ValueError(error_message)
+
+    async def _first_row(
+        self,
+        filter_param: Union[str, FilterSpec],
+        filter_value: Any = None,
+        field_name: Optional[str] = None,
+    ) -> Optional[Row]:
+        spec = to_filter_spec(filter_param, filter_value).take(1)
+        statement, params = compile_filter(self.mapper, spec, field_name)
+        return (await self.session.execute(statement, params)).first()
+
+    async def _first_instance(
+        self, filter_param: str, filter_value: Any
+    ) -> Optional[Base]:
+        spec = to_filter_spec(filter_param, filter_value).take(1)
+        statement, params = compile_filter(self.mapper, spec, self.model)
+        return (await self.session.execute(statement, params)).scalars().first()
+
+    async def _update_row(self, row: Row, values: Dict[str, Any]) -> Row:
+        statement = self.statements.update_statement(tuple(values))
+        params = self.statements.update_params(
+            row._mapping[self.mapper.primary_key], values
+        )
+        updated_row = (await self.session.execute(statement, params)).one()
+        await self.session.commit()
+        return updated_row
+
+    async def _load_relationship(
+        self, relationship: RelationshipProperty, row: Row
+    ) -> Optional[List[Dict[str, Any]] | Dict[str, Any]]:
+        key_column = reference_key_column(relationship)
+        if key_column is not None:
+            return await self._load_reference(relationship, row._mapping[key_column])
+        related_mapper = get_row_mapper(relationship.mapper.class_)
+        result = await self.session.execute(
+            self.mapper.relationship_statement(relationship.key),
+            {"parent_id": row._mapping[self.mapper.primary_key]},
+        )
+        related_rows = result.all()
+        if relationship.uselist:
+            return related_mapper.to_dicts(related_rows)
+        return related_mapper.to_dict(related_rows[0]) if related_rows else None
+
+    async def _load_reference(
+        self, relationship: RelationshipProperty, key: Any
+    ) -> Optional[Dict[str, Any]]:
+        if key is None:
+            return None
+        cache = get_reference_cache(
+            relationship.mapper.class_, self.session.sync_session
+        )
+        related = cache.get(key)
+        if related is None:
+            related_mapper = get_row_mapper(relationship.mapper.class_)
+            spec = FilterSpec.equals(related_mapper.primary_key.name, key).take(1)
+            result = await self.session.execute(*compile_filter(related_mapper, spec))
+            row = result.first()
+            if row is None:
+                return None
+            related = related_mapper.to_dict(row)
+            fill_reference_cache(
+                self.session.sync_session, relationship.mapper.class_, key, related
+            )
+        return related
+
+    async def _iter_relationship_many(
+        self,
+        relationship: RelationshipProperty,
+        parent_ids: Iterable[Any],
+        chunk_size: int,
+    ) -> AsyncIterator[Tuple[Any, Optional[List[Dict[str, Any]] | Dict[str, Any]]]]:
+        statement = self.mapper.relationship_many_statement(relationship.key)
+        loaded = 0
+        try:
+            for batch in batched(parent_ids, chunk_size):
+                start_batch()
+                result = await self.session.execute(statement, {"parent_ids": batch})
+                for parent_id, related in self.mapper.group_related(
+                    relationship, batch, result.all()
+                ):
+                    yield parent_id, related
+                loaded += len(batch)
+            message = f"Retrieved {relationship.key} for {loaded} instances of {self.model.__name__} model"
+            logger.info(message)
+        except SQLAlchemyError as e:
+            await self.session.rollback()
+            error_message = f"Failed to retrieve relationship {relationship.key} for {self.model.__name__} model: {str(e)}"
+            logger.error(error_message)
+            raise ValueError(error_message)
+
+    async def _iter_rows(
+        self,
+        statement: Select,
+        chunk_size: int,
+        params: Optional[Dict[str, Any]] = None,
+    ) -> AsyncIterator[Dict[str, Any]]:
+        streamed = 0
+        try:
+            result = await self.session.stream(
+                statement.execution_options(yield_per=chunk_size), params
+            )
+            try:
+                async for partition in result.partitions():
+                    streamed += len(partition)
+                    for instance_dict in self.mapper.to_dicts(partition):
+                        yield instance_dict
+            finally:
+                await result.close()
+            message = f"Streamed {streamed} instances of {self.model.__name__} model"
+            logger.info(message)
+        except SQLAlchemyError as e:
+            await self.session.rollback()
+            error_message = (
+                f"Failed to stream instances of {self.model.__name__} model: {str(e)}"
+            )
+            logger.error(error_message)
+            raise ValueError(error_message)
+
+    def _check_session(self) -> None:
+        if self.session is None:
+            error_message = "No session provided. You must pass a valid session to perform database operations."
+            raise ValueError(error_message)
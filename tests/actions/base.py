@@ -1,25 +1,165 @@
-from typing import Any, Callable, Dict, List, Optional, Type
+import time
+from dataclasses import dataclass
+from itertools import islice
+from typing import (Any, Callable, Dict, Iterable, Iterator, List, Optional,
+                    Tuple, Type, Union)
 
-from sqlalchemy import Executable, Result, func
+from sqlalchemy import (Executable, Result, Row, Select, delete, func, insert,
+                        select, update)
 from sqlalchemy.exc import IntegrityError, NoResultFound, SQLAlchemyError
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import RelationshipProperty, Session
 
+from src.db.instrumentation import start_batch, track_action
 from src.db.models import Base
 from src.logger.logger import logger
+from tests.actions.filters import FilterSpec, compile_filter, to_filter_spec
+from tests.actions.loading import (LoadStrategy, build_loader_options,
+                                   get_relationships, to_related_dict)
+from tests.actions.mappers import RowMapper, get_row_mapper
+from tests.actions.pagination import (DEFAULT_PAGE_SIZE, Page, decode_cursor,
+                                      encode_cursor, get_order_columns,
+                                      keyset_statement)
+from tests.actions.reference_cache import (fill_reference_cache,
+                                           get_reference_cache,
+                                           has_pending_writes,
+                                           reference_key_column)
+from tests.actions.sampling import SamplingStrategy, sample_row
+from tests.actions.statements import get_statement_registry
+
+DELETE_WHERE_WARNING_ROWS: int = 10_000
 
 
 def check_session(action: Callable) -> Callable:
     def wrapper(self, *args, **kwargs):
         self._check_session()
-        return action(self, *args, **kwargs)
+        action_name = f"{type(self).__name__}.{action.__name__}"
+        return track_action(action_name, action, self, *args, **kwargs)
 
     return wrapper
 
 
+def batched(iterable: Iterable[Any], batch_size: int) -> Iterator[List[Any]]:
+    iterator = iter(iterable)
+    while batch := list(islice(iterator, batch_size)):
+        yield batch
+
+
+@dataclass
+class DeleteReport:
+    table_name: str
+    rows: int
+    chunks: int
+    elapsed: float
+    longest_chunk: float
+
+    @property
+    def rows_per_second(self) -> float:
+        return self.rows / self.elapsed if self.elapsed else float("inf")
+
+
+@dataclass
+class UpsertReport:
+    table_name: str
+    inserted: int
+    updated: int
+    ids: List[Any]
+
+
+def group_row_positions(rows: List[Dict[str, Any]]) -> Dict[Tuple[str, ...], List[int]]:
+    groups: Dict[Tuple[str, ...], List[int]] = {}
+    for position, row in enumerate(rows):
+        groups.setdefault(tuple(sorted(row)), []).append(position)
+    return groups
+
+
+def check_field_names(mapper: RowMapper, field_names: Iterable[str]) -> None:
+    unknown_fields = [name for name in field_names if name not in mapper.keys]
+    if unknown_fields:
+        error_message = f"The model {mapper.model.__name__} model does not have fields named {', '.join(unknown_fields)}"
+        logger.error(error_message)
+        raise ValueError(error_message)
+
+
+def check_filters(
+    mapper: RowMapper, filters: Dict[str, Any], action: str, allow_all: bool
+) -> None:
+    if not filters and not allow_all:
+        error_message = f"Cannot {action} every {mapper.model.__name__} row without filters; pass allow_all=True to do so"
+        logger.error(error_message)
+        raise ValueError(error_message)
+    check_field_names(mapper, filters)
+
+
+def deduplicate_rows(
+    mapper: RowMapper, rows: List[Dict[str, Any]], key_columns: Tuple[str, ...]
+) -> List[Dict[str, Any]]:
+    unique_rows: Dict[Tuple[Any, ...], Dict[str, Any]] = {}
+    for row in rows:
+        missing_columns = [name for name in key_columns if name not in row]
+        if missing_columns:
+            error_message = f"Cannot upsert {mapper.model.__name__} rows without {', '.join(missing_columns)}: {row}"
+            logger.error(error_message)
+            raise ValueError(error_message)
+        unique_rows[tuple(row[name] for name in key_columns)] = row
+    return list(unique_rows.values())
+
+
+def order_upserted_ids(
+    rows: List[Dict[str, Any]], conflict_columns: Tuple[str, ...], results: List[Row]
+) -> List[Any]:
+    ids = {tuple(result_row[2:]): result_row[0] for result_row in results}
+    return [ids[tuple(row[name] for name in conflict_columns)] for row in rows]
+
+
+def get_upsert_columns(
+    mapper: RowMapper,
+    row: Dict[str, Any],
+    conflict_columns: Tuple[str, ...],
+    update_columns: Optional[Iterable[str]],
+) -> Tuple[str, ...]:
+    if update_columns is None:
+        update_columns = [
+            name
+            for name in row
+            if name not in conflict_columns and name != mapper.primary_key.name
+        ]
+    update_columns = tuple(update_columns)
+    if not update_columns:
+        error_message = (
+            f"No columns to update on conflict for {mapper.model.__name__} model"
+        )
+        logger.error(error_message)
+        raise ValueError(error_message)
+    check_field_names(mapper, update_columns)
+    return update_columns
+
+
+def group_update_rows(
+    mapper: RowMapper, rows: List[Dict[str, Any]]
+) -> Dict[Tuple[str, ...], List[Dict[str, Any]]]:
+    key = mapper.primary_key.name
+    groups: Dict[Tuple[str, ...], List[Dict[str, Any]]] = {}
+    for row in rows:
+        if key not in row:
+            error_message = f"Cannot update {mapper.model.__name__} rows without a {key} value: {row}"
+            logger.error(error_message)
+            raise ValueError(error_message)
+        field_names = tuple(sorted(name for name in row if name != key))
+        groups.setdefault(field_names, []).append(row)
+    for field_names in groups:
+        check_field_names(mapper, field_names)
+    return groups
+
+
 class BaseActions:
+    sampling_strategy: SamplingStrategy = SamplingStrategy.ID_RANGE
+    load_strategies: Dict[str, LoadStrategy] = {}
+
     def __init__(self, model: Type[Base], session: Session) -> None:
         self.model = model
         self.session = session
+        self.mapper = get_row_mapper(model)
+        self.statements = get_statement_registry(model)
 
     @check_session
     def create_table(self) -> str:
@@ -57,32 +197,105 @@ class BaseActions:
             self.session.commit()
             message = f"Created a new instance of {self.model.__name__} model"
             logger.info(message)
-            instance_dict = {
-                column.name: getattr(instance, column.name)
-                for column in instance.__table__.columns
-            }
-            return instance_dict
+            return self.mapper.from_instance(instance)
         except SQLAlchemyError as e:
             self.session.rollback()
             error_message = f"Failed to create a new instance of {self.model.__name__} model: {str(e)}"
             logger.error(error_message)
             raise ValueError(error_message)
 
+    @check_session
+    def create_instances(
+        self, instances_data: Iterable[Dict[str, Any]], batch_size: int = 1000
+    ) -> List[int]:
+        if batch_size < 1:
+            error_message = f"Batch size must be a positive integer, got {batch_size}"
+            logger.error(error_message)
+            raise ValueError(error_message)
+        table = self.model.__table__
+        statement = insert(table).returning(table.c.id, sort_by_parameter_order=True)
+        instance_ids = []
+        try:
+            for batch in batched(instances_data, batch_size):
+                start_batch()
+                batch_ids: List[Any] = [None] * len(batch)
+                for positions in group_row_positions(batch).values():
+                    result = self.session.execute(
+                        statement, [batch[position] for position in positions]
+                    )
+                    for position, instance_id in zip(positions, result.scalars().all()):
+                        batch_ids[position] = instance_id
+                instance_ids.extend(batch_ids)
+                self.session.commit()
+            message = f"Created {len(instance_ids)} new instances of {self.model.__name__} model"
+            logger.info(message)
+            return instance_ids
+        except SQLAlchemyError as e:
+            self.session.rollback()
+            error_message = (
+                f"Failed to create new instances of {self.model.__name__} model "
+                f"after {len(instance_ids)} committed rows: {str(e)}"
+            )
+            logger.error(error_message)
+            raise ValueError(error_message)
+
+    @check_session
+    def upsert_many(
+        self,
+        rows: Iterable[Dict[str, Any]],
+        conflict_columns: Iterable[str],
+        update_columns: Optional[Iterable[str]] = None,
+        batch_size: int = 1000,
+    ) -> UpsertReport:
+        if batch_size < 1:
+            error_message = f"Batch size must be a positive integer, got {batch_size}"
+            logger.error(error_message)
+            raise ValueError(error_message)
+        conflict_columns = tuple(conflict_columns)
+        check_field_names(self.mapper, conflict_columns)
+        report = UpsertReport(self.mapper.table.name, 0, 0, [])
+        try:
+            for batch in batched(rows, batch_size):
+                start_batch()
+                batch = deduplicate_rows(self.mapper, batch, conflict_columns)
+                results = []
+                for positions in group_row_positions(batch).values():
+                    group = [batch[position] for position in positions]
+                    statement = self.mapper.upsert_statement(
+                        conflict_columns,
+                        get_upsert_columns(
+                            self.mapper, group[0], conflict_columns, update_columns
+                        ),
+                    )
+                    results.extend(self.session.execute(statement, group).all())
+                self.session.commit()
+                inserted = sum(1 for result_row in results if result_row.inserted)
+                report.inserted += inserted
+                report.updated += len(results) - inserted
+                report.ids.extend(order_upserted_ids(batch, conflict_columns, results))
+            message = (
+                f"Upserted instances of {self.model.__name__} model: "
+                f"{report.inserted} inserted, {report.updated} updated"
+            )
+            logger.info(message)
+            return report
+        except SQLAlchemyError as e:
+            self.session.rollback()
+            error_message = (
+                f"Failed to upsert instances of {self.model.__name__} model "
+                f"after {len(report.ids)} committed rows: {str(e)}"
+            )
+            logger.error(error_message)
+            raise ValueError(error_message)
+
     @check_session
     def get_all(self) -> Optional[List[Dict[str, Any]]]:
         try:
-            instances = self.session.query(self.model).all()
-            if instances:
+            rows = self.session.execute(self.mapper.statement).all()
+            if rows:
                 message = f"Retrieved all instances of {self.model.__name__} model"
                 logger.info(message)
-                instances_list = []
-                for instance in instances:
-                    instance_dict = {
-                        column.name: getattr(instance, column.name)
-                        for column in instance.__table__.columns
-                    }
-                    instances_list.append(instance_dict)
-                return instances_list
+                return self.mapper.to_dicts(rows)
             else:
                 message = f"No instances found for {self.model.__name__} model"
                 logger.info(message)
@@ -97,57 +310,136 @@ class BaseActions:
 
     @check_session
     def get_all_by_filter(
-        self, filter_param: str, filter_value: Any
+        self, filter_param: Union[str, FilterSpec], filter_value: Any = None
     ) -> Optional[List[Dict[str, Any]]]:
+        spec = to_filter_spec(filter_param, filter_value)
+        statement, params = compile_filter(self.mapper, spec)
         try:
-            instances = (
-                self.session.query(self.model)
-                .filter_by(**{filter_param: filter_value})
-                .all()
+            rows = self.session.execute(statement, params).all()
+            if rows:
+                message = (
+                    f"Retrieved instances of {self.model.__name__} model with {spec}."
+                )
+                logger.info(message)
+                return self.mapper.to_dicts(rows)
+            else:
+                message = (
+                    f"No instances found for {self.model.__name__} model with {spec}."
+                )
+                logger.info(message)
+                return None
+        except SQLAlchemyError as e:
+            self.session.rollback()
+            error_message = (
+                f"Failed to retrieve instances of {self.model.__name__}: {str(e)}"
             )
+            logger.error(error_message)
+            raise ValueError(error_message)
+
+    @check_session
+    def get_all_with_relationships(
+        self,
+        relationship_names: Iterable[str],
+        filter_param: Optional[str] = None,
+        filter_value: Any = None,
+        strategies: Optional[Dict[str, LoadStrategy]] = None,
+    ) -> Optional[List[Dict[str, Any]]]:
+        relationships = get_relationships(self.model, relationship_names)
+        statement = select(self.model).options(
+            *build_loader_options(
+                relationships, {**self.load_strategies, **(strategies or {})}
+            )
+        )
+        if filter_param is not None:
+            statement = statement.filter_by(**{filter_param: filter_value})
+        try:
+            instances = self.session.execute(statement).unique().scalars().all()
             if instances:
-                message = f"Retrieved instances of {self.model.__name__} model with {filter_param}={filter_value}."
+                message = f"Retrieved instances of {self.model.__name__} model with {', '.join(relationship.key for relationship in relationships)}."
                 logger.info(message)
-                instances_list = []
-                for instance in instances:
-                    instance_dict = {
-                        column.name: getattr(instance, column.name)
-                        for column in instance.__table__.columns
-                    }
-                    instances_list.append(instance_dict)
-                return instances_list
+                return [
+                    to_related_dict(self.mapper, instance, relationships)
+                    for instance in instances
+                ]
             else:
-                message = f"No instances found for {self.model.__name__} model with {filter_param}={filter_value}."
+                message = f"No instances found for {self.model.__name__} model."
                 logger.info(message)
                 return None
+        except SQLAlchemyError as e:
+            self.session.rollback()
+            error_message = f"Failed to retrieve instances of {self.model.__name__} model with relationships: {str(e)}"
+            logger.error(error_message)
+            raise ValueError(error_message)
+
+    @check_session
+    def paginate(
+        self,
+        filters: Optional[Dict[str, Any]] = None,
+        order_by: Iterable[str] = ("id",),
+        after: Optional[str] = None,
+        limit: int = DEFAULT_PAGE_SIZE,
+        descending: bool = False,
+    ) -> Page:
+        if limit < 1:
+            error_message = f"Page size must be a positive integer, got {limit}"
+            logger.error(error_message)
+            raise ValueError(error_message)
+        filters = filters or {}
+        check_field_names(self.mapper, filters)
+        columns = get_order_columns(self.mapper, order_by)
+        after_values = decode_cursor(after, columns) if after is not None else None
+        statement = keyset_statement(
+            self.mapper, filters, columns, after_values, limit, descending
+        )
+        try:
+            rows = self.session.execute(statement).all()
+            items = self.mapper.to_dicts(rows[:limit])
+            next_cursor = (
+                encode_cursor(columns, items[-1]) if len(rows) > limit else None
+            )
+            message = f"Retrieved a page of {len(items)} instances of {self.model.__name__} model"
+            logger.info(message)
+            return Page(items, next_cursor)
         except SQLAlchemyError as e:
             self.session.rollback()
             error_message = (
-                f"Failed to retrieve instances of {self.model.__name__}: {str(e)}"
+                f"Failed to paginate instances of {self.model.__name__} model: {str(e)}"
             )
             logger.error(error_message)
             raise ValueError(error_message)
 
+    @check_session
+    def iter_all(self, chunk_size: int = 1000) -> Iterator[Dict[str, Any]]:
+        return self._iter_rows(self.mapper.statement, chunk_size)
+
+    @check_session
+    def iter_by_filter(
+        self,
+        filter_param: Union[str, FilterSpec],
+        filter_value: Any = None,
+        chunk_size: int = 1000,
+    ) -> Iterator[Dict[str, Any]]:
+        spec = to_filter_spec(filter_param, filter_value)
+        statement, params = compile_filter(self.mapper, spec)
+        return self._iter_rows(statement, chunk_size, params)
+
     @check_session
     def filter_by(
-        self, filter_param: str, filter_value: Any
+        self, filter_param: Union[str, FilterSpec], filter_value: Any = None
     ) -> Optional[Dict[str, Any]]:
+        spec = to_filter_spec(filter_param, filter_value)
         try:
-            instance = (
-                self.session.query(self.model)
-                .filter_by(**{filter_param: filter_value})
-                .first()
-            )
-            if instance:
-                message = f"Retrieved an instance of {self.model.__name__} model with {filter_param}={filter_value}."
+            row = self._first_row(spec)
+            if row:
+                message = (
+                    f"Retrieved an instance of {self.model.__name__} model with {spec}."
+                )
                 logger.info(message)
-                instance_dict = {
-                    column.name: getattr(instance, column.name)
-                    for column in instance.__table__.columns
-                }
-                return instance_dict
+                return self.mapper.to_dict(row)
             else:
-                error_message = f"No instance found for {self.model.__name__} model with {filter_param}={filter_value}"
+                error_message = (
+                    f"No instance found for {self.model.__name__} model with {spec}"
+                )
                 logger.error(error_message)
                 return None
         except SQLAlchemyError as e:
@@ -157,19 +449,45 @@ class BaseActions:
             raise ValueError(error_message)
 
     @check_session
-    def get_random(self) -> Optional[Dict[str, Any]]:
+    def get_cached(self, primary_key_value: Any) -> Optional[Dict[str, Any]]:
+        cache = get_reference_cache(self.model, self.session)
+        cached = cache.get(primary_key_value) if cache is not None else None
+        if cached is not None:
+            message = f"Retrieved a cached instance of {self.model.__name__} model with {self.mapper.primary_key.name}={primary_key_value}."
+            logger.info(message)
+            return cached
+        instance = self.filter_by(self.mapper.primary_key.name, primary_key_value)
+        if cache is not None and instance is not None:
+            fill_reference_cache(self.session, self.model, primary_key_value, instance)
+        return instance
+
+    @check_session
+    def warm_cache(self) -> int:
+        cache = get_reference_cache(self.model, self.session)
+        if cache is None:
+            error_message = (
+                f"The {self.model.__name__} model is not a cached reference model"
+            )
+            logger.error(error_message)
+            raise ValueError(error_message)
+        if has_pending_writes(self.session, self.model):
+            error_message = f"Cannot warm the {self.model.__name__} cache with uncommitted changes; commit first"
+            logger.error(error_message)
+            raise ValueError(error_message)
+        return cache.warm(self.get_all() or [])
+
+    @check_session
+    def get_random(
+        self, strategy: Optional[SamplingStrategy] = None
+    ) -> Optional[Dict[str, Any]]:
         try:
-            random_instance = (
-                self.session.query(self.model).order_by(func.random()).first()
+            random_row = sample_row(
+                self.session, self.model, strategy or self.sampling_strategy
             )
-            if random_instance:
+            if random_row:
                 message = f"Retrieved a random instance of {self.model.__name__} model"
                 logger.info(message)
-                random_dict = {
-                    column.name: getattr(random_instance, column.name)
-                    for column in random_instance.__table__.columns
-                }
-                return random_dict
+                return self.mapper.to_dict(random_row)
             else:
                 error_message = f"No instance found for {self.model.__name__} model"
                 logger.error(error_message)
@@ -185,13 +503,9 @@ class BaseActions:
         self, filter_param: str, filter_value: Any, field_name: str
     ) -> Any:
         try:
-            instance = (
-                self.session.query(self.model)
-                .filter_by(**{filter_param: filter_value})
-                .first()
-            )
-            if instance:
-                field_value = getattr(instance, field_name)
+            row = self._first_row(filter_param, filter_value, field_name)
+            if row:
+                field_value = row[0]
                 if field_value:
                     message = (
                         f"Retrieved the value of the instance field '{field_name}'"
@@ -225,25 +539,16 @@ class BaseActions:
         self, filter_param: str, filter_value: Any, field_name: str, field_value: Any
     ) -> Dict[str, Any]:
         try:
-            instance = (
-                self.session.query(self.model)
-                .filter_by(**{filter_param: filter_value})
-                .first()
-            )
-            if instance:
-                if hasattr(instance, field_name):
-                    setattr(instance, field_name, field_value)
-                    self.session.commit()
+            row = self._first_row(filter_param, filter_value)
+            if row:
+                if field_name in self.mapper.keys:
+                    updated_row = self._update_row(row, {field_name: field_value})
                     message = (
                         f"Updated the field '{field_name}'"
                         f"for {self.model.__name__} with {filter_param}={filter_value}."
                     )
                     logger.info(message)
-                    instance_dict = {
-                        column.name: getattr(instance, column.name)
-                        for column in instance.__table__.columns
-                    }
-                    return instance_dict
+                    return self.mapper.to_dict(updated_row)
                 else:
                     error_message = (
                         f"The instance of {self.model.__name__} model"
@@ -266,33 +571,23 @@ class BaseActions:
         self, filter_param: str, filter_value: Any, updated_data: Dict[str, Any]
     ) -> Dict[str, Any]:
         try:
-            instance = (
-                self.session.query(self.model)
-                .filter_by(**{filter_param: filter_value})
-                .first()
-            )
-            if instance:
-                for field_name, field_value in updated_data.items():
-                    if hasattr(instance, field_name):
-                        setattr(instance, field_name, field_value)
-                    else:
+            row = self._first_row(filter_param, filter_value)
+            if row:
+                for field_name in updated_data:
+                    if field_name not in self.mapper.keys:
                         error_message = (
                             f"The model {self.model.__name__} model"
                             f"does not have a field named {field_name}"
                         )
                         logger.error(error_message)
                         raise ValueError(error_message)
-                self.session.commit()
+                updated_row = self._update_row(row, updated_data)
                 message = (
                     f"Updated multiple fields for {self.model.__name__} model"
                     f"with {filter_param}={filter_value}."
                 )
                 logger.info(message)
-                instance_dict = {
-                    column.name: getattr(instance, column.name)
-                    for column in instance.__table__.columns
-                }
-                return instance_dict
+                return self.mapper.to_dict(updated_row)
             else:
                 error_message = f"No instance found for {self.model.__name__} model with {filter_param}={filter_value}"
                 logger.error(error_message)
@@ -304,13 +599,65 @@ class BaseActions:
             raise ValueError(error_message)
 
     @check_session
-    def delete(self, filter_param: str, filter_value: Any) -> str:
+    def update_where(
+        self, filters: Dict[str, Any], values: Dict[str, Any], allow_all: bool = False
+    ) -> int:
+        check_filters(self.mapper, filters, "update", allow_all)
+        if not values:
+            error_message = f"No values to update for {self.model.__name__} model"
+            logger.error(error_message)
+            raise ValueError(error_message)
+        check_field_names(self.mapper, values)
+        statement = update(self.mapper.table).filter_by(**filters).values(**values)
+        try:
+            result = self.session.execute(statement)
+            updated_count = result.rowcount
+            self.session.commit()
+            message = f"Updated {updated_count} instances of {self.model.__name__} model with {filters}."
+            logger.info(message)
+            return updated_count
+        except SQLAlchemyError as e:
+            self.session.rollback()
+            error_message = f"Failed to update instances of {self.model.__name__} model with {filters}: {str(e)}"
+            logger.error(error_message)
+            raise ValueError(error_message)
+
+    @check_session
+    def bulk_update_rows(
+        self, rows: Iterable[Dict[str, Any]], batch_size: int = 1000
+    ) -> int:
+        if batch_size < 1:
+            error_message = f"Batch size must be a positive integer, got {batch_size}"
+            logger.error(error_message)
+            raise ValueError(error_message)
+        updated = 0
         try:
-            instance = (
-                self.session.query(self.model)
-                .filter_by(**{filter_param: filter_value})
-                .first()
+            for batch in batched(rows, batch_size):
+                start_batch()
+                batch_updated = 0
+                for field_names, group in group_update_rows(self.mapper, batch).items():
+                    result = self.session.execute(
+                        self.mapper.bulk_update_statement(field_names, group)
+                    )
+                    batch_updated += result.rowcount
+                self.session.commit()
+                updated += batch_updated
+            message = f"Updated {updated} instances of {self.model.__name__} model"
+            logger.info(message)
+            return updated
+        except SQLAlchemyError as e:
+            self.session.rollback()
+            error_message = (
+                f"Failed to update instances of {self.model.__name__} model "
+                f"after {updated} committed rows: {str(e)}"
             )
+            logger.error(error_message)
+            raise ValueError(error_message)
+
+    @check_session
+    def delete(self, filter_param: str, filter_value: Any) -> str:
+        try:
+            instance = self._first_instance(filter_param, filter_value)
             if instance:
                 self.session.delete(instance)
                 self.session.commit()
@@ -346,38 +693,119 @@ class BaseActions:
             logger.error(error_message)
             raise ValueError(error_message)
 
+    @check_session
+    def delete_where(
+        self, filters: Dict[str, Any], allow_all: bool = False
+    ) -> List[Any]:
+        check_filters(self.mapper, filters, "delete", allow_all)
+        statement = (
+            delete(self.mapper.table)
+            .filter_by(**filters)
+            .returning(self.mapper.primary_key)
+        )
+        try:
+            deleted_ids = list(self.session.execute(statement).scalars().all())
+            self.session.commit()
+            message = f"Deleted {len(deleted_ids)} instances of {self.model.__name__} model with {filters}."
+            logger.info(message)
+            if len(deleted_ids) > DELETE_WHERE_WARNING_ROWS:
+                logger.warning(
+                    f"delete_where held all {len(deleted_ids)} deleted ids of {self.model.__name__} model "
+                    f"in memory, use delete_in_chunks for large deletes."
+                )
+            return deleted_ids
+        except IntegrityError:
+            self.session.rollback()
+            error_message = "Cannot delete the instances due to integrity constraints."
+            logger.error(error_message)
+            raise ValueError(error_message)
+        except SQLAlchemyError as e:
+            self.session.rollback()
+            error_message = f"Failed to delete instances of {self.model.__name__} model with {filters}: {str(e)}"
+            logger.error(error_message)
+            raise ValueError(error_message)
+
+    @check_session
+    def delete_in_chunks(
+        self,
+        filters: Optional[Dict[str, Any]] = None,
+        chunk_size: int = 10_000,
+        pause: float = 0.0,
+        allow_all: bool = False,
+    ) -> DeleteReport:
+        if chunk_size < 1:
+            error_message = f"Chunk size must be a positive integer, got {chunk_size}"
+            logger.error(error_message)
+            raise ValueError(error_message)
+        filters = filters or {}
+        check_filters(self.mapper, filters, "delete", allow_all)
+        primary_key = self.mapper.primary_key
+        statement = self.mapper.delete_chunk_statement(filters, chunk_size)
+        report = DeleteReport(self.mapper.table.name, 0, 0, 0.0, 0.0)
+        started_at = time.perf_counter()
+        try:
+            first_id = self.session.execute(
+                select(func.min(primary_key)).filter_by(**filters)
+            ).scalar()
+            last_id = first_id - 1 if first_id is not None else None
+            while last_id is not None:
+                start_batch()
+                chunk_started_at = time.perf_counter()
+                deleted_count, max_id = self.session.execute(
+                    statement, {"last_id": last_id}
+                ).one()
+                self.session.commit()
+                if not deleted_count:
+                    break
+                last_id = max_id
+                report.rows += deleted_count
+                report.chunks += 1
+                report.longest_chunk = max(
+                    report.longest_chunk, time.perf_counter() - chunk_started_at
+                )
+                if deleted_count < chunk_size:
+                    break
+                if pause:
+                    time.sleep(pause)
+            report.elapsed = time.perf_counter() - started_at
+            message = (
+                f"Deleted {report.rows} instances of {self.model.__name__} model in "
+                f"{report.chunks} chunks ({report.rows_per_second:.0f} rows/sec)"
+            )
+            logger.info(message)
+            return report
+        except IntegrityError:
+            self.session.rollback()
+            error_message = (
+                f"Cannot delete the instances due to integrity constraints "
+                f"after {report.rows} committed rows."
+            )
+            logger.error(error_message)
+            raise ValueError(error_message)
+        except SQLAlchemyError as e:
+            self.session.rollback()
+            error_message = (
+                f"Failed to delete instances of {self.model.__name__} model "
+                f"after {report.rows} committed rows: {str(e)}"
+            )
+            logger.error(error_message)
+            raise ValueError(error_message)
+
     @check_session
     def get_relationship(
         self, filter_param: str, filter_value: Any, relationship_name: str
     ) -> Optional[Any]:
         try:
-            instance = (
-                self.session.query(self.model)
-                .filter_by(**{filter_param: filter_value})
-                .first()
-            )
-            if instance:
-                relationship = getattr(instance, relationship_name, None)
+            row = self._first_row(filter_param, filter_value)
+            if row:
+                relationship = self.mapper.get_relationship(relationship_name)
+                related = None
                 if relationship is not None:
-                    if isinstance(relationship, list):
-                        related_instances = []
-                        for related_instance in relationship:
-                            related_dict = {
-                                column.name: getattr(related_instance, column.name)
-                                for column in related_instance.__table__.columns
-                            }
-                            related_instances.append(related_dict)
-                        message = f"Retrieved {relationship_name} for {self.model.__name__} instance."
-                        logger.info(message)
-                        return related_instances
-                    elif relationship is not None:
-                        related_instance = {
-                            column.name: getattr(relationship, column.name)
-                            for column in relationship.__table__.columns
-                        }
-                        message = f"Retrieved {relationship_name} for {self.model.__name__} instance."
-                        logger.info(message)
-                        return related_instance
+                    related = self._load_relationship(relationship, row)
+                if related is not None:
+                    message = f"Retrieved {relationship_name} for {self.model.__name__} instance."
+                    logger.info(message)
+                    return related
                 else:
                     message = f"No relationship found for {self.model.__name__} model with name {relationship_name}."
                     logger.info(message)
@@ -395,6 +823,21 @@ class BaseActions:
             logger.error(error_message)
             raise ValueError(error_message)
 
+    @check_session
+    def get_relationship_many(
+        self, parent_ids: Iterable[Any], relationship_name: str, chunk_size: int = 1000
+    ) -> Dict[Any, Optional[List[Dict[str, Any]] | Dict[str, Any]]]:
+        return dict(
+            self.iter_relationship_many(parent_ids, relationship_name, chunk_size)
+        )
+
+    @check_session
+    def iter_relationship_many(
+        self, parent_ids: Iterable[Any], relationship_name: str, chunk_size: int = 1000
+    ) -> Iterator[Tuple[Any, Optional[List[Dict[str, Any]] | Dict[str, Any]]]]:
+        relationship = get_relationships(self.model, [relationship_name])[0]
+        return self._iter_relationship_many(relationship, parent_ids, chunk_size)
+
     @check_session
     def execute_query(self, query: Executable) -> Result:
         try:
@@ -408,6 +851,111 @@ class BaseActions:
             logger.error(error_message)
             raise ValueError(error_message)
 
+    def _first_row(
+        self,
+        filter_param: Union[str, FilterSpec],
+        filter_value: Any = None,
+        field_name: Optional[str] = None,
+    ) -> Optional[Row]:
+        spec = to_filter_spec(filter_param, filter_value).take(1)
+        statement, params = compile_filter(self.mapper, spec, field_name)
+        return self.session.execute(statement, params).first()
+
+    def _first_instance(self, filter_param: str, filter_value: Any) -> Optional[Base]:
+        spec = to_filter_spec(filter_param, filter_value).take(1)
+        statement, params = compile_filter(self.mapper, spec, self.model)
+        return self.session.execute(statement, params).scalars().first()
+
+    def _update_row(self, row: Row, values: Dict[str, Any]) -> Row:
+        statement = self.statements.update_statement(tuple(values))
+        params = self.statements.update_params(
+            row._mapping[self.mapper.primary_key], values
+        )
+        updated_row = self.session.execute(statement, params).one()
+        self.session.commit()
+        return updated_row
+
+    def _load_relationship(
+        self, relationship: RelationshipProperty, row: Row
+    ) -> Optional[List[Dict[str, Any]] | Dict[str, Any]]:
+        key_column = reference_key_column(relationship)
+        if key_column is not None:
+            return self._load_reference(relationship, row._mapping[key_column])
+        related_mapper = get_row_mapper(relationship.mapper.class_)
+        related_rows = self.session.execute(
+            self.mapper.relationship_statement(relationship.key),
+            {"parent_id": row._mapping[self.mapper.primary_key]},
+        ).all()
+        if relationship.uselist:
+            return related_mapper.to_dicts(related_rows)
+        return related_mapper.to_dict(related_rows[0]) if related_rows else None
+
+    def _load_reference(
+        self, relationship: RelationshipProperty, key: Any
+    ) -> Optional[Dict[str, Any]]:
+        if key is None:
+            return None
+        cache = get_reference_cache(relationship.mapper.class_, self.session)
+        related = cache.get(key)
+        if related is None:
+            related_mapper = get_row_mapper(relationship.mapper.class_)
+            spec = FilterSpec.equals(related_mapper.primary_key.name, key).take(1)
+            row = self.session.execute(*compile_filter(related_mapper, spec)).first()
+            if row is None:
+                return None
+            related = related_mapper.to_dict(row)
+            fill_reference_cache(self.session, relationship.mapper.class_, key, related)
+        return related
+
+    def _iter_relationship_many(
+        self,
+        relationship: RelationshipProperty,
+        parent_ids: Iterable[Any],
+        chunk_size: int,
+    ) -> Iterator[Tuple[Any, Optional[List[Dict[str, Any]] | Dict[str, Any]]]]:
+        statement = self.mapper.relationship_many_statement(relationship.key)
+        loaded = 0
+        try:
+            for batch in batched(parent_ids, chunk_size):
+                start_batch()
+                rows = self.session.execute(statement, {"parent_ids": batch}).all()
+                yield from self.mapper.group_related(relationship, batch, rows)
+                loaded += len(batch)
+            message = f"Retrieved {relationship.key} for {loaded} instances of {self.model.__name__} model"
+            logger.info(message)
+        except SQLAlchemyError as e:
+            self.session.rollback()
+            error_message = f"Failed to retrieve relationship {relationship.key} for {self.model.__name__} model: {str(e)}"
+            logger.error(error_message)
+            raise ValueError(error_message)
+
+    def _iter_rows(
+        self,
+        statement: Select,
+        chunk_size: int,
+        params: Optional[Dict[str, Any]] = None,
+    ) -> Iterator[Dict[str, Any]]:
+        streamed = 0
+        try:
+            result = self.session.execute(
+                statement.execution_options(yield_per=chunk_size), params
+            )
+            try:
+                for partition in result.partitions():
+                    streamed += len(partition)
+                    yield from self.mapper.to_dicts(partition)
+            finally:
+                result.close()
+            message = f"Streamed {streamed} instances of {self.model.__name__} model"
+            logger.info(message)
+        except SQLAlchemyError as e:
+            self.session.rollback()
+            error_message = (
+                f"Failed to stream instances of {self.model.__name__} model: {str(e)}"
+            )
+            logger.error(error_message)
+            raise ValueError(error_message)
+
     def _check_session(self) -> None:
         if self.session is None:
             error_message = "No session provided. You must pass a valid session to perform database operations."
@@ -0,0 +1,201 @@
+from dataclasses import dataclass, replace
+from enum import Enum
+from typing import Any, Callable, Dict, Optional, Tuple, Type, Union
+
+from sqlalchemy import (Column, ColumnElement, Integer, Select, bindparam,
+                        select)
+
+from src.db.models import Base
+from src.logger.logger import logger
+from tests.actions.mappers import RowMapper
+from tests.actions.statements import get_statement_registry
+
+
+class FilterOperator(Enum):
+    EQ = "="
+    NE = "!="
+    LT = "<"
+    LE = "<="
+    GT = ">"
+    GE = ">="
+    IN = "in"
+    NOT_IN = "not in"
+    BETWEEN = "between"
+    LIKE = "like"
+    IS_NULL = "is null"
+    IS_NOT_NULL = "is not null"
+
+
+predicate_builders: Dict[FilterOperator, Callable[[Column, str], ColumnElement]] = {
+    FilterOperator.EQ: lambda column, name: column
+    == bindparam(name, type_=column.type),
+    FilterOperator.NE: lambda column, name: column
+    != bindparam(name, type_=column.type),
+    FilterOperator.LT: lambda column, name: column < bindparam(name, type_=column.type),
+    FilterOperator.LE: lambda column, name: column
+    <= bindparam(name, type_=column.type),
+    FilterOperator.GT: lambda column, name: column > bindparam(name, type_=column.type),
+    FilterOperator.GE: lambda column, name: column
+    >= bindparam(name, type_=column.type),
+    FilterOperator.IN: lambda column, name: column.in_(
+        bindparam(name, type_=column.type, expanding=True)
+    ),
+    FilterOperator.NOT_IN: lambda column, name: column.not_in(
+        bindparam(name, type_=column.type, expanding=True)
+    ),
+    FilterOperator.BETWEEN: lambda column, name: column.between(
+        bindparam(f"{name}_low", type_=column.type),
+        bindparam(f"{name}_high", type_=column.type),
+    ),
+    FilterOperator.LIKE: lambda column, name: column.like(
+        bindparam(name, type_=column.type)
+    ),
+    FilterOperator.IS_NULL: lambda column, name: column.is_(None),
+    FilterOperator.IS_NOT_NULL: lambda column, name: column.is_not(None),
+}
+
+
+@dataclass(frozen=True)
+class Predicate:
+    field: str
+    operator: FilterOperator
+    value: Any = None
+
+    def params(self, name: str) -> Dict[str, Any]:
+        if self.operator in (FilterOperator.IS_NULL, FilterOperator.IS_NOT_NULL):
+            return {}
+        if self.operator == FilterOperator.BETWEEN:
+            low, high = self.value
+            return {f"{name}_low": low, f"{name}_high": high}
+        if self.operator in (FilterOperator.IN, FilterOperator.NOT_IN):
+            return {name: list(self.value)}
+        return {name: self.value}
+
+    def __str__(self) -> str:
+        if self.operator == FilterOperator.EQ:
+            return f"{self.field}={self.value}"
+        if self.operator in (FilterOperator.IS_NULL, FilterOperator.IS_NOT_NULL):
+            return f"{self.field} {self.operator.value}"
+        return f"{self.field} {self.operator.value} {self.value}"
+
+
+@dataclass(frozen=True)
+class FilterSpec:
+    predicates: Tuple[Predicate, ...] = ()
+    order_by: Tuple[Tuple[str, bool], ...] = ()
+    limit: Optional[int] = None
+
+    @classmethod
+    def equals(cls, field: str, value: Any) -> "FilterSpec":
+        if value is None:
+            return cls((Predicate(field, FilterOperator.IS_NULL),))
+        return cls((Predicate(field, FilterOperator.EQ, value),))
+
+    def where(
+        self,
+        field: str,
+        operator: FilterOperator = FilterOperator.EQ,
+        value: Any = None,
+    ) -> "FilterSpec":
+        return replace(
+            self, predicates=self.predicates + (Predicate(field, operator, value),)
+        )
+
+    def order(self, field: str, descending: bool = False) -> "FilterSpec":
+        return replace(self, order_by=self.order_by + ((field, descending),))
+
+    def take(self, limit: int) -> "FilterSpec":
+        return replace(self, limit=limit)
+
+    @property
+    def field_names(self) -> Tuple[str, ...]:
+        return tuple(predicate.field for predicate in self.predicates) + tuple(
+            field for field, _ in self.order_by
+        )
+
+    @property
+    def shape(self) -> Tuple[Any, ...]:
+        return (
+            tuple(
+                (predicate.field, predicate.operator) for predicate in self.predicates
+            ),
+            self.order_by,
+            self.limit is not None,
+        )
+
+    def params(self) -> Dict[str, Any]:
+        params = {}
+        for index, predicate in enumerate(self.predicates):
+            params.update(predicate.params(f"p{index}"))
+        if self.limit is not None:
+            params["limit"] = self.limit
+        return params
+
+    def __str__(self) -> str:
+        return " and ".join(str(predicate) for predicate in self.predicates)
+
+
+def to_filter_spec(
+    filter_param: Union[str, FilterSpec], filter_value: Any = None
+) -> FilterSpec:
+    if isinstance(filter_param, FilterSpec):
+        return filter_param
+    return FilterSpec.equals(filter_param, filter_value)
+
+
+Selection = Optional[Union[str, Type[Base]]]
+
+
+def selection_statement(mapper: RowMapper, selection: Selection) -> Select:
+    if selection is None:
+        return mapper.statement
+    if isinstance(selection, str):
+        return select(mapper.table.c[selection])
+    return select(selection)
+
+
+def build_filter_statement(
+    mapper: RowMapper, shape: Tuple[Any, ...], selection: Selection = None
+) -> Select:
+    predicates, order_by, limited = shape
+    statement = selection_statement(mapper, selection).where(
+        *(
+            predicate_builders[operator](mapper.table.c[field], f"p{index}")
+            for index, (field, operator) in enumerate(predicates)
+        )
+    )
+    if order_by:
+        statement = statement.order_by(
+            *(
+                mapper.table.c[field].desc()
+                if descending
+                else mapper.table.c[field].asc()
+                for field, descending in order_by
+            )
+        )
+    if limited:
+        statement = statement.limit(bindparam("limit", type_=Integer))
+    return statement
+
+
+def compile_filter(
+    mapper: RowMapper, spec: FilterSpec, selection: Selection = None
+) -> Tuple[Select, Dict[str, Any]]:
+    field_names = spec.field_names + (
+        (selection,) if isinstance(selection, str) else ()
+    )
+    unknown_fields = [name for name in field_names if name not in mapper.keys]
+    if unknown_fields:
+        error_message = f"Cannot filter {mapper.model.__name__} model by unknown fields {', '.join(unknown_fields)}"
+        logger.error(error_message)
+        raise ValueError(error_message)
+    if spec.limit is not None and spec.limit < 1:
+        error_message = f"Filter limit must be a positive integer, got {spec.limit}"
+        logger.error(error_message)
+        raise ValueError(error_message)
+    shape = spec.shape
+    statement = get_statement_registry(mapper.model).get(
+        ("filter", shape, selection),
+        lambda: build_filter_statement(mapper, shape, selection),
+    )
+    return statement, spec.params()
@@ -0,0 +1,76 @@
+from enum import Enum
+from typing import Any, Callable, Dict, Iterable, List, Optional, Type
+
+from sqlalchemy.orm import (RelationshipProperty, joinedload, lazyload,
+                            raiseload, selectinload)
+from sqlalchemy.orm.interfaces import LoaderOption
+
+from src.db.models import Base
+from src.logger.logger import logger
+from tests.actions.mappers import RowMapper, get_row_mapper
+
+
+class LoadStrategy(Enum):
+    LAZY = "lazy"
+    SELECTIN = "selectin"
+    JOINED = "joined"
+    RAISE = "raise"
+
+
+loaders: Dict[LoadStrategy, Callable[[Any], LoaderOption]] = {
+    LoadStrategy.LAZY: lazyload,
+    LoadStrategy.SELECTIN: selectinload,
+    LoadStrategy.JOINED: joinedload,
+    LoadStrategy.RAISE: raiseload,
+}
+
+
+def default_load_strategy(relationship: RelationshipProperty) -> LoadStrategy:
+    return LoadStrategy.SELECTIN if relationship.uselist else LoadStrategy.JOINED
+
+
+def get_relationships(
+    model: Type[Base], relationship_names: Iterable[str]
+) -> List[RelationshipProperty]:
+    mapper = get_row_mapper(model)
+    relationships = []
+    for relationship_name in relationship_names:
+        relationship = mapper.get_relationship(relationship_name)
+        if relationship is None:
+            error_message = f"No relationship found for {model.__name__} model with name {relationship_name}"
+            logger.error(error_message)
+            raise ValueError(error_message)
+        relationships.append(relationship)
+    return relationships
+
+
+def build_loader_options(
+    relationships: List[RelationshipProperty],
+    strategies: Dict[str, LoadStrategy],
+) -> List[LoaderOption]:
+    options = [
+        loaders[
+            strategies.get(relationship.key) or default_load_strategy(relationship)
+        ](relationship.class_attribute)
+        for relationship in relationships
+    ]
+    options.append(raiseload("*"))
+    return options
+
+
+def to_related_dict(
+    mapper: RowMapper, instance: Base, relationships: List[RelationshipProperty]
+) -> Dict[str, Any]:
+    data = mapper.from_instance(instance)
+    for relationship in relationships:
+        related_mapper = get_row_mapper(relationship.mapper.class_)
+        related: Optional[Any] = getattr(instance, relationship.key)
+        if relationship.uselist:
+            data[relationship.key] = [
+                related_mapper.from_instance(item) for item in related
+            ]
+        else:
+            data[relationship.key] = (
+                related_mapper.from_instance(related) if related is not None else None
+            )
+    return data
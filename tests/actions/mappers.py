@@ -0,0 +1,172 @@
+from functools import cache
+from operator import attrgetter
+from typing import (Any, Dict, Iterable, Iterator, List, Optional, Sequence,
+                    Tuple, Type)
+
+from sqlalchemy import (CTE, Boolean, Executable, Insert, Select, Update, any_,
+                        bindparam, cast, column, delete, func, literal_column,
+                        select, update, values)
+from sqlalchemy.dialects.postgresql import ARRAY, insert
+from sqlalchemy.orm import RelationshipProperty
+from sqlalchemy.sql.dml import UpdateBase
+
+from src.db.models import Base
+
+
+class RowMapper:
+    def __init__(self, model: Type[Base]) -> None:
+        self.model = model
+        self.table = model.__table__
+        self.columns = tuple(self.table.columns)
+        self.keys: Tuple[str, ...] = tuple(column.name for column in self.columns)
+        self.primary_key = self.table.primary_key.columns[0]
+        self.statement: Select = select(*self.columns)
+        attribute_keys = [
+            model.__mapper__.get_property_by_column(column).key
+            for column in self.columns
+        ]
+        self._get_attributes = attrgetter(*attribute_keys)
+        self._relationship_statements: Dict[str, Select] = {}
+        self._relationship_many_statements: Dict[str, Select] = {}
+        self._upsert_statements: Dict[
+            Tuple[Tuple[str, ...], Tuple[str, ...]], Insert
+        ] = {}
+
+    def to_dict(self, row: Sequence[Any]) -> Dict[str, Any]:
+        return dict(zip(self.keys, row))
+
+    def to_dicts(self, rows: Iterable[Sequence[Any]]) -> List[Dict[str, Any]]:
+        keys = self.keys
+        return [dict(zip(keys, row)) for row in rows]
+
+    def from_instance(self, instance: Base) -> Dict[str, Any]:
+        values = self._get_attributes(instance)
+        if len(self.keys) == 1:
+            values = (values,)
+        return dict(zip(self.keys, values))
+
+    def get_relationship(
+        self, relationship_name: str
+    ) -> Optional[RelationshipProperty]:
+        return self.model.__mapper__.relationships.get(relationship_name)
+
+    def relationship_statement(self, relationship_name: str) -> Select:
+        statement = self._relationship_statements.get(relationship_name)
+        if statement is None:
+            relationship = self.get_relationship(relationship_name)
+            related_mapper = get_row_mapper(relationship.mapper.class_)
+            statement = (
+                select(*related_mapper.columns)
+                .select_from(self.model)
+                .join(getattr(self.model, relationship_name))
+                .where(self.primary_key == bindparam("parent_id"))
+            )
+            self._relationship_statements[relationship_name] = statement
+        return statement
+
+    def relationship_many_statement(self, relationship_name: str) -> Select:
+        statement = self._relationship_many_statements.get(relationship_name)
+        if statement is None:
+            relationship = self.get_relationship(relationship_name)
+            related_mapper = get_row_mapper(relationship.mapper.class_)
+            parent_ids = bindparam("parent_ids", type_=ARRAY(self.primary_key.type))
+            statement = (
+                select(self.primary_key, *related_mapper.columns)
+                .select_from(self.model)
+                .join(getattr(self.model, relationship_name))
+                .where(self.primary_key == any_(parent_ids))
+            )
+            self._relationship_many_statements[relationship_name] = statement
+        return statement
+
+    def group_related(
+        self,
+        relationship: RelationshipProperty,
+        parent_ids: List[Any],
+        rows: Iterable[Sequence[Any]],
+    ) -> Iterator[Tuple[Any, Optional[List[Dict[str, Any]] | Dict[str, Any]]]]:
+        related_mapper = get_row_mapper(relationship.mapper.class_)
+        children: Dict[Any, List[Sequence[Any]]] = {}
+        for row in rows:
+            children.setdefault(row[0], []).append(row[1:])
+        for parent_id in parent_ids:
+            related_rows = children.get(parent_id, [])
+            if relationship.uselist:
+                yield parent_id, related_mapper.to_dicts(related_rows)
+            else:
+                yield parent_id, (
+                    related_mapper.to_dict(related_rows[0]) if related_rows else None
+                )
+
+    def bulk_update_statement(
+        self, field_names: Tuple[str, ...], rows: List[Dict[str, Any]]
+    ) -> Update:
+        key = self.primary_key.name
+        names = (key, *field_names)
+        data = values(
+            *(column(name, self.table.c[name].type) for name in names), name="data"
+        ).data([tuple(row[name] for name in names) for row in rows])
+        return (
+            update(self.table)
+            .where(self.primary_key == cast(data.c[key], self.primary_key.type))
+            .values(
+                {
+                    name: cast(data.c[name], self.table.c[name].type)
+                    for name in field_names
+                }
+            )
+        )
+
+    def delete_chunk_statement(
+        self, filters: Dict[str, Any], chunk_size: int
+    ) -> Select:
+        chunk_ids = (
+            select(self.primary_key)
+            .filter_by(**filters)
+            .where(self.primary_key > bindparam("last_id"))
+            .order_by(self.primary_key)
+            .limit(chunk_size)
+        )
+        deleted = (
+            delete(self.table)
+            .where(self.primary_key.in_(chunk_ids.scalar_subquery()))
+            .returning(self.primary_key)
+            .cte("deleted")
+        )
+        deleted_id = deleted.c[self.primary_key.name]
+        return select(func.count(deleted_id), func.max(deleted_id))
+
+    def upsert_statement(
+        self, conflict_columns: Tuple[str, ...], update_columns: Tuple[str, ...]
+    ) -> Insert:
+        key = (conflict_columns, update_columns)
+        statement = self._upsert_statements.get(key)
+        if statement is None:
+            statement = insert(self.table)
+            statement = statement.on_conflict_do_update(
+                index_elements=conflict_columns,
+                set_={name: statement.excluded[name] for name in update_columns},
+            ).returning(
+                self.primary_key,
+                literal_column("xmax = 0", Boolean).label("inserted"),
+                *(self.table.c[name] for name in conflict_columns),
+            )
+            self._upsert_statements[key] = statement
+        return statement
+
+
+@cache
+def get_row_mapper(model: Type[Base]) -> RowMapper:
+    return RowMapper(model)
+
+
+def get_dml_statement(statement: Executable) -> Optional[UpdateBase]:
+    if isinstance(statement, UpdateBase):
+        return statement
+    if isinstance(statement, Select):
+        for from_clause in statement.get_final_froms():
+            if isinstance(from_clause, CTE) and isinstance(
+                from_clause.element, UpdateBase
+            ):
+                return from_clause.element
+    return None
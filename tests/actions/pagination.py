@@ -0,0 +1,179 @@
+import base64
+import binascii
+import json
+from dataclasses import dataclass
+from datetime import date, datetime, time
+from decimal import Decimal
+from typing import (Any, Callable, Dict, Iterable, List, Optional, Sequence,
+                    Tuple)
+
+from sqlalchemy import (Column, ColumnElement, Select, and_, false, literal,
+                        select, tuple_, union_all)
+
+from src.logger.logger import logger
+from tests.actions.mappers import RowMapper
+
+DEFAULT_PAGE_SIZE: int = 100
+
+cursor_parsers: Dict[type, Callable[[str], Any]] = {
+    datetime: datetime.fromisoformat,
+    date: date.fromisoformat,
+    time: time.fromisoformat,
+    Decimal: Decimal,
+}
+
+
+@dataclass
+class Page:
+    items: List[Dict[str, Any]]
+    next_cursor: Optional[str]
+
+    @property
+    def has_next(self) -> bool:
+        return self.next_cursor is not None
+
+
+def get_order_columns(mapper: RowMapper, order_by: Iterable[str]) -> Tuple[Column, ...]:
+    names = list(order_by)
+    unknown_fields = [name for name in names if name not in mapper.keys]
+    if unknown_fields:
+        error_message = f"Cannot paginate {mapper.model.__name__} model by unknown fields {', '.join(unknown_fields)}"
+        logger.error(error_message)
+        raise ValueError(error_message)
+    if mapper.primary_key.name not in names:
+        names.append(mapper.primary_key.name)
+    return tuple(mapper.table.c[name] for name in names)
+
+
+def serialize_cursor_value(value: Any) -> str:
+    return value.isoformat() if hasattr(value, "isoformat") else str(value)
+
+
+def encode_cursor(columns: Sequence[Column], item: Dict[str, Any]) -> str:
+    payload = {
+        "keys": [column.name for column in columns],
+        "values": [item[column.name] for column in columns],
+    }
+    data = json.dumps(payload, default=serialize_cursor_value)
+    return base64.urlsafe_b64encode(data.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str, columns: Sequence[Column]) -> Tuple[Any, ...]:
+    try:
+        data = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        payload = json.loads(data)
+        keys, values = payload["keys"], payload["values"]
+    except (binascii.Error, ValueError, KeyError, TypeError) as e:
+        error_message = f"Invalid pagination cursor {cursor!r}: {str(e)}"
+        logger.error(error_message)
+        raise ValueError(error_message)
+    if keys != [column.name for column in columns]:
+        error_message = f"Pagination cursor was issued for order {keys}, not {[column.name for column in columns]}"
+        logger.error(error_message)
+        raise ValueError(error_message)
+    return tuple(
+        parse_cursor_value(column, value) for column, value in zip(columns, values)
+    )
+
+
+def parse_cursor_value(column: Column, value: Any) -> Any:
+    if value is None:
+        return None
+    parser = cursor_parsers.get(column.type.python_type)
+    return parser(value) if parser is not None else value
+
+
+def order_column(
+    column: ColumnElement, nullable: bool, descending: bool
+) -> ColumnElement:
+    if not nullable:
+        return column.desc() if descending else column.asc()
+    return column.desc().nulls_first() if descending else column.asc().nulls_last()
+
+
+def equal_value(column: Column, value: Any) -> ColumnElement:
+    if value is None:
+        return column.is_(None)
+    return column == literal(value, column.type)
+
+
+def beyond_value(column: Column, value: Any, descending: bool) -> List[ColumnElement]:
+    if value is None:
+        return [column.is_not(None)] if descending else []
+    boundary = literal(value, column.type)
+    if descending:
+        return [column < boundary]
+    if column.nullable:
+        return [column > boundary, column.is_(None)]
+    return [column > boundary]
+
+
+def keyset_branches(
+    columns: Sequence[Column], after_values: Tuple[Any, ...], descending: bool
+) -> List[ColumnElement]:
+    tail = len(columns)
+    while tail and not columns[tail - 1].nullable:
+        tail -= 1
+    branches: List[ColumnElement] = []
+    for position, (column, value) in enumerate(zip(columns[:tail], after_values)):
+        prefix = [
+            equal_value(column, value)
+            for column, value in zip(columns[:position], after_values)
+        ]
+        branches.extend(
+            and_(*prefix, beyond) for beyond in beyond_value(column, value, descending)
+        )
+    if tail < len(columns):
+        keyset = tuple_(*columns[tail:])
+        boundary = tuple_(
+            *(
+                literal(value, column.type)
+                for column, value in zip(columns[tail:], after_values[tail:])
+            )
+        )
+        branches.append(
+            and_(
+                *(
+                    equal_value(column, value)
+                    for column, value in zip(columns[:tail], after_values)
+                ),
+                keyset < boundary if descending else keyset > boundary,
+            )
+        )
+    return branches
+
+
+def keyset_statement(
+    mapper: RowMapper,
+    filters: Dict[str, Any],
+    columns: Sequence[Column],
+    after_values: Optional[Tuple[Any, ...]],
+    limit: int,
+    descending: bool,
+) -> Select:
+    statement = mapper.statement.filter_by(**filters)
+    order = [
+        order_column(column, bool(column.nullable), descending) for column in columns
+    ]
+    if after_values is None:
+        return statement.order_by(*order).limit(limit + 1)
+    branches = keyset_branches(columns, after_values, descending)
+    if len(branches) < 2:
+        statement = statement.where(*branches) if branches else statement.where(false())
+        return statement.order_by(*order).limit(limit + 1)
+    pages = union_all(
+        *(
+            statement.where(branch).order_by(*order).limit(limit + 1)
+            for branch in branches
+        )
+    ).subquery("keyset_pages")
+    return (
+        select(*pages.c)
+        .order_by(
+            *(
+                order_column(pages.c[column.name], bool(column.nullable), descending)
+                for column in columns
+            )
+        )
+        .limit(limit + 1)
+    )
@@ -0,0 +1,221 @@
+import threading
+import time
+from collections import OrderedDict
+from dataclasses import dataclass
+from itertools import chain
+from typing import Any, Callable, Dict, Iterable, Optional, Set, Tuple, Type
+
+from sqlalchemy import URL, Column, event, inspect
+from sqlalchemy.orm import ORMExecuteState, RelationshipProperty, Session
+
+from src.db.models import Base, Priority, Role, Status
+from src.logger.logger import logger
+from tests.actions.mappers import get_dml_statement, get_row_mapper
+
+REFERENCE_CACHE_TTL: float = 300.0
+REFERENCE_CACHE_SIZE: int = 1024
+PENDING_INVALIDATIONS: str = "reference_cache_invalidations"
+
+
+@dataclass
+class CacheStats:
+    hits: int = 0
+    misses: int = 0
+    evictions: int = 0
+    expirations: int = 0
+    invalidations: int = 0
+
+    @property
+    def hit_ratio(self) -> float:
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+    def summary(self) -> Dict[str, Any]:
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "expirations": self.expirations,
+            "invalidations": self.invalidations,
+            "hit_ratio": round(self.hit_ratio, 4),
+        }
+
+
+class ReferenceCache:
+    def __init__(
+        self,
+        model: Type[Base],
+        ttl: float = REFERENCE_CACHE_TTL,
+        max_size: int = REFERENCE_CACHE_SIZE,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self.model = model
+        self.ttl = ttl
+        self.max_size = max_size
+        self.clock = clock
+        self.entries: OrderedDict[Any, Tuple[float, Dict[str, Any]]] = OrderedDict()
+        self.stats = CacheStats()
+        self.lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def get(self, key: Any) -> Optional[Dict[str, Any]]:
+        with self.lock:
+            entry = self.entries.get(key)
+            if entry is not None and entry[0] <= self.clock():
+                del self.entries[key]
+                self.stats.expirations += 1
+                entry = None
+            if entry is None:
+                self.stats.misses += 1
+                return None
+            self.entries.move_to_end(key)
+            self.stats.hits += 1
+            return dict(entry[1])
+
+    def put(self, key: Any, value: Dict[str, Any]) -> None:
+        with self.lock:
+            self.entries[key] = (self.clock() + self.ttl, dict(value))
+            self.entries.move_to_end(key)
+            while len(self.entries) > self.max_size:
+                self.entries.popitem(last=False)
+                self.stats.evictions += 1
+
+    def warm(self, rows: Iterable[Dict[str, Any]]) -> int:
+        key_name = get_row_mapper(self.model).primary_key.name
+        count = 0
+        for row in rows:
+            self.put(row[key_name], row)
+            count += 1
+        logger.info(f"Warmed {self.model.__name__} reference cache with {count} rows")
+        return count
+
+    def invalidate(self, key: Any = None) -> None:
+        with self.lock:
+            if key is None:
+                self.entries.clear()
+            else:
+                self.entries.pop(key, None)
+            self.stats.invalidations += 1
+
+    def reset(self) -> None:
+        with self.lock:
+            self.entries.clear()
+            self.stats = CacheStats()
+
+
+REFERENCE_MODELS: Tuple[Type[Base], ...] = (Role, Priority, Status)
+reference_caches: Dict[Tuple[str, Type[Base]], ReferenceCache] = {}
+reference_caches_lock = threading.Lock()
+reference_tables: Dict[str, Type[Base]] = {
+    model.__tablename__: model for model in REFERENCE_MODELS
+}
+
+
+def get_url_key(url: URL) -> str:
+    return f"{url.get_backend_name()}://{url.host}:{url.port}/{url.database}"
+
+
+def get_bind_key(session: Session) -> str:
+    return get_url_key(session.get_bind().engine.url)
+
+
+def get_reference_cache(
+    model: Type[Base], session: Session
+) -> Optional[ReferenceCache]:
+    if model not in REFERENCE_MODELS:
+        return None
+    key = (get_bind_key(session), model)
+    with reference_caches_lock:
+        cache = reference_caches.get(key)
+        if cache is None:
+            cache = reference_caches[key] = ReferenceCache(model)
+    return cache
+
+
+def invalidate_reference_caches() -> None:
+    with reference_caches_lock:
+        caches = list(reference_caches.values())
+    for cache in caches:
+        cache.invalidate()
+
+
+def reference_cache_stats() -> Dict[str, Dict[str, Dict[str, Any]]]:
+    stats: Dict[str, Dict[str, Dict[str, Any]]] = {}
+    with reference_caches_lock:
+        caches = list(reference_caches.items())
+    for (bind_key, model), cache in caches:
+        stats.setdefault(bind_key, {})[model.__name__] = cache.stats.summary() | {
+            "size": len(cache)
+        }
+    return stats
+
+
+def reference_key_column(relationship: RelationshipProperty) -> Optional[Column]:
+    if relationship.uselist or relationship.mapper.class_ not in REFERENCE_MODELS:
+        return None
+    pairs = relationship.local_remote_pairs
+    if len(pairs) != 1 or not pairs[0][1].primary_key:
+        return None
+    return pairs[0][0]
+
+
+def mark_invalidated(session: Session, model: Type[Base], key: Any = None) -> None:
+    get_reference_cache(model, session).invalidate(key)
+    pending: Set[Tuple[Type[Base], Any]] = session.info.setdefault(
+        PENDING_INVALIDATIONS, set()
+    )
+    pending.add((model, key))
+
+
+def has_pending_writes(session: Session, model: Type[Base]) -> bool:
+    return any(
+        pending_model is model
+        for pending_model, _ in session.info.get(PENDING_INVALIDATIONS, ())
+    )
+
+
+def fill_reference_cache(
+    session: Session, model: Type[Base], key: Any, value: Dict[str, Any]
+) -> None:
+    if not has_pending_writes(session, model):
+        get_reference_cache(model, session).put(key, value)
+
+
+def invalidate_pending(session: Session) -> None:
+    for model, key in session.info.pop(PENDING_INVALIDATIONS, ()):
+        get_reference_cache(model, session).invalidate(key)
+
+
+@event.listens_for(Session, "after_flush")
+def invalidate_flushed(session: Session, flush_context) -> None:
+    for instance in chain(session.new, session.dirty, session.deleted):
+        model = type(instance)
+        if model in REFERENCE_MODELS:
+            state = inspect(instance)
+            identity = state.identity or state.mapper.primary_key_from_instance(
+                instance
+            )
+            mark_invalidated(session, model, identity[0])
+
+
+@event.listens_for(Session, "do_orm_execute")
+def invalidate_executed(orm_execute_state: ORMExecuteState) -> None:
+    statement = get_dml_statement(orm_execute_state.statement)
+    if statement is None:
+        return
+    table = getattr(statement, "table", None)
+    model = reference_tables.get(getattr(table, "name", None))
+    if model is not None:
+        mark_invalidated(orm_execute_state.session, model)
+
+
+@event.listens_for(Session, "after_commit")
+def invalidate_committed(session: Session) -> None:
+    invalidate_pending(session)
+
+
+@event.listens_for(Session, "after_rollback")
+def invalidate_rolled_back(session: Session) -> None:
+    invalidate_pending(session)
@@ -1,9 +1,12 @@
-from typing import Any, Dict, List, Optional
+from typing import Any, AsyncIterator, Dict, Iterable, Iterator, List, Optional
 
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
 from src.db.models import Role
+from tests.actions.async_base import AsyncBaseActions
 from tests.actions.base import BaseActions
+from tests.actions.sampling import SamplingStrategy
 
 
 class RoleActions(BaseActions):
@@ -19,8 +22,13 @@ class RoleActions(BaseActions):
     def create_role(self, role_data: Dict[str, Any]) -> Dict[str, Any]:
         return self.create_instance(role_data)
 
+    def create_roles(
+        self, roles_data: Iterable[Dict[str, Any]], batch_size: int = 1000
+    ) -> List[int]:
+        return self.create_instances(roles_data, batch_size)
+
     def get_role_by_id(self, filter_value: int) -> Optional[Dict[str, Any]]:
-        return self.get_role_by_filter("id", filter_value)
+        return self.get_cached(filter_value)
 
     def get_role_by_name(self, filter_value: str) -> Optional[Dict[str, Any]]:
         return self.get_role_by_filter("role_name", filter_value)
@@ -30,8 +38,10 @@ class RoleActions(BaseActions):
     ) -> Optional[Dict[str, Any]]:
         return self.filter_by(filter_param, filter_value)
 
-    def get_random_role(self) -> Optional[Dict[str, Any]]:
-        return self.get_random()
+    def get_random_role(
+        self, strategy: Optional[SamplingStrategy] = None
+    ) -> Optional[Dict[str, Any]]:
+        return self.get_random(strategy)
 
     def get_role_field(
         self, filter_param: str, filter_value: Any, field_name: str
@@ -41,11 +51,22 @@ class RoleActions(BaseActions):
     def get_all_roles(self) -> Optional[List[Dict[str, Any]]]:
         return self.get_all()
 
+    def warm_roles_cache(self) -> int:
+        return self.warm_cache()
+
     def get_all_roles_by_filter(
         self, filter_param: str, filter_value: Any
     ) -> Optional[List[Dict[str, Any]]]:
         return self.get_all_by_filter(filter_param, filter_value)
 
+    def iter_all_roles(self, chunk_size: int = 1000) -> Iterator[Dict[str, Any]]:
+        return self.iter_all(chunk_size)
+
+    def iter_all_roles_by_filter(
+        self, filter_param: str, filter_value: Any, chunk_size: int = 1000
+    ) -> Iterator[Dict[str, Any]]:
+        return self.iter_by_filter(filter_param, filter_value, chunk_size)
+
     def get_role_users(
         self, filter_param: str, filter_value: Any
     ) -> List[Dict[str, Any]]:
@@ -71,3 +92,92 @@ class RoleActions(BaseActions):
 
     def delete_all_roles(self) -> str:
         return self.delete_all()
+
+
+class AsyncRoleActions(AsyncBaseActions):
+    def __init__(self, session: AsyncSession = None):
+        super().__init__(model=Role, session=session)
+
+    async def create_roles_table(self) -> str:
+        return await self.create_table()
+
+    async def drop_roles_table(self) -> str:
+        return await self.drop_table()
+
+    async def create_role(self, role_data: Dict[str, Any]) -> Dict[str, Any]:
+        return await self.create_instance(role_data)
+
+    async def create_roles(
+        self, roles_data: Iterable[Dict[str, Any]], batch_size: int = 1000
+    ) -> List[int]:
+        return await self.create_instances(roles_data, batch_size)
+
+    async def get_role_by_id(self, filter_value: int) -> Optional[Dict[str, Any]]:
+        return await self.get_cached(filter_value)
+
+    async def get_role_by_name(self, filter_value: str) -> Optional[Dict[str, Any]]:
+        return await self.get_role_by_filter("role_name", filter_value)
+
+    async def get_role_by_filter(
+        self, filter_param: str, filter_value: Any
+    ) -> Optional[Dict[str, Any]]:
+        return await self.filter_by(filter_param, filter_value)
+
+    async def get_random_role(
+        self, strategy: Optional[SamplingStrategy] = None
+    ) -> Optional[Dict[str, Any]]:
+        return await self.get_random(strategy)
+
+    async def get_role_field(
+        self, filter_param: str, filter_value: Any, field_name: str
+    ) -> Any:
+        return await self.get_field_value(filter_param, filter_value, field_name)
+
+    async def get_all_roles(self) -> Optional[List[Dict[str, Any]]]:
+        return await self.get_all()
+
+    async def warm_roles_cache(self) -> int:
+        return await self.warm_cache()
+
+    async def get_all_roles_by_filter(
+        self, filter_param: str, filter_value: Any
+    ) -> Optional[List[Dict[str, Any]]]:
+        return await self.get_all_by_filter(filter_param, filter_value)
+
+    def iter_all_roles(self, chunk_size: int = 1000) -> AsyncIterator[Dict[str, Any]]:
+        return self.iter_all(chunk_size)
+
+    def iter_all_roles_by_filter(
+        self, filter_param: str, filter_value: Any, chunk_size: int = 1000
+    ) -> AsyncIterator[Dict[str, Any]]:
+        return self.iter_by_filter(filter_param, filter_value, chunk_size)
+
+    async def get_role_users(
+        self, filter_param: str, filter_value: Any
+    ) -> List[Dict[str, Any]]:
+        return await self.get_role_relationship(filter_param, filter_value, "users")
+
+    async def get_role_relationship(
+        self, filter_param: str, filter_value: Any, relationship_name: str
+    ) -> List[Dict[str, Any]] | Dict[str, Any]:
+        return await self.get_relationship(
+            filter_param, filter_value, relationship_name
+        )
+
+    async def update_role_field(
+        self, filter_param: str, filter_value: Any, field_name: str, new_value: Any
+    ) -> Dict[str, Any]:
+        return await self.update_field(
+            filter_param, filter_value, field_name, new_value
+        )
+
+    async def update_role_fields(
+        self, filter_param: str, filter_value: Any, updated_data: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        return await self.update_fields(filter_param, filter_value, updated_data)
+
+    async def delete_role(self, filter_param: str, filter_value: Any) -> str:
+        return await self.delete(filter_param, filter_value)
+
+    async def delete_all_roles(self) -> str:
+        return await self.delete_all()
@@ -0,0 +1,134 @@
+import random
+import threading
+from enum import Enum
+from functools import cache
+from typing import Dict, List, Optional, Tuple, Type
+
+from sqlalchemy import (ColumnElement, Row, Select, cast, column, func, select,
+                        table, tablesample)
+from sqlalchemy.orm import Session
+
+from src.db.models import Base
+from tests.actions.mappers import RowMapper, get_row_mapper
+from tests.actions.reference_cache import get_bind_key
+
+SAMPLE_TARGET_ROWS: int = 100
+
+pg_class = table("pg_class", column("oid"), column("reltuples"))
+
+
+class SamplingStrategy(Enum):
+    ORDER_BY_RANDOM = "order_by_random"
+    TABLESAMPLE_SYSTEM = "tablesample_system"
+    TABLESAMPLE_BERNOULLI = "tablesample_bernoulli"
+    ID_RANGE = "id_range"
+    ID_POOL = "id_pool"
+
+
+class IdPool:
+    def __init__(self, model: Type[Base]) -> None:
+        self.mapper: RowMapper = get_row_mapper(model)
+        self.ids: List[int] = []
+        self.max_id: int = 0
+
+    def refresh(self, session: Session) -> None:
+        primary_key = self.mapper.primary_key
+        new_ids = (
+            session.execute(
+                select(primary_key)
+                .where(primary_key > self.max_id)
+                .order_by(primary_key)
+            )
+            .scalars()
+            .all()
+        )
+        if new_ids:
+            self.ids.extend(new_ids)
+            self.max_id = new_ids[-1]
+
+    def reload(self, session: Session) -> None:
+        self.ids = []
+        self.max_id = 0
+        self.refresh(session)
+
+    def sample(self, session: Session) -> Optional[Row]:
+        self.refresh(session)
+        reloaded = False
+        while self.ids:
+            index = random.randrange(len(self.ids))
+            row = session.execute(
+                self.mapper.statement.where(self.mapper.primary_key == self.ids[index])
+            ).first()
+            if row is not None:
+                return row
+            if reloaded:
+                self.ids[index] = self.ids[-1]
+                self.ids.pop()
+            else:
+                self.reload(session)
+                reloaded = True
+        return None
+
+
+id_pools: Dict[Tuple[str, Type[Base]], IdPool] = {}
+id_pools_lock = threading.Lock()
+
+
+def get_id_pool(model: Type[Base], session: Session) -> IdPool:
+    key = (get_bind_key(session), model)
+    with id_pools_lock:
+        pool = id_pools.get(key)
+        if pool is None:
+            pool = id_pools[key] = IdPool(model)
+    return pool
+
+
+def _sample_percent(mapper: RowMapper) -> ColumnElement[float]:
+    reltuples = (
+        select(func.greatest(pg_class.c.reltuples, 1))
+        .where(pg_class.c.oid == func.to_regclass(mapper.table.name))
+        .scalar_subquery()
+    )
+    return func.least(100, 100.0 * SAMPLE_TARGET_ROWS / reltuples)
+
+
+@cache
+def _sampling_statements(model: Type[Base]) -> Dict[SamplingStrategy, Select]:
+    mapper = get_row_mapper(model)
+    primary_key = mapper.primary_key
+    random_offset = func.floor(
+        func.random() * (func.max(primary_key) - func.min(primary_key) + 1)
+    )
+    random_id = select(
+        func.min(primary_key) + cast(random_offset, primary_key.type)
+    ).scalar_subquery()
+    statements = {
+        SamplingStrategy.ORDER_BY_RANDOM: mapper.statement.order_by(func.random()),
+        SamplingStrategy.ID_RANGE: (
+            mapper.statement.where(primary_key >= random_id).order_by(primary_key)
+        ),
+    }
+    for strategy, method in (
+        (SamplingStrategy.TABLESAMPLE_SYSTEM, func.system),
+        (SamplingStrategy.TABLESAMPLE_BERNOULLI, func.bernoulli),
+    ):
+        sampled = tablesample(mapper.table, method(_sample_percent(mapper)))
+        statements[strategy] = select(
+            *(sampled.c[key] for key in mapper.keys)
+        ).order_by(func.random())
+    return {strategy: statement.limit(1) for strategy, statement in statements.items()}
+
+
+def sample_row(
+    session: Session, model: Type[Base], strategy: SamplingStrategy
+) -> Optional[Row]:
+    if strategy is SamplingStrategy.ID_POOL:
+        return get_id_pool(model, session).sample(session)
+    statements = _sampling_statements(model)
+    row = session.execute(statements[strategy]).first()
+    if row is None and strategy in (
+        SamplingStrategy.TABLESAMPLE_SYSTEM,
+        SamplingStrategy.TABLESAMPLE_BERNOULLI,
+    ):
+        row = session.execute(statements[SamplingStrategy.ID_RANGE]).first()
+    return row
@@ -0,0 +1,54 @@
+from functools import cache
+from typing import Any, Callable, Dict, Hashable, Tuple, Type
+
+from sqlalchemy import Executable, Update, bindparam, update
+
+from src.db.models import Base
+from tests.actions.mappers import RowMapper, get_row_mapper
+
+
+class StatementRegistry:
+    def __init__(self, model: Type[Base]) -> None:
+        self.model = model
+        self.mapper: RowMapper = get_row_mapper(model)
+        self.statements: Dict[Hashable, Executable] = {}
+
+    def __len__(self) -> int:
+        return len(self.statements)
+
+    def get(self, key: Hashable, build: Callable[[], Executable]) -> Executable:
+        statement = self.statements.get(key)
+        if statement is None:
+            statement = self.statements[key] = build()
+        return statement
+
+    def update_statement(self, field_names: Tuple[str, ...]) -> Update:
+        return self.get(
+            ("update", field_names), lambda: self._build_update(field_names)
+        )
+
+    def update_params(
+        self, primary_key_value: Any, values: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        params = {f"set_{name}": value for name, value in values.items()}
+        params["primary_key"] = primary_key_value
+        return params
+
+    def _build_update(self, field_names: Tuple[str, ...]) -> Update:
+        table = self.mapper.table
+        return (
+            update(table)
+            .where(self.mapper.primary_key == bindparam("primary_key"))
+            .values(
+                {
+                    name: bindparam(f"set_{name}", type_=table.c[name].type)
+                    for name in field_names
+                }
+            )
+            .returning(*self.mapper.columns)
+        )
+
+
+@cache
+def get_statement_registry(model: Type[Base]) -> StatementRegistry:
+    return StatementRegistry(model)
@@ -1,12 +1,27 @@
-from typing import Any, Dict, List, Optional
+from typing import (Any, AsyncIterator, Dict, Iterable, Iterator, List,
+                    Optional, Tuple, Union)
 
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
 from src.db.models import Task
-from tests.actions.base import BaseActions
+from tests.actions.async_base import AsyncBaseActions
+from tests.actions.base import BaseActions, DeleteReport
+from tests.actions.filters import FilterSpec
+from tests.actions.loading import LoadStrategy
+from tests.actions.pagination import DEFAULT_PAGE_SIZE, Page
+from tests.actions.sampling import SamplingStrategy
+
+TASK_RELATIONSHIPS: List[str] = ["priority", "status", "creator", "assignee"]
+TASK_PAGE_ORDER: Tuple[str, ...] = ("created_at", "id")
+TASK_LOAD_STRATEGIES: Dict[str, LoadStrategy] = {
+    relationship_name: LoadStrategy.JOINED for relationship_name in TASK_RELATIONSHIPS
+}
 
 
 class TaskActions(BaseActions):
+    load_strategies = TASK_LOAD_STRATEGIES
+
     def __init__(self, session: Session = None):
         super().__init__(model=Task, session=session)
 
@@ -19,6 +34,11 @@ class TaskActions(BaseActions):
     def create_task(self, task_data: Dict[str, Any]) -> Dict[str, Any]:
         return self.create_instance(task_data)
 
+    def create_tasks(
+        self, tasks_data: Iterable[Dict[str, Any]], batch_size: int = 1000
+    ) -> List[int]:
+        return self.create_instances(tasks_data, batch_size)
+
     def get_task_by_id(self, filter_value: int) -> Optional[Dict[str, Any]]:
         return self.get_task_by_filter("id", filter_value)
 
@@ -26,12 +46,14 @@ class TaskActions(BaseActions):
         return self.get_task_by_filter("title", filter_value)
 
     def get_task_by_filter(
-        self, filter_param: str, filter_value: Any
+        self, filter_param: Union[str, FilterSpec], filter_value: Any = None
     ) -> Optional[Dict[str, Any]]:
         return self.filter_by(filter_param, filter_value)
 
-    def get_random_task(self) -> Optional[Dict[str, Any]]:
-        return self.get_random()
+    def get_random_task(
+        self, strategy: Optional[SamplingStrategy] = None
+    ) -> Optional[Dict[str, Any]]:
+        return self.get_random(strategy)
 
     def get_task_field(
         self, filter_param: str, filter_value: Any, field_name: str
@@ -42,10 +64,40 @@ class TaskActions(BaseActions):
         return self.get_all()
 
     def get_all_tasks_by_filter(
-        self, filter_param: str, filter_value: Any
+        self, filter_param: Union[str, FilterSpec], filter_value: Any = None
     ) -> Optional[List[Dict[str, Any]]]:
         return self.get_all_by_filter(filter_param, filter_value)
 
+    def iter_all_tasks(self, chunk_size: int = 1000) -> Iterator[Dict[str, Any]]:
+        return self.iter_all(chunk_size)
+
+    def iter_all_tasks_by_filter(
+        self,
+        filter_param: Union[str, FilterSpec],
+        filter_value: Any = None,
+        chunk_size: int = 1000,
+    ) -> Iterator[Dict[str, Any]]:
+        return self.iter_by_filter(filter_param, filter_value, chunk_size)
+
+    def get_tasks_with_relations(
+        self,
+        filter_param: Optional[str] = None,
+        filter_value: Any = None,
+        strategies: Optional[Dict[str, LoadStrategy]] = None,
+    ) -> Optional[List[Dict[str, Any]]]:
+        return self.get_all_with_relationships(
+            TASK_RELATIONSHIPS, filter_param, filter_value, strategies
+        )
+
+    def paginate_tasks(
+        self,
+        filters: Optional[Dict[str, Any]] = None,
+        after: Optional[str] = None,
+        limit: int = DEFAULT_PAGE_SIZE,
+        descending: bool = False,
+    ) -> Page:
+        return self.paginate(filters, TASK_PAGE_ORDER, after, limit, descending)
+
     def get_task_priority(self, filter_param: str, filter_value: Any) -> Dict[str, Any]:
         return self.get_task_relationship(filter_param, filter_value, "priority")
 
@@ -73,8 +125,187 @@ class TaskActions(BaseActions):
     ) -> Dict[str, Any]:
         return self.update_fields(filter_param, filter_value, updated_data)
 
+    def update_tasks_where(
+        self,
+        filters: Dict[str, Any],
+        updated_data: Dict[str, Any],
+        allow_all: bool = False,
+    ) -> int:
+        return self.update_where(filters, updated_data, allow_all)
+
+    def bulk_update_tasks(
+        self, tasks_data: Iterable[Dict[str, Any]], batch_size: int = 1000
+    ) -> int:
+        return self.bulk_update_rows(tasks_data, batch_size)
+
     def delete_task(self, filter_param: str, filter_value: Any) -> str:
         return self.delete(filter_param, filter_value)
 
     def delete_all_tasks(self) -> str:
         return self.delete_all()
+
+    def delete_tasks_where(
+        self, filters: Dict[str, Any], allow_all: bool = False
+    ) -> List[int]:
+        return self.delete_where(filters, allow_all)
+
+    def delete_tasks_in_chunks(
+        self,
+        filters: Optional[Dict[str, Any]] = None,
+        chunk_size: int = 10_000,
+        pause: float = 0.0,
+        allow_all: bool = False,
+    ) -> DeleteReport:
+        return self.delete_in_chunks(filters, chunk_size, pause, allow_all)
+
+
+class AsyncTaskActions(AsyncBaseActions):
+    load_strategies = TASK_LOAD_STRATEGIES
+
+    def __init__(self, session: AsyncSession = None):
+        super().__init__(model=Task, session=session)
+
+    async def create_tasks_table(self) -> str:
+        return await self.create_table()
+
+    async def drop_tasks_table(self) -> str:
+        return await self.drop_table()
+
+    async def create_task(self, task_data: Dict[str, Any]) -> Dict[str, Any]:
+        return await self.create_instance(task_data)
+
+    async def create_tasks(
+        self, tasks_data: Iterable[Dict[str, Any]], batch_size: int = 1000
+    ) -> List[int]:
+        return await self.create_instances(tasks_data, batch_size)
+
+    async def get_task_by_id(self, filter_value: int) -> Optional[Dict[str, Any]]:
+        return await self.get_task_by_filter("id", filter_value)
+
+    async def get_task_by_title(self, filter_value: str) -> Optional[Dict[str, Any]]:
+        return await self.get_task_by_filter("title", filter_value)
+
+    async def get_task_by_filter(
+        self, filter_param: Union[str, FilterSpec], filter_value: Any = None
+    ) -> Optional[Dict[str, Any]]:
+        return await self.filter_by(filter_param, filter_value)
+
+    async def get_random_task(
+        self, strategy: Optional[SamplingStrategy] = None
+    ) -> Optional[Dict[str, Any]]:
+        return await self.get_random(strategy)
+
+    async def get_task_field(
+        self, filter_param: str, filter_value: Any, field_name: str
+    ) -> Any:
+        return await self.get_field_value(filter_param, filter_value, field_name)
+
+    async def get_all_tasks(self) -> Optional[List[Dict[str, Any]]]:
+        return await self.get_all()
+
+    async def get_all_tasks_by_filter(
+        self, filter_param: Union[str, FilterSpec], filter_value: Any = None
+    ) -> Optional[List[Dict[str, Any]]]:
+        return await self.get_all_by_filter(filter_param, filter_value)
+
+    def iter_all_tasks(self, chunk_size: int = 1000) -> AsyncIterator[Dict[str, Any]]:
+        return self.iter_all(chunk_size)
+
+    def iter_all_tasks_by_filter(
+        self,
+        filter_param: Union[str, FilterSpec],
+        filter_value: Any = None,
+        chunk_size: int = 1000,
+    ) -> AsyncIterator[Dict[str, Any]]:
+        return self.iter_by_filter(filter_param, filter_value, chunk_size)
+
+    async def get_tasks_with_relations(
+        self,
+        filter_param: Optional[str] = None,
+        filter_value: Any = None,
+        strategies: Optional[Dict[str, LoadStrategy]] = None,
+    ) -> Optional[List[Dict[str, Any]]]:
+        return await self.get_all_with_relationships(
+            TASK_RELATIONSHIPS, filter_param, filter_value, strategies
+        )
+
+    async def paginate_tasks(
+        self,
+        filters: Optional[Dict[str, Any]] = None,
+        after: Optional[str] = None,
+        limit: int = DEFAULT_PAGE_SIZE,
+        descending: bool = False,
+    ) -> Page:
+        return await self.paginate(filters, TASK_PAGE_ORDER, after, limit, descending)
+
+    async def get_task_priority(
+        self, filter_param: str, filter_value: Any
+    ) -> Dict[str, Any]:
+        return await self.get_task_relationship(filter_param, filter_value, "priority")
+
+    async def get_task_status(
+        self, filter_param: str, filter_value: Any
+    ) -> Dict[str, Any]:
+        return await self.get_task_relationship(filter_param, filter_value, "status")
+
+    async def get_task_creator(
+        self, filter_param: str, filter_value: Any
+    ) -> Dict[str, Any]:
+        return await self.get_task_relationship(filter_param, filter_value, "creator")
+
+    async def get_task_assignee(
+        self, filter_param: str, filter_value: Any
+    ) -> Dict[str, Any]:
+        return await self.get_task_relationship(filter_param, filter_value, "assignee")
+
+    async def get_task_relationship(
+        self, filter_param: str, filter_value: Any, relationship_name: str
+    ) -> List[Dict[str, Any]] | Dict[str, Any]:
+        return await self.get_relationship(
+            filter_param, filter_value, relationship_name
+        )
+
+    async def update_task_field(
+        self, filter_param: str, filter_value: Any, field_name: str, new_value: Any
+    ) -> Dict[str, Any]:
+        return await self.update_field(
+            filter_param, filter_value, field_name, new_value
+        )
+
+    async def update_task_fields(
+        self, filter_param: str, filter_value: Any, updated_data: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        return await self.update_fields(filter_param, filter_value, updated_data)
+
+    async def update_tasks_where(
+        self,
+        filters: Dict[str, Any],
+        updated_data: Dict[str, Any],
+        allow_all: bool = False,
+    ) -> int:
+        return await self.update_where(filters, updated_data, allow_all)
+
+    async def bulk_update_tasks(
+        self, tasks_data: Iterable[Dict[str, Any]], batch_size: int = 1000
+    ) -> int:
+        return await self.bulk_update_rows(tasks_data, batch_size)
+
+    async def delete_task(self, filter_param: str, filter_value: Any) -> str:
+        return await self.delete(filter_param, filter_value)
+
+    async def delete_all_tasks(self) -> str:
+        return await self.delete_all()
+
+    async def delete_tasks_where(
+        self, filters: Dict[str, Any], allow_all: bool = False
+    ) -> List[int]:
+        return await self.delete_where(filters, allow_all)
+
+    async def delete_tasks_in_chunks(
+        self,
+        filters: Optional[Dict[str, Any]] = None,
+        chunk_size: int = 10_000,
+        pause: float = 0.0,
+        allow_all: bool = False,
+    ) -> DeleteReport:
+        return await self.delete_in_chunks(filters, chunk_size, pause, allow_all)
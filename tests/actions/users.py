@@ -1,9 +1,13 @@
-from typing import Any, Dict, List, Optional
+from typing import (Any, AsyncIterator, Dict, Iterable, Iterator, List,
+                    Optional, Tuple)
 
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session
 
 from src.db.models import User
-from tests.actions.base import BaseActions
+from tests.actions.async_base import AsyncBaseActions
+from tests.actions.base import BaseActions, UpsertReport
+from tests.actions.sampling import SamplingStrategy
 
 
 class UserActions(BaseActions):
@@ -19,6 +23,22 @@ class UserActions(BaseActions):
     def create_user(self, user_data: Dict[str, Any]) -> Dict[str, Any]:
         return self.create_instance(user_data)
 
+    def create_users(
+        self, users_data: Iterable[Dict[str, Any]], batch_size: int = 1000
+    ) -> List[int]:
+        return self.create_instances(users_data, batch_size)
+
+    def upsert_users(
+        self,
+        users_data: Iterable[Dict[str, Any]],
+        conflict_columns: Iterable[str] = ("username",),
+        update_columns: Optional[Iterable[str]] = None,
+        batch_size: int = 1000,
+    ) -> UpsertReport:
+        return self.upsert_many(
+            users_data, conflict_columns, update_columns, batch_size
+        )
+
     def get_user_by_id(self, filter_value: int) -> Optional[Dict[str, Any]]:
         return self.get_user_by_filter("id", filter_value)
 
@@ -30,8 +50,10 @@ class UserActions(BaseActions):
     ) -> Optional[Dict[str, Any]]:
         return self.filter_by(filter_param, filter_value)
 
-    def get_random_user(self) -> Optional[Dict[str, Any]]:
-        return self.get_random()
+    def get_random_user(
+        self, strategy: Optional[SamplingStrategy] = None
+    ) -> Optional[Dict[str, Any]]:
+        return self.get_random(strategy)
 
     def get_user_field(
         self, filter_param: str, filter_value: Any, field_name: str
@@ -46,6 +68,14 @@ class UserActions(BaseActions):
     ) -> Optional[List[Dict[str, Any]]]:
         return self.get_all_by_filter(filter_param, filter_value)
 
+    def iter_all_users(self, chunk_size: int = 1000) -> Iterator[Dict[str, Any]]:
+        return self.iter_all(chunk_size)
+
+    def iter_all_users_by_filter(
+        self, filter_param: str, filter_value: Any, chunk_size: int = 1000
+    ) -> Iterator[Dict[str, Any]]:
+        return self.iter_by_filter(filter_param, filter_value, chunk_size)
+
     def get_user_role(self, filter_param: str, filter_value: Any) -> Dict[str, Any]:
         return self.get_user_relationship(filter_param, filter_value, "role")
 
@@ -64,6 +94,21 @@ class UserActions(BaseActions):
     ) -> List[Dict[str, Any]] | Dict[str, Any]:
         return self.get_relationship(filter_param, filter_value, relationship_name)
 
+    def get_users_assigned_tasks(
+        self, user_ids: Iterable[int], chunk_size: int = 1000
+    ) -> Dict[int, List[Dict[str, Any]]]:
+        return self.get_user_relationship_many(user_ids, "assigned_tasks", chunk_size)
+
+    def iter_users_assigned_tasks(
+        self, user_ids: Iterable[int], chunk_size: int = 1000
+    ) -> Iterator[Tuple[int, List[Dict[str, Any]]]]:
+        return self.iter_relationship_many(user_ids, "assigned_tasks", chunk_size)
+
+    def get_user_relationship_many(
+        self, user_ids: Iterable[int], relationship_name: str, chunk_size: int = 1000
+    ) -> Dict[int, List[Dict[str, Any]] | Dict[str, Any]]:
+        return self.get_relationship_many(user_ids, relationship_name, chunk_size)
+
     def update_user_field(
         self, filter_param: str, filter_value: Any, field_name: str, new_value: Any
     ) -> Dict[str, Any]:
@@ -79,3 +124,131 @@ class UserActions(BaseActions):
 
     def delete_all_users(self) -> str:
         return self.delete_all()
+
+
+class AsyncUserActions(AsyncBaseActions):
+    def __init__(self, session: AsyncSession = None):
+        super().__init__(model=User, session=session)
+
+    async def create_users_table(self) -> str:
+        return await self.create_table()
+
+    async def drop_users_table(self) -> str:
+        return await self.drop_table()
+
+    async def create_user(self, user_data: Dict[str, Any]) -> Dict[str, Any]:
+        return await self.create_instance(user_data)
+
+    async def create_users(
+        self, users_data: Iterable[Dict[str, Any]], batch_size: int = 1000
+    ) -> List[int]:
+        return await self.create_instances(users_data, batch_size)
+
+    async def upsert_users(
+        self,
+        users_data: Iterable[Dict[str, Any]],
+        conflict_columns: Iterable[str] = ("username",),
+        update_columns: Optional[Iterable[str]] = None,
+        batch_size: int = 1000,
+    ) -> UpsertReport:
+        return await self.upsert_many(
+            users_data, conflict_columns, update_columns, batch_size
+        )
+
+    async def get_user_by_id(self, filter_value: int) -> Optional[Dict[str, Any]]:
+        return await self.get_user_by_filter("id", filter_value)
+
+    async def get_user_by_username(self, filter_value: str) -> Optional[Dict[str, Any]]:
+        return await self.get_user_by_filter("username", filter_value)
+
+    async def get_user_by_filter(
+        self, filter_param: str, filter_value: Any
+    ) -> Optional[Dict[str, Any]]:
+        return await self.filter_by(filter_param, filter_value)
+
+    async def get_random_user(
+        self, strategy: Optional[SamplingStrategy] = None
+    ) -> Optional[Dict[str, Any]]:
+        return await self.get_random(strategy)
+
+    async def get_user_field(
+        self, filter_param: str, filter_value: Any, field_name: str
+    ) -> Any:
+        return await self.get_field_value(filter_param, filter_value, field_name)
+
+    async def get_all_users(self) -> Optional[List[Dict[str, Any]]]:
+        return await self.get_all()
+
+    async def get_all_users_by_filter(
+        self, filter_param: str, filter_value: Any
+    ) -> Optional[List[Dict[str, Any]]]:
+        return await self.get_all_by_filter(filter_param, filter_value)
+
+    def iter_all_users(self, chunk_size: int = 1000) -> AsyncIterator[Dict[str, Any]]:
+        return self.iter_all(chunk_size)
+
+    def iter_all_users_by_filter(
+        self, filter_param: str, filter_value: Any, chunk_size: int = 1000
+    ) -> AsyncIterator[Dict[str, Any]]:
+        return self.iter_by_filter(filter_param, filter_value, chunk_size)
+
+    async def get_user_role(
+        self, filter_param: str, filter_value: Any
+    ) -> Dict[str, Any]:
+        return await self.get_user_relationship(filter_param, filter_value, "role")
+
+    async def get_user_created_tasks(
+        self, filter_param: str, filter_value: Any
+    ) -> List[Dict[str, Any]]:
+        return await self.get_user_relationship(
+            filter_param, filter_value, "created_tasks"
+        )
+
+    async def get_user_assigned_tasks(
+        self, filter_param: str, filter_value: Any
+    ) -> List[Dict[str, Any]]:
+        return await self.get_user_relationship(
+            filter_param, filter_value, "assigned_tasks"
+        )
+
+    async def get_user_relationship(
+        self, filter_param: str, filter_value: Any, relationship_name: str
+    ) -> List[Dict[str, Any]] | Dict[str, Any]:
+        return await self.get_relationship(
+            filter_param, filter_value, relationship_name
+        )
+
+    async def get_users_assigned_tasks(
+        self, user_ids: Iterable[int], chunk_size: int = 1000
+    ) -> Dict[int, List[Dict[str, Any]]]:
+        return await self.get_user_relationship_many(
+            user_ids, "assigned_tasks", chunk_size
+        )
+
+    def iter_users_assigned_tasks(
+        self, user_ids: Iterable[int], chunk_size: int = 1000
+    ) -> AsyncIterator[Tuple[int, List[Dict[str, Any]]]]:
+        return self.iter_relationship_many(user_ids, "assigned_tasks", chunk_size)
+
+    async def get_user_relationship_many(
+        self, user_ids: Iterable[int], relationship_name: str, chunk_size: int = 1000
+    ) -> Dict[int, List[Dict[str, Any]] | Dict[str, Any]]:
+        return await self.get_relationship_many(user_ids, relationship_name, chunk_size)
+
+    async def update_user_field(
+        self, filter_param: str, filter_value: Any, field_name: str, new_value: Any
+    ) -> Dict[str, Any]:
+        return await self.update_field(
+            filter_param, filter_value, field_name, new_value
+        )
+
+    async def update_user_fields(
+        self, filter_param: str, filter_value: Any, updated_data: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        return await self.update_fields(filter_param, filter_value, updated_data)
+
+    async def delete_user(self, filter_param: str, filter_value: Any) -> str:
+        return await self.delete(filter_param, filter_value)
+
+    async def delete_all_users(self) -> str:
+        return await self.delete_all()
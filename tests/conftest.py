@@ -1,47 +1,241 @@
-from typing import Any, Dict, List
+from contextlib import contextmanager
+from typing import Any, Callable, ContextManager, Dict, List, Optional
 
 import pytest
-from sqlalchemy import create_engine
+import pytest_asyncio
+from sqlalchemy import Connection, Engine, create_engine, text
+from sqlalchemy.ext.asyncio import (AsyncEngine, AsyncSession,
+                                    async_sessionmaker, create_async_engine)
 from sqlalchemy.orm import Session, sessionmaker
+from sqlalchemy.schema import CreateSchema, DropSchema
 
 from config import settings
-from tests.actions.priorities import PriorityActions
-from tests.actions.roles import RoleActions
-from tests.actions.statuses import StatusActions
-from tests.actions.tasks import TaskActions
-from tests.actions.users import UserActions
+from src.db import db
+from src.db.db import get_engine_options, use_search_path
+from src.db.instrumentation import (NPlusOneDetector, QueryRecorder,
+                                    instrument, query_registry)
+from src.db.models import Base
+from src.db.snapshots import SnapshotManager
+from tests.actions.priorities import AsyncPriorityActions, PriorityActions
+from tests.actions.reference_cache import invalidate_reference_caches
+from tests.actions.roles import AsyncRoleActions, RoleActions
+from tests.actions.statuses import AsyncStatusActions, StatusActions
+from tests.actions.tasks import AsyncTaskActions, TaskActions
+from tests.actions.users import AsyncUserActions, UserActions
 from tests.factories.factory_actions import (PriorityFactoryActions,
                                              RoleFactoryActions,
                                              StatusFactoryActions,
                                              TaskFactoryActions,
                                              UserFactoryActions)
+from tests.factories.id_pools import invalidate_fk_id_pools, track_fk_id_pools
+from tests.factories.seeds import SEEDED_TASKS
 
 DATABASE_URI: str = settings.db.uri
+ASYNC_DATABASE_URI: str = settings.db.async_uri
+ISOLATION_MODES: List[str] = ["savepoint", "truncate"]
+
+
+def pytest_addoption(parser: pytest.Parser) -> None:
+    parser.addoption(
+        "--db-isolation",
+        choices=ISOLATION_MODES,
+        default="savepoint",
+        help="savepoint: roll back an outer transaction after each test; "
+        "truncate: commit for real and TRUNCATE ... CASCADE all tables afterwards",
+    )
+    parser.addoption(
+        "--sql-stats",
+        default="sql_stats.json",
+        help="write per-action SQL latency and query counts to this JSON file "
+        "at the end of the session (suffixed with the xdist worker id); "
+        'pass --sql-stats="" to skip the dump',
+    )
+
+
+def pytest_configure(config: pytest.Config) -> None:
+    config.addinivalue_line(
+        "markers",
+        "db_isolation(mode): override --db-isolation for tests whose data must "
+        "be visible to other connections",
+    )
+    config.addinivalue_line(
+        "markers",
+        "n_plus_one_threshold(count): allow an action call to repeat a statement "
+        "shape up to count times before the N+1 detector fails the test",
+    )
+
+
+def get_worker_id(config: pytest.Config) -> Optional[str]:
+    workerinput = getattr(config, "workerinput", None)
+    return workerinput["workerid"] if workerinput else None
+
+
+def pytest_sessionfinish(session: pytest.Session, exitstatus: int) -> None:
+    sql_stats: str = session.config.getoption("--sql-stats")
+    if not sql_stats or session.config.option.collectonly or not session.testscollected:
+        return
+    worker_id = get_worker_id(session.config)
+    if worker_id is None and getattr(session.config.option, "dist", "no") != "no":
+        return
+    if worker_id is not None:
+        stem, _, suffix = sql_stats.rpartition(".")
+        sql_stats = f"{stem}_{worker_id}.{suffix}" if stem else f"{suffix}_{worker_id}"
+    query_registry.dump(sql_stats)
 
 
 @pytest.fixture
-def db_engine() -> create_engine:
-    engine: create_engine = create_engine(DATABASE_URI)
+def db_isolation(request: pytest.FixtureRequest) -> str:
+    marker = request.node.get_closest_marker("db_isolation")
+    if marker is not None:
+        return marker.args[0]
+    return request.config.getoption("--db-isolation")
+
+
+def truncate_tables(connection: Connection) -> None:
+    table_names = ", ".join(table.name for table in Base.metadata.sorted_tables)
+    connection.execute(text(f"TRUNCATE TABLE {table_names} CASCADE"))
+
+
+@pytest.fixture(scope="session")
+def db_schema(request: pytest.FixtureRequest) -> Optional[str]:
+    worker_id = get_worker_id(request.config)
+    if worker_id is None:
+        yield None
+        return
+    schema = f"test_{worker_id}"
+    with db.engine.begin() as connection:
+        connection.execute(DropSchema(schema, cascade=True, if_exists=True))
+        connection.execute(CreateSchema(schema))
+    use_search_path(db.engine, schema)
+    use_search_path(db.async_engine.sync_engine, schema)
+    Base.metadata.create_all(db.engine)
+    yield schema
+    db.engine.dispose()
+    with db.engine.begin() as connection:
+        connection.execute(DropSchema(schema, cascade=True))
+    db.engine.dispose()
+
+
+@pytest.fixture(scope="session")
+def db_url(db_schema: Optional[str]) -> str:
+    if db_schema is None:
+        return DATABASE_URI
+    return db.engine.url.update_query_dict(
+        {"options": f"-csearch_path={db_schema}"}
+    ).render_as_string(hide_password=False)
+
+
+@pytest.fixture(scope="session")
+def db_engine(db_schema: Optional[str]) -> create_engine:
+    engine: create_engine = create_engine(DATABASE_URI, **get_engine_options())
+    instrument(engine)
+    track_fk_id_pools(engine)
+    if db_schema is not None:
+        use_search_path(engine, db_schema)
     yield engine
     engine.dispose()
 
 
 @pytest.fixture
-def db_session(db_engine: create_engine) -> Session:
-    session_maker: sessionmaker = sessionmaker(bind=db_engine)
+def db_connection(db_engine: create_engine, db_isolation: str) -> Connection:
+    connection: Connection = db_engine.connect()
+    if db_isolation == "savepoint":
+        transaction = connection.begin()
+        yield connection
+        transaction.rollback()
+    else:
+        yield connection
+        with connection.begin():
+            truncate_tables(connection)
+    connection.close()
+    invalidate_fk_id_pools()
+    invalidate_reference_caches()
+
+
+@pytest.fixture(autouse=True)
+def db_session(db_connection: Connection) -> Session:
+    session_maker: sessionmaker = sessionmaker(
+        bind=db_connection, join_transaction_mode="create_savepoint"
+    )
     session: Session = session_maker()
+    db.session.registry.set(session)
     yield session
-    session.close()
+    db.session.remove()
 
 
 @pytest.fixture(autouse=True)
-def clear_database(db_session):
-    yield
-    RoleActions(db_session).delete_all_roles()
-    UserActions(db_session).delete_all_users()
-    PriorityActions(db_session).delete_all_priorities()
-    StatusActions(db_session).delete_all_statuses()
-    TaskActions(db_session).delete_all_tasks()
+def n_plus_one_detector(request: pytest.FixtureRequest) -> NPlusOneDetector:
+    marker = request.node.get_closest_marker("n_plus_one_threshold")
+    detector = (
+        NPlusOneDetector(*marker.args) if marker is not None else NPlusOneDetector()
+    )
+    with detector:
+        yield detector
+    if detector.violations:
+        pytest.fail(f"N+1 queries detected:\n{detector.describe()}", pytrace=False)
+
+
+@pytest.fixture
+def assert_max_queries() -> Callable[[int], ContextManager[QueryRecorder]]:
+    @contextmanager
+    def assert_max(max_queries: int) -> QueryRecorder:
+        with QueryRecorder() as recorder:
+            yield recorder
+        assert len(recorder) <= max_queries, (
+            f"Expected at most {max_queries} queries, {len(recorder)} were issued:\n"
+            f"{recorder.describe()}"
+        )
+
+    return assert_max
+
+
+@pytest.fixture(scope="session")
+def seeded_db_engine(request: pytest.FixtureRequest) -> Engine:
+    snapshot_manager = SnapshotManager()
+    worker_id = get_worker_id(request.config) or "main"
+    database_name = f"{settings.db.database}_{SEEDED_TASKS.name}_{worker_id}"
+    database_url = snapshot_manager.clone(SEEDED_TASKS, database_name)
+    engine: Engine = create_engine(database_url, **get_engine_options())
+    instrument(engine)
+    yield engine
+    engine.dispose()
+    snapshot_manager.drop(database_name)
+
+
+@pytest.fixture
+def seeded_db_session(seeded_db_engine: Engine) -> Session:
+    connection: Connection = seeded_db_engine.connect()
+    transaction = connection.begin()
+    session: Session = Session(
+        bind=connection, join_transaction_mode="create_savepoint"
+    )
+    yield session
+    session.close()
+    transaction.rollback()
+    connection.close()
+
+
+@pytest_asyncio.fixture
+async def async_db_engine(db_schema: Optional[str]) -> AsyncEngine:
+    engine: AsyncEngine = create_async_engine(
+        ASYNC_DATABASE_URI, **get_engine_options(is_async=True)
+    )
+    instrument(engine.sync_engine)
+    track_fk_id_pools(engine.sync_engine)
+    if db_schema is not None:
+        use_search_path(engine.sync_engine, db_schema)
+    yield engine
+    await engine.dispose()
+
+
+@pytest_asyncio.fixture
+async def async_db_session(async_db_engine: AsyncEngine) -> AsyncSession:
+    session_maker: async_sessionmaker = async_sessionmaker(
+        bind=async_db_engine, expire_on_commit=False
+    )
+    session: AsyncSession = session_maker()
+    yield session
+    await session.close()
 
 
 @pytest.fixture
@@ -71,6 +265,12 @@ def role_actions(db_session: Session) -> RoleActions:
     return role_actions
 
 
+@pytest_asyncio.fixture
+async def async_role_actions(async_db_session: AsyncSession) -> AsyncRoleActions:
+    async_role_actions: AsyncRoleActions = AsyncRoleActions(async_db_session)
+    return async_role_actions
+
+
 @pytest.fixture
 def create_user() -> Dict[str, Any]:
     user: Dict[str, Any] = UserFactoryActions.create_user()
@@ -90,6 +290,12 @@ def user_actions(db_session: Session) -> UserActions:
     return user_actions
 
 
+@pytest_asyncio.fixture
+async def async_user_actions(async_db_session: AsyncSession) -> AsyncUserActions:
+    async_user_actions: AsyncUserActions = AsyncUserActions(async_db_session)
+    return async_user_actions
+
+
 @pytest.fixture
 def create_priority() -> Dict[str, Any]:
     priority: Dict[str, Any] = PriorityFactoryActions.create_priority()
@@ -111,6 +317,16 @@ def priority_actions(db_session: Session) -> PriorityActions:
     return priority_actions
 
 
+@pytest_asyncio.fixture
+async def async_priority_actions(
+    async_db_session: AsyncSession,
+) -> AsyncPriorityActions:
+    async_priority_actions: AsyncPriorityActions = AsyncPriorityActions(
+        async_db_session
+    )
+    return async_priority_actions
+
+
 @pytest.fixture
 def create_status() -> Dict[str, Any]:
     status: Dict[str, Any] = StatusFactoryActions.create_status()
@@ -130,6 +346,12 @@ def status_actions(db_session: Session) -> StatusActions:
     return status_actions
 
 
+@pytest_asyncio.fixture
+async def async_status_actions(async_db_session: AsyncSession) -> AsyncStatusActions:
+    async_status_actions: AsyncStatusActions = AsyncStatusActions(async_db_session)
+    return async_status_actions
+
+
 @pytest.fixture
 def create_task() -> Dict[str, Any]:
     task: Dict[str, Any] = TaskFactoryActions.create_task()
@@ -147,3 +369,9 @@ def create_tasks() -> List[Dict[str, Any]]:
 def task_actions(db_session: Session) -> TaskActions:
     task_actions: TaskActions = TaskActions(db_session)
     return task_actions
+
+
+@pytest_asyncio.fixture
+async def async_task_actions(async_db_session: AsyncSession) -> AsyncTaskActions:
+    async_task_actions: AsyncTaskActions = AsyncTaskActions(async_db_session)
+    return async_task_actions
@@ -1,9 +1,18 @@
 import factory
 
 from src.db.db import session
+from tests.factories.id_pools import get_fk_id_pool
 
 
 class BaseFactory(factory.alchemy.SQLAlchemyModelFactory):
     class Meta:
         sqlalchemy_session = session
         sqlalchemy_session_persistence = "commit"
+
+    @classmethod
+    def _create(cls, model_class, *args, **kwargs):
+        instance = super()._create(model_class, *args, **kwargs)
+        fk_id_pool = get_fk_id_pool(model_class, cls._meta.sqlalchemy_session)
+        if fk_id_pool is not None:
+            fk_id_pool.add(instance.id)
+        return instance
@@ -2,18 +2,22 @@ import json
 import random
 from typing import Any, Dict, List
 
-from factory import LazyAttribute
+from factory import Iterator, LazyAttribute
 from faker import Faker
 
 from src.db.enums import PriorityNames, RoleNames, StatusNames
 from src.db.models import Priority, Role, Status, Task, User
 from tests.factories.base import BaseFactory
-from tests.factories.factory_utils import (get_current_datetime,
-                                           get_updated_datetime, pwd_context,
-                                           random_priority_id, random_role_id,
-                                           random_status_id, random_user_id,
-                                           roles_permissions,
+from tests.factories.factory_utils import (DEFAULT_PASSWORD_HASH_MODE,
+                                           PasswordHashMode,
+                                           get_current_datetime,
+                                           get_updated_datetime, hash_password,
+                                           hash_passwords, random_priority_id,
+                                           random_role_id, random_status_id,
+                                           random_user_id, roles_permissions,
                                            status_permissions)
+from tests.factories.value_pools import (emails, full_names, ipaddresses,
+                                         usernames)
 
 fake = Faker()
 
@@ -63,16 +67,19 @@ class UserFactory(BaseFactory):
     class Meta:
         model = User
 
-    username = LazyAttribute(lambda obj: fake.user_name())
-    full_name = LazyAttribute(lambda obj: fake.name())
-    email = LazyAttribute(lambda obj: fake.email())
+    class Params:
+        password_hash_mode = DEFAULT_PASSWORD_HASH_MODE
+
+    username = LazyAttribute(lambda obj: usernames())
+    full_name = LazyAttribute(lambda obj: full_names())
+    email = LazyAttribute(lambda obj: emails())
     hashed_password = LazyAttribute(
-        lambda obj: pwd_context.hash(fake.password(length=16))
+        lambda obj: hash_password(fake.password(length=16), obj.password_hash_mode)
     )
     role_id = LazyAttribute(lambda obj: random_role_id())
     is_active = LazyAttribute(lambda obj: fake.boolean())
     is_superuser = LazyAttribute(lambda obj: fake.boolean())
-    ipaddress = LazyAttribute(lambda obj: random.choice([fake.ipv4(), fake.ipv6()]))
+    ipaddress = LazyAttribute(lambda obj: ipaddresses())
     last_login_at = LazyAttribute(
         lambda obj: get_updated_datetime(days=1, hours=1, minutes=30)
     )
@@ -81,6 +88,23 @@ class UserFactory(BaseFactory):
     )
     registered_at = LazyAttribute(lambda obj: get_current_datetime())
 
+    @classmethod
+    def create_batch(cls, size: int, **kwargs) -> List[User]:
+        password_hash_mode = kwargs.get(
+            "password_hash_mode", DEFAULT_PASSWORD_HASH_MODE
+        )
+        if (
+            password_hash_mode is PasswordHashMode.PROCESS_POOL
+            and "hashed_password" not in kwargs
+        ):
+            kwargs["hashed_password"] = Iterator(
+                hash_passwords(
+                    (fake.password(length=16) for _ in range(size)),
+                    password_hash_mode,
+                )
+            )
+        return super().create_batch(size, **kwargs)
+
     @classmethod
     def user_dict(cls, **kwargs) -> Dict[str, Any]:
         user = cls.create(**kwargs)
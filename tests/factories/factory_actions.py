@@ -27,8 +27,8 @@ class UserFactoryActions:
         return user
 
     @classmethod
-    def create_users(cls, num_users: int) -> List[Dict[str, Any]]:
-        users = UserFactory.users_dict(num_users)
+    def create_users(cls, num_users: int, **kwargs) -> List[Dict[str, Any]]:
+        users = UserFactory.users_dict(num_users, **kwargs)
         logger.info("Created %d users using %s", num_users, cls.__name__)
         return users
 
@@ -1,18 +1,35 @@
+import os
 import random
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime, timedelta
-from typing import Any, Dict, Optional
+from enum import Enum
+from functools import cache
+from typing import Any, Dict, Iterable, List, Optional
 
 from passlib.context import CryptContext
 
 from src.db.db import session
 from src.db.enums import RolePermission, StatusPermission
-from tests.actions.priorities import PriorityActions
-from tests.actions.roles import RoleActions
-from tests.actions.statuses import StatusActions
+from src.db.models import Priority, Role, Status, User
 from tests.actions.tasks import TaskActions
 from tests.actions.users import UserActions
+from tests.factories.id_pools import get_fk_id_pool
 
 pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+low_rounds_pwd_context = pwd_context.copy(bcrypt__rounds=4)
+
+PRECOMPUTED_PASSWORD: str = "factory-password"
+PRECOMPUTED_POOL_SIZE: int = 8
+
+
+class PasswordHashMode(Enum):
+    BCRYPT = "bcrypt"
+    PRECOMPUTED = "precomputed"
+    LOW_ROUNDS = "low_rounds"
+    PROCESS_POOL = "process_pool"
+
+
+DEFAULT_PASSWORD_HASH_MODE: PasswordHashMode = PasswordHashMode.PRECOMPUTED
 
 num_permissions = random.randint(1, 4)
 roles_permissions = [
@@ -23,40 +40,70 @@ status_permissions = [
 ]
 
 
+def bcrypt_hash(password: str) -> str:
+    return pwd_context.hash(password)
+
+
+@cache
+def get_precomputed_hashes() -> List[str]:
+    return [bcrypt_hash(PRECOMPUTED_PASSWORD) for _ in range(PRECOMPUTED_POOL_SIZE)]
+
+
+@cache
+def get_hash_executor() -> ProcessPoolExecutor:
+    return ProcessPoolExecutor(max_workers=os.cpu_count())
+
+
+def hash_password(
+    password: str, mode: PasswordHashMode = DEFAULT_PASSWORD_HASH_MODE
+) -> str:
+    if mode is PasswordHashMode.PRECOMPUTED:
+        return random.choice(get_precomputed_hashes())
+    if mode is PasswordHashMode.LOW_ROUNDS:
+        return low_rounds_pwd_context.hash(password)
+    if mode is PasswordHashMode.PROCESS_POOL:
+        return get_hash_executor().submit(bcrypt_hash, password).result()
+    return bcrypt_hash(password)
+
+
+def hash_passwords(
+    passwords: Iterable[str], mode: PasswordHashMode = DEFAULT_PASSWORD_HASH_MODE
+) -> List[str]:
+    if mode is PasswordHashMode.PROCESS_POOL:
+        return list(get_hash_executor().map(bcrypt_hash, passwords, chunksize=8))
+    return [hash_password(password, mode) for password in passwords]
+
+
 def random_role_id() -> int:
-    random_role = RoleActions(session).get_random_role()
-    if "id" in random_role:
-        role_id = random_role["id"]
+    role_id = get_fk_id_pool(Role, session).random_id(session)
+    if role_id is not None:
         return role_id
     else:
-        raise ValueError("Role ID not found in the random_role dictionary")
+        raise ValueError("Role ID not found in the role ID pool")
 
 
 def random_user_id() -> int:
-    random_user = UserActions(session).get_random_user()
-    if "id" in random_user:
-        user_id = random_user["id"]
+    user_id = get_fk_id_pool(User, session).random_id(session)
+    if user_id is not None:
         return user_id
     else:
-        raise ValueError("User ID not found in the random_user dictionary")
+        raise ValueError("User ID not found in the user ID pool")
 
 
 def random_priority_id() -> int:
-    random_priority = PriorityActions(session).get_random_priority()
-    if "id" in random_priority:
-        priority_id = random_priority["id"]
+    priority_id = get_fk_id_pool(Priority, session).random_id(session)
+    if priority_id is not None:
         return priority_id
     else:
-        raise ValueError("Priority ID not found in the random_priority dictionary")
+        raise ValueError("Priority ID not found in the priority ID pool")
 
 
 def random_status_id() -> int:
-    random_status = StatusActions(session).get_random_status()
-    if "id" in random_status:
-        status_id = random_status["id"]
+    status_id = get_fk_id_pool(Status, session).random_id(session)
+    if status_id is not None:
         return status_id
     else:
-        raise ValueError("Status ID not found in the random_status dictionary")
+        raise ValueError("Status ID not found in the status ID pool")
 
 
 def get_random_task() -> Optional[Dict[str, Any]]:
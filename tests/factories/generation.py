@@ -0,0 +1,274 @@
+import hashlib
+import json
+import random
+import string
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from functools import cache
+from typing import Any, Callable, Dict, Iterator, List, Mapping, Optional
+
+from faker import Faker
+from passlib.hash import bcrypt
+from sqlalchemy import Engine, NullPool, create_engine, func, select, text
+
+from config import settings
+from src.db.enums import (PriorityNames, RoleNames, RolePermission,
+                          StatusNames, StatusPermission)
+from src.db.loader import LoadReport, copy_rows, get_table, sort_table_names
+from src.logger.logger import logger
+from tests.factories.factory_utils import PRECOMPUTED_PASSWORD
+from tests.factories.value_pools import (ValuePool, build_email,
+                                         build_username, to_base36)
+
+DEFAULT_SHARD_SIZE: int = 50_000
+SHARD_POOL_SIZE: int = 500
+DATASET_EPOCH: datetime = datetime(2024, 1, 1)
+BCRYPT_SALT_CHARS: str = (
+    "./" + string.ascii_uppercase + string.ascii_lowercase + string.digits
+)
+
+
+@dataclass(frozen=True)
+class Shard:
+    table_name: str
+    index: int
+    ids: range
+    seed: int
+    id_ranges: Dict[str, range]
+    hashed_password: str
+    database_url: str
+
+
+class ShardContext:
+    def __init__(self, shard: Shard) -> None:
+        self.shard = shard
+        self.rng = random.Random(shard.seed)
+        self.fake = Faker()
+        self.fake.seed_instance(shard.seed)
+        self.usernames = self.pool(self.fake.user_name)
+        self.emails = self.pool(self.fake.email)
+        self.full_names = self.pool(self.fake.name)
+        self.ipaddresses = self.pool(
+            lambda: self.rng.choice([self.fake.ipv4(), self.fake.ipv6()])
+        )
+        self.descriptions = self.pool(lambda: self.fake.text(max_nb_chars=255))
+
+    def pool(self, generate: Callable[[], Any]) -> ValuePool:
+        return ValuePool(generate, size=SHARD_POOL_SIZE, rng=self.rng)
+
+    def foreign_id(self, table_name: str) -> int:
+        return self.rng.choice(self.shard.id_ranges[table_name])
+
+    def timestamp(self, max_days: int = 365) -> datetime:
+        minutes = self.rng.randrange(max_days * 24 * 60)
+        return DATASET_EPOCH + timedelta(minutes=minutes)
+
+    def permissions(self, permission_enum: Any) -> str:
+        permissions = self.rng.sample(
+            [permission.value for permission in permission_enum],
+            self.rng.randint(1, len(permission_enum)),
+        )
+        return json.dumps({"permissions": permissions})
+
+
+def build_role_rows(context: ShardContext) -> Iterator[Dict[str, Any]]:
+    for row_id in context.shard.ids:
+        yield {
+            "id": row_id,
+            "role_name": context.rng.choice(list(RoleNames)).value,
+            "permissions": context.permissions(RolePermission),
+            "creator_id": 0,
+            "created_at": context.timestamp(),
+        }
+
+
+def build_user_rows(context: ShardContext) -> Iterator[Dict[str, Any]]:
+    for row_id in context.shard.ids:
+        suffix = to_base36(row_id)
+        registered_at = context.timestamp()
+        yield {
+            "id": row_id,
+            "username": build_username(context.usernames(), suffix),
+            "full_name": context.full_names(),
+            "email": build_email(context.emails(), suffix),
+            "hashed_password": context.shard.hashed_password,
+            "role_id": context.foreign_id("roles"),
+            "is_active": context.rng.random() < 0.5,
+            "is_superuser": context.rng.random() < 0.5,
+            "ipaddress": context.ipaddresses(),
+            "last_login_at": registered_at + timedelta(days=1, hours=1, minutes=30),
+            "updated_at": registered_at + timedelta(days=2, hours=3, minutes=10),
+            "registered_at": registered_at,
+        }
+
+
+def build_priority_rows(context: ShardContext) -> Iterator[Dict[str, Any]]:
+    for row_id in context.shard.ids:
+        yield {
+            "id": row_id,
+            "priority_name": context.rng.choice(list(PriorityNames)).value,
+            "creator_id": context.foreign_id("users"),
+            "created_at": context.timestamp(),
+        }
+
+
+def build_status_rows(context: ShardContext) -> Iterator[Dict[str, Any]]:
+    for row_id in context.shard.ids:
+        yield {
+            "id": row_id,
+            "status_name": context.rng.choice(list(StatusNames)).value,
+            "permissions": context.permissions(StatusPermission),
+            "creator_id": context.foreign_id("users"),
+            "created_at": context.timestamp(),
+        }
+
+
+def build_task_rows(context: ShardContext) -> Iterator[Dict[str, Any]]:
+    for row_id in context.shard.ids:
+        created_at = context.timestamp()
+        yield {
+            "id": row_id,
+            "title": f"Task {row_id}",
+            "description": context.descriptions(),
+            "deadline": created_at + timedelta(days=context.rng.randint(1, 30)),
+            "priority_id": context.foreign_id("priorities"),
+            "status_id": context.foreign_id("statuses"),
+            "creator_id": context.foreign_id("users"),
+            "assignee_id": context.foreign_id("users"),
+            "created_at": created_at,
+        }
+
+
+table_dependencies: Dict[str, List[str]] = {
+    "roles": [],
+    "users": ["roles"],
+    "priorities": ["users"],
+    "statuses": ["users"],
+    "tasks": ["priorities", "statuses", "users"],
+}
+
+row_builders: Dict[str, Callable[[ShardContext], Iterator[Dict[str, Any]]]] = {
+    "roles": build_role_rows,
+    "users": build_user_rows,
+    "priorities": build_priority_rows,
+    "statuses": build_status_rows,
+    "tasks": build_task_rows,
+}
+
+
+def shard_seed(seed: int, table_name: str, index: int) -> int:
+    digest = hashlib.sha256(f"{seed}:{table_name}:{index}".encode()).digest()
+    return int.from_bytes(digest[:8], "big")
+
+
+def dataset_password_hash(seed: int) -> str:
+    rng = random.Random(seed)
+    salt = "".join(rng.choices(BCRYPT_SALT_CHARS, k=21)) + "."
+    return bcrypt.using(salt=salt).hash(PRECOMPUTED_PASSWORD)
+
+
+def check_dependencies(counts: Mapping[str, int]) -> None:
+    for table_name in counts:
+        missing = [
+            dependency
+            for dependency in table_dependencies[table_name]
+            if not counts.get(dependency)
+        ]
+        if missing:
+            error_message = (
+                f"Cannot generate {table_name} without generating {', '.join(missing)}"
+            )
+            logger.error(error_message)
+            raise ValueError(error_message)
+
+
+def plan_id_ranges(engine: Engine, counts: Mapping[str, int]) -> Dict[str, range]:
+    id_ranges = {}
+    with engine.connect() as connection:
+        for table_name, count in counts.items():
+            table = get_table(table_name)
+            max_id = connection.execute(
+                select(func.coalesce(func.max(table.c.id), 0))
+            ).scalar_one()
+            id_ranges[table_name] = range(max_id + 1, max_id + 1 + count)
+    return id_ranges
+
+
+def plan_shards(
+    counts: Mapping[str, int],
+    id_ranges: Dict[str, range],
+    seed: int,
+    shard_size: int,
+    database_url: str,
+) -> List[List[Shard]]:
+    hashed_password = dataset_password_hash(seed)
+    return [
+        [
+            Shard(
+                table_name=table_name,
+                index=index,
+                ids=id_ranges[table_name][start : start + shard_size],
+                seed=shard_seed(seed, table_name, index),
+                id_ranges=id_ranges,
+                hashed_password=hashed_password,
+                database_url=database_url,
+            )
+            for index, start in enumerate(range(0, counts[table_name], shard_size))
+        ]
+        for table_name in sort_table_names(counts)
+    ]
+
+
+def iter_shard_rows(shard: Shard) -> Iterator[Dict[str, Any]]:
+    return row_builders[shard.table_name](ShardContext(shard))
+
+
+@cache
+def get_shard_engine(database_url: str) -> Engine:
+    return create_engine(database_url, poolclass=NullPool)
+
+
+def load_shard(shard: Shard) -> LoadReport:
+    column_names = [column.name for column in get_table(shard.table_name).columns]
+    return copy_rows(
+        shard.table_name,
+        iter_shard_rows(shard),
+        column_names=column_names,
+        engine=get_shard_engine(shard.database_url),
+    )
+
+
+def reset_sequences(engine: Engine, table_names: List[str]) -> None:
+    with engine.begin() as connection:
+        for table_name in table_names:
+            connection.execute(
+                text(
+                    "SELECT setval(pg_get_serial_sequence(:table_name, 'id'), "
+                    f"(SELECT max(id) FROM {table_name}))"
+                ),
+                {"table_name": table_name},
+            )
+
+
+def generate_dataset(
+    counts: Mapping[str, int],
+    seed: int = 0,
+    processes: Optional[int] = None,
+    shard_size: int = DEFAULT_SHARD_SIZE,
+    database_url: str = settings.db.uri,
+) -> List[LoadReport]:
+    check_dependencies(counts)
+    engine = create_engine(database_url, poolclass=NullPool)
+    try:
+        id_ranges = plan_id_ranges(engine, counts)
+        table_shards = plan_shards(counts, id_ranges, seed, shard_size, database_url)
+        reports = []
+        with ProcessPoolExecutor(max_workers=processes) as executor:
+            for shards in table_shards:
+                reports.extend(executor.map(load_shard, shards))
+        reset_sequences(engine, sort_table_names(counts))
+    finally:
+        engine.dispose()
+    logger.info(f"Generated {dict(counts)} with seed {seed} in {len(reports)} shards")
+    return reports
@@ -0,0 +1,93 @@
+import random
+import threading
+from typing import Dict, List, Optional, Set, Tuple, Type
+
+from sqlalchemy import Delete, Engine, Table, event, select
+from sqlalchemy.orm import Session
+
+from src.db.models import Base, Priority, Role, Status, User
+from tests.actions.mappers import get_dml_statement
+from tests.actions.reference_cache import get_bind_key, get_url_key
+
+
+class ForeignKeyIdPool:
+    def __init__(self, model: Type[Base]) -> None:
+        self.model = model
+        self.ids: List[int] = []
+        self.loaded: bool = False
+
+    def load(self, session: Session) -> None:
+        primary_key = self.model.__table__.primary_key.columns[0]
+        self.ids = list(session.execute(select(primary_key)).scalars())
+        self.loaded = True
+
+    def add(self, instance_id: int) -> None:
+        if self.loaded:
+            self.ids.append(instance_id)
+
+    def invalidate(self) -> None:
+        self.ids = []
+        self.loaded = False
+
+    def random_id(self, session: Session) -> Optional[int]:
+        if not self.ids:
+            self.load(session)
+        return random.choice(self.ids) if self.ids else None
+
+
+FK_ID_POOL_MODELS: Tuple[Type[Base], ...] = (Role, User, Priority, Status)
+fk_id_pools: Dict[Tuple[str, Type[Base]], ForeignKeyIdPool] = {}
+fk_id_pools_lock = threading.Lock()
+
+
+def get_fk_id_pool(model: Type[Base], session: Session) -> Optional[ForeignKeyIdPool]:
+    if model not in FK_ID_POOL_MODELS:
+        return None
+    key = (get_bind_key(session), model)
+    with fk_id_pools_lock:
+        pool = fk_id_pools.get(key)
+        if pool is None:
+            pool = fk_id_pools[key] = ForeignKeyIdPool(model)
+    return pool
+
+
+def invalidate_fk_id_pools() -> None:
+    with fk_id_pools_lock:
+        pools = list(fk_id_pools.values())
+    for pool in pools:
+        pool.invalidate()
+
+
+def get_cascade_tables(table: Table) -> Set[Table]:
+    tables = {table}
+    pending = [table]
+    while pending:
+        parent_table = pending.pop()
+        for dependent_table in Base.metadata.sorted_tables:
+            if dependent_table in tables:
+                continue
+            if any(
+                foreign_key.column.table == parent_table
+                and foreign_key.ondelete == "CASCADE"
+                for foreign_key in dependent_table.foreign_keys
+            ):
+                tables.add(dependent_table)
+                pending.append(dependent_table)
+    return tables
+
+
+def invalidate_on_delete(connection, clauseelement, *args) -> None:
+    statement = get_dml_statement(clauseelement)
+    if isinstance(statement, Delete):
+        bind_key = get_url_key(connection.engine.url)
+        deleted_tables = get_cascade_tables(statement.table)
+        with fk_id_pools_lock:
+            pools = list(fk_id_pools.items())
+        for (pool_bind_key, model), pool in pools:
+            if pool_bind_key == bind_key and model.__table__ in deleted_tables:
+                pool.invalidate()
+
+
+def track_fk_id_pools(engine: Engine) -> None:
+    if not event.contains(engine, "after_execute", invalidate_on_delete):
+        event.listen(engine, "after_execute", invalidate_on_delete)
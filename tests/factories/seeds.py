@@ -0,0 +1,89 @@
+import json
+import random
+from typing import Any, Dict, Iterator, List
+
+from sqlalchemy import Engine
+from sqlalchemy.orm import Session
+
+from src.db.enums import PriorityNames, RoleNames, StatusNames
+from src.db.loader import copy_rows
+from src.db.snapshots import SeedSpec
+from tests.actions.priorities import PriorityActions
+from tests.actions.roles import RoleActions
+from tests.actions.statuses import StatusActions
+from tests.actions.users import UserActions
+from tests.factories.factories import fake
+from tests.factories.factory_utils import (get_current_datetime,
+                                           get_updated_datetime, pwd_context,
+                                           roles_permissions,
+                                           status_permissions)
+
+
+def iter_seed_tasks(
+    count: int, user_ids: List[int], priority_ids: List[int], status_ids: List[int]
+) -> Iterator[Dict[str, Any]]:
+    for index in range(count):
+        yield {
+            "title": f"Seeded task {index}",
+            "description": fake.text(max_nb_chars=255),
+            "deadline": get_updated_datetime(days=1, hours=1, minutes=30),
+            "priority_id": random.choice(priority_ids),
+            "status_id": random.choice(status_ids),
+            "creator_id": random.choice(user_ids),
+            "assignee_id": random.choice(user_ids),
+            "created_at": get_current_datetime(),
+        }
+
+
+def seed_tasks(engine: Engine, users: int, tasks: int) -> None:
+    hashed_password = pwd_context.hash("seeded-password")
+    with Session(engine) as session:
+        role_ids = RoleActions(session).create_roles(
+            {
+                "role_name": role_name.value,
+                "permissions": json.dumps({"permissions": roles_permissions}),
+                "creator_id": 0,
+            }
+            for role_name in RoleNames
+        )
+        user_ids = UserActions(session).create_users(
+            {
+                "username": f"seeded_user_{index}",
+                "full_name": fake.name(),
+                "email": f"seeded_user_{index}@example.com",
+                "hashed_password": hashed_password,
+                "role_id": random.choice(role_ids),
+                "is_active": True,
+                "registered_at": get_current_datetime(),
+            }
+            for index in range(users)
+        )
+        priority_ids = PriorityActions(session).create_priorities(
+            {"priority_name": priority_name.value, "creator_id": user_ids[0]}
+            for priority_name in PriorityNames
+        )
+        status_ids = StatusActions(session).create_statuses(
+            {
+                "status_name": status_name.value,
+                "permissions": json.dumps({"permissions": status_permissions}),
+                "creator_id": user_ids[0],
+            }
+            for status_name in StatusNames
+        )
+    copy_rows(
+        "tasks",
+        iter_seed_tasks(tasks, user_ids, priority_ids, status_ids),
+        engine=engine,
+    )
+
+
+SEEDED_TASKS: SeedSpec = SeedSpec(
+    name="tasks",
+    seed=seed_tasks,
+    params={"users": 20, "tasks": 2000},
+    modules=(
+        "src.db.loader",
+        "tests.factories.factories",
+        "tests.factories.factory_utils",
+    ),
+)
@@ -0,0 +1,110 @@
+import itertools
+import os
+import random
+import string
+from typing import Any, Callable, List, Optional
+
+from faker import Faker
+
+from src.db.models import User
+
+DEFAULT_POOL_SIZE: int = 2000
+DEFAULT_BATCH_SIZE: int = 1000
+USERNAME_MAX_LENGTH: int = User.__table__.c.username.type.length
+BASE36_DIGITS: str = string.digits + string.ascii_lowercase
+PROCESS_TOKEN_LENGTH: int = 5
+
+fake = Faker()
+
+
+def to_base36(number: int) -> str:
+    digits = []
+    while True:
+        number, remainder = divmod(number, 36)
+        digits.append(BASE36_DIGITS[remainder])
+        if not number:
+            return "".join(reversed(digits))
+
+
+def process_token() -> str:
+    return to_base36(os.getpid()).rjust(PROCESS_TOKEN_LENGTH, "0")
+
+
+class ValuePool:
+    def __init__(
+        self,
+        generate: Callable[[], Any],
+        size: int = DEFAULT_POOL_SIZE,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        rng: Optional[random.Random] = None,
+    ) -> None:
+        self.generate = generate
+        self.size = size
+        self.batch_size = batch_size
+        self.rng = rng or random.Random()
+        self.values: List[Any] = []
+        self.buffer: List[Any] = []
+
+    def fill(self) -> None:
+        self.values = [self.generate() for _ in range(self.size)]
+
+    def take(self, count: int) -> List[Any]:
+        if not self.values:
+            self.fill()
+        return self.rng.choices(self.values, k=count)
+
+    def __call__(self) -> Any:
+        if not self.buffer:
+            self.buffer = self.take(self.batch_size)
+        return self.buffer.pop()
+
+
+class UniqueValuePool(ValuePool):
+    def __init__(
+        self,
+        generate: Callable[[], str],
+        build: Callable[[str, str], str],
+        size: int = DEFAULT_POOL_SIZE,
+        batch_size: int = DEFAULT_BATCH_SIZE,
+        rng: Optional[random.Random] = None,
+    ) -> None:
+        super().__init__(generate, size, batch_size, rng)
+        self.build = build
+        self.pid: Optional[int] = None
+        self.token = ""
+        self.counter = itertools.count()
+
+    def check_process(self) -> None:
+        if self.pid != os.getpid():
+            self.pid = os.getpid()
+            self.token = process_token()
+            self.counter = itertools.count()
+            self.buffer = []
+
+    def take(self, count: int) -> List[str]:
+        self.check_process()
+        bases = super().take(count)
+        token = self.token
+        counter = self.counter
+        return [
+            self.build(base, f"{token}{to_base36(next(counter))}") for base in bases
+        ]
+
+    def __call__(self) -> str:
+        self.check_process()
+        return super().__call__()
+
+
+def build_username(base: str, suffix: str) -> str:
+    return f"{base[:USERNAME_MAX_LENGTH - len(suffix) - 1]}_{suffix}"
+
+
+def build_email(base: str, suffix: str) -> str:
+    local_part, domain = base.split("@", 1)
+    return f"{local_part}.{suffix}@{domain}"
+
+
+usernames = UniqueValuePool(fake.user_name, build_username)
+emails = UniqueValuePool(fake.email, build_email)
+full_names = ValuePool(fake.name)
+ipaddresses = ValuePool(lambda: random.choice([fake.ipv4(), fake.ipv6()]))
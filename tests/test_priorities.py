@@ -1,11 +1,18 @@
 import random
 
 import pytest
+from sqlalchemy import update
 
 from src.db.enums import PriorityNames
+from src.db.models import Priority, User
 from src.logger.logger import logger
+from tests.actions.priorities import PriorityActions
+from tests.actions.reference_cache import (ReferenceCache, get_reference_cache,
+                                           reference_cache_stats)
 from tests.factories.factory_utils import (get_current_datetime,
-                                           get_random_task, random_user_id)
+                                           get_random_task, random_priority_id,
+                                           random_user_id)
+from tests.factories.id_pools import get_fk_id_pool
 
 
 class TestPriorities:
@@ -241,6 +248,44 @@ class TestPriorities:
             all_priorities is None
         ), f"{test_case_name} :: Priorities were not deleted"
 
+    @pytest.mark.usefixtures(
+        "create_superuser", "create_roles", "create_users", "create_priorities"
+    )
+    def test_delete_priorities_in_chunks(self, priority_actions):
+        test_case_name = f"{self.__class__.__name__}.test_delete_priorities_in_chunks"
+        logger.info(f"[priorities_tests] :: Running test case: {test_case_name}")
+
+        priority_ids = [
+            priority["id"] for priority in priority_actions.get_all_priorities()
+        ]
+        assert (
+            random_priority_id() in priority_ids
+        ), f"{test_case_name} :: The priority ID pool was not loaded"
+        cached_priority = priority_actions.get_priority_by_id(priority_ids[0])
+        assert (
+            get_reference_cache(Priority, priority_actions.session).get(priority_ids[0])
+            == cached_priority
+        ), f"{test_case_name} :: The priority was not cached"
+
+        user_id = random_user_id()
+        report = priority_actions.delete_in_chunks(chunk_size=1, allow_all=True)
+        logger.info(f"{test_case_name} :: Chunked delete report: {report}")
+
+        assert report.rows == len(
+            priority_ids
+        ), f"{test_case_name} :: Not every priority was deleted"
+        assert not get_fk_id_pool(
+            Priority, priority_actions.session
+        ).ids, f"{test_case_name} :: The priority ID pool kept deleted IDs"
+        with pytest.raises(ValueError):
+            random_priority_id()
+        assert (
+            user_id in get_fk_id_pool(User, priority_actions.session).ids
+        ), f"{test_case_name} :: Deleting priorities invalidated the user ID pool"
+        assert (
+            priority_actions.get_priority_by_id(priority_ids[0]) is None
+        ), f"{test_case_name} :: The reference cache returned a deleted priority"
+
     @pytest.mark.usefixtures(
         "create_superuser",
         "create_roles",
@@ -272,3 +317,133 @@ class TestPriorities:
         assert any(
             task["id"] == random_task["id"] for task in priority_tasks
         ), f"{test_case_name} :: Priority tasks do not contain the expected task"
+
+    def test_reference_cache_ttl_and_lru(self):
+        test_case_name = f"{self.__class__.__name__}.test_reference_cache_ttl_and_lru"
+        logger.info(f"[priorities_tests] :: Running test case: {test_case_name}")
+
+        now = [0.0]
+        cache = ReferenceCache(Priority, ttl=10.0, max_size=2, clock=lambda: now[0])
+        for priority_id in (1, 2):
+            cache.put(priority_id, {"id": priority_id})
+        cache.get(1)
+        cache.put(3, {"id": 3})
+
+        assert cache.get(2) is None and cache.get(1) == {
+            "id": 1
+        }, f"{test_case_name} :: The least recently used entry was not evicted"
+
+        now[0] = 10.0
+        assert (
+            cache.get(3) is None
+        ), f"{test_case_name} :: An expired entry was returned"
+        logger.info(f"{test_case_name} :: Cache stats: {cache.stats}")
+        assert (
+            cache.stats.hits,
+            cache.stats.misses,
+            cache.stats.evictions,
+            cache.stats.expirations,
+        ) == (2, 2, 1, 1), f"{test_case_name} :: Cache stats are wrong"
+
+    @pytest.mark.usefixtures("create_superuser", "create_role", "create_priorities")
+    def test_reference_cache_is_scoped_to_database(
+        self, priority_actions, seeded_db_session
+    ):
+        test_case_name = (
+            f"{self.__class__.__name__}.test_reference_cache_is_scoped_to_database"
+        )
+        logger.info(f"[priorities_tests] :: Running test case: {test_case_name}")
+
+        priority_actions.warm_priorities_cache()
+        seeded_priority_actions = PriorityActions(seeded_db_session)
+        seeded_priority = seeded_priority_actions.get_all_priorities()[0]
+
+        assert get_reference_cache(
+            Priority, seeded_db_session
+        ) is not get_reference_cache(
+            Priority, priority_actions.session
+        ), f"{test_case_name} :: Both databases share one reference cache"
+        assert (
+            seeded_priority_actions.get_priority_by_id(seeded_priority["id"])
+            == seeded_priority
+        ), f"{test_case_name} :: A priority cached for another database was served"
+
+    @pytest.mark.usefixtures(
+        "create_superuser",
+        "create_roles",
+        "create_users",
+        "create_statuses",
+        "create_priorities",
+        "create_tasks",
+    )
+    def test_get_priority_by_id_is_cached(
+        self, priority_actions, task_actions, assert_max_queries
+    ):
+        test_case_name = f"{self.__class__.__name__}.test_get_priority_by_id_is_cached"
+        logger.info(f"[priorities_tests] :: Running test case: {test_case_name}")
+
+        cache = get_reference_cache(Priority, priority_actions.session)
+        random_task = get_random_task()
+        priority_id = random_task["priority_id"]
+
+        warmed = priority_actions.warm_priorities_cache()
+        assert warmed == len(
+            priority_actions.get_all_priorities()
+        ), f"{test_case_name} :: Warm-up did not load every priority"
+
+        with assert_max_queries(0):
+            cached_priority = priority_actions.get_priority_by_id(priority_id)
+        with assert_max_queries(1):
+            task_priority = task_actions.get_task_priority("id", random_task["id"])
+        logger.info(f"{test_case_name} :: Cached priority: {cached_priority}")
+
+        assert (
+            task_priority == cached_priority
+        ), f"{test_case_name} :: Cached relationship does not match the priority"
+
+        new_priority_name = random.choice(
+            [
+                name.value
+                for name in PriorityNames
+                if name.value != cached_priority["priority_name"]
+            ]
+        )
+        priority_actions.update_priority_field(
+            filter_param="id",
+            filter_value=priority_id,
+            field_name="priority_name",
+            new_value=new_priority_name,
+        )
+
+        assert (
+            priority_actions.get_priority_by_id(priority_id)["priority_name"]
+            == new_priority_name
+        ), f"{test_case_name} :: The cache was not invalidated after an update"
+        logger.info(f"{test_case_name} :: Cache stats: {reference_cache_stats()}")
+        assert (
+            cache.stats.hits >= 2 and cache.stats.misses >= 1
+        ), f"{test_case_name} :: Cache hits and misses were not recorded"
+
+        priority_actions.session.execute(
+            update(Priority)
+            .where(Priority.id == priority_id)
+            .values(priority_name=cached_priority["priority_name"])
+        )
+        assert (
+            priority_actions.get_priority_by_id(priority_id)["priority_name"]
+            == cached_priority["priority_name"]
+        ), f"{test_case_name} :: The uncommitted update was not read back"
+        assert (
+            cache.get(priority_id) is None
+        ), f"{test_case_name} :: An uncommitted row was shared through the cache"
+        with pytest.raises(ValueError):
+            priority_actions.warm_priorities_cache()
+
+        priority_actions.session.rollback()
+        assert (
+            priority_actions.get_priority_by_id(priority_id)["priority_name"]
+            == new_priority_name
+        ), f"{test_case_name} :: The rolled back update is still visible"
+        assert (
+            cache.get(priority_id)["priority_name"] == new_priority_name
+        ), f"{test_case_name} :: The committed row was not cached after the rollback"
@@ -1,11 +1,31 @@
+from dataclasses import replace
+from operator import itemgetter
+
 import pytest
+from sqlalchemy import event, func, select
 
+from src.db.instrumentation import (NPlusOneDetector, query_registry,
+                                    track_action)
+from src.db.models import Task, User
+from src.db.snapshots import SnapshotManager
 from src.logger.logger import logger
-from tests.factories.factories import fake
+from tests.actions.filters import FilterOperator, FilterSpec, compile_filter
+from tests.actions.loading import LoadStrategy
+from tests.actions.mappers import get_row_mapper
+from tests.actions.sampling import SamplingStrategy
+from tests.actions.statements import get_statement_registry
+from tests.actions.tasks import TASK_RELATIONSHIPS, TaskActions
+from tests.factories.factories import TaskFactory, fake
+from tests.factories.factory_actions import UserFactoryActions
 from tests.factories.factory_utils import (get_current_datetime,
                                            get_formatted_datetime,
                                            get_random_task,
-                                           get_updated_datetime)
+                                           get_updated_datetime,
+                                           random_priority_id,
+                                           random_status_id, random_user_id)
+from tests.factories.generation import (generate_dataset, iter_shard_rows,
+                                        plan_shards)
+from tests.factories.seeds import SEEDED_TASKS
 
 
 class TestTasks:
@@ -192,6 +212,101 @@ class TestTasks:
             updated_task["description"] == new_data["description"]
         ), f"{test_case_name} :: description field not updated correctly"
 
+    @pytest.mark.usefixtures(
+        "create_superuser",
+        "create_roles",
+        "create_users",
+        "create_statuses",
+        "create_priorities",
+        "create_tasks",
+    )
+    def test_update_tasks_where(self, task_actions, assert_max_queries):
+        test_case_name = f"{self.__class__.__name__}.test_update_tasks_where"
+        logger.info(f"[tasks_tests] :: Running test case: {test_case_name}")
+
+        random_task = get_random_task()
+        creator_tasks = task_actions.get_all_tasks_by_filter(
+            filter_param="creator_id", filter_value=random_task["creator_id"]
+        )
+        new_status_id = random_status_id()
+
+        with assert_max_queries(1):
+            updated_count = task_actions.update_tasks_where(
+                filters={"creator_id": random_task["creator_id"]},
+                updated_data={"status_id": new_status_id},
+            )
+        logger.info(f"{test_case_name} :: Updated {updated_count} tasks")
+
+        assert updated_count == len(
+            creator_tasks
+        ), f"{test_case_name} :: Updated count does not match the matching tasks"
+        assert all(
+            task["status_id"] == new_status_id
+            for task in task_actions.get_all_tasks_by_filter(
+                filter_param="creator_id", filter_value=random_task["creator_id"]
+            )
+        ), f"{test_case_name} :: Not every matching task was updated"
+
+        with pytest.raises(ValueError):
+            task_actions.update_tasks_where(
+                filters={"creator_id": random_task["creator_id"]},
+                updated_data={"unknown_field": 1},
+            )
+        with pytest.raises(ValueError):
+            task_actions.update_tasks_where(
+                filters={}, updated_data={"status_id": new_status_id}
+            )
+        with pytest.raises(ValueError):
+            task_actions.update_tasks_where(
+                filters={"creator_id": random_task["creator_id"]}, updated_data={}
+            )
+        assert task_actions.update_tasks_where(
+            filters={}, updated_data={"status_id": new_status_id}, allow_all=True
+        ) == len(
+            task_actions.get_all_tasks()
+        ), f"{test_case_name} :: allow_all did not update every task"
+
+    @pytest.mark.usefixtures(
+        "create_superuser",
+        "create_roles",
+        "create_users",
+        "create_statuses",
+        "create_priorities",
+        "create_tasks",
+    )
+    def test_bulk_update_tasks(self, task_actions):
+        test_case_name = f"{self.__class__.__name__}.test_bulk_update_tasks"
+        logger.info(f"[tasks_tests] :: Running test case: {test_case_name}")
+
+        tasks = task_actions.get_all_tasks()
+        new_deadline = get_updated_datetime(days=3, hours=0, minutes=0)
+        tasks_data = [
+            {"id": task["id"], "title": f"Bulk updated task {task['id']}"}
+            for task in tasks
+        ]
+        tasks_data[0]["deadline"] = new_deadline
+
+        updated_count = task_actions.bulk_update_tasks(tasks_data, batch_size=2)
+        logger.info(f"{test_case_name} :: Updated {updated_count} tasks")
+
+        assert updated_count == len(
+            tasks
+        ), f"{test_case_name} :: Updated count does not match the rows passed"
+        updated_tasks = {task["id"]: task for task in task_actions.get_all_tasks()}
+        for task_data in tasks_data:
+            assert (
+                updated_tasks[task_data["id"]]["title"] == task_data["title"]
+            ), f"{test_case_name} :: Task {task_data['id']} title was not updated"
+        assert (
+            get_formatted_datetime(
+                date_time=updated_tasks[tasks_data[0]["id"]]["deadline"]
+            )
+            == new_deadline
+        ), f"{test_case_name} :: Per-row deadline was not updated"
+
+        with pytest.raises(ValueError):
+            task_actions.bulk_update_tasks([{"title": "Task without an id"}])
+
     @pytest.mark.usefixtures(
         "create_superuser",
         "create_role",
@@ -251,6 +366,276 @@ class TestTasks:
 
         assert all_tasks is None, f"{test_case_name} :: Tasks were not deleted"
 
+    @pytest.mark.usefixtures(
+        "create_superuser",
+        "create_roles",
+        "create_users",
+        "create_statuses",
+        "create_priorities",
+        "create_tasks",
+    )
+    def test_delete_tasks_where_and_in_chunks(self, task_actions, assert_max_queries):
+        test_case_name = (
+            f"{self.__class__.__name__}.test_delete_tasks_where_and_in_chunks"
+        )
+        logger.info(f"[tasks_tests] :: Running test case: {test_case_name}")
+
+        random_task = get_random_task()
+        creator_task_ids = [
+            task["id"]
+            for task in task_actions.get_all_tasks_by_filter(
+                filter_param="creator_id", filter_value=random_task["creator_id"]
+            )
+        ]
+        remaining_count = len(task_actions.get_all_tasks()) - len(creator_task_ids)
+
+        with assert_max_queries(1):
+            deleted_ids = task_actions.delete_tasks_where(
+                {"creator_id": random_task["creator_id"]}
+            )
+        logger.info(f"{test_case_name} :: Deleted task IDs: {deleted_ids}")
+
+        assert sorted(deleted_ids) == sorted(
+            creator_task_ids
+        ), f"{test_case_name} :: Deleted IDs do not match the creator's tasks"
+
+        with pytest.raises(ValueError):
+            task_actions.delete_tasks_where({})
+        with pytest.raises(ValueError):
+            task_actions.delete_tasks_in_chunks(chunk_size=1)
+
+        report = task_actions.delete_tasks_in_chunks(chunk_size=1, allow_all=True)
+        logger.info(f"{test_case_name} :: Chunked delete report: {report}")
+
+        assert (
+            report.rows == remaining_count and report.chunks == remaining_count
+        ), f"{test_case_name} :: Chunked delete did not remove every remaining task"
+        assert (
+            task_actions.get_all_tasks() is None
+        ), f"{test_case_name} :: Tasks were left after the chunked delete"
+        assert (
+            task_actions.delete_tasks_in_chunks(allow_all=True).rows == 0
+        ), f"{test_case_name} :: Deleting from an empty table reported rows"
+
+    @pytest.mark.usefixtures(
+        "create_superuser",
+        "create_roles",
+        "create_users",
+        "create_statuses",
+        "create_priorities",
+        "create_tasks",
+    )
+    def test_paginate_tasks(self, task_actions, assert_max_queries):
+        test_case_name = f"{self.__class__.__name__}.test_paginate_tasks"
+        logger.info(f"[tasks_tests] :: Running test case: {test_case_name}")
+
+        expected_ids = [
+            task["id"]
+            for task in sorted(
+                task_actions.get_all_tasks(), key=itemgetter("created_at", "id")
+            )
+        ]
+
+        page_ids, cursor, pages = [], None, 0
+        while True:
+            with assert_max_queries(1):
+                page = task_actions.paginate_tasks(after=cursor, limit=3)
+            page_ids.extend(task["id"] for task in page.items)
+            pages += 1
+            if not page.has_next:
+                break
+            cursor = page.next_cursor
+        logger.info(f"{test_case_name} :: Walked {pages} pages of tasks")
+
+        assert (
+            page_ids == expected_ids
+        ), f"{test_case_name} :: Keyset pages do not cover tasks in (created_at, id) order"
+
+        first_page = task_actions.paginate_tasks(limit=2, descending=True)
+        second_page = task_actions.paginate_tasks(
+            after=first_page.next_cursor, limit=2, descending=True
+        )
+        assert [
+            task["id"] for task in first_page.items + second_page.items
+        ] == expected_ids[::-1][
+            :4
+        ], f"{test_case_name} :: Descending pages are out of order"
+
+        with pytest.raises(ValueError):
+            task_actions.paginate(order_by=("title",), after=first_page.next_cursor)
+        with pytest.raises(ValueError):
+            task_actions.paginate_tasks(after="not-a-cursor")
+
+    @pytest.mark.usefixtures(
+        "create_superuser",
+        "create_roles",
+        "create_users",
+        "create_statuses",
+        "create_priorities",
+        "create_tasks",
+    )
+    def test_paginate_tasks_by_nullable_column(self, task_actions, assert_max_queries):
+        test_case_name = (
+            f"{self.__class__.__name__}.test_paginate_tasks_by_nullable_column"
+        )
+        logger.info(f"[tasks_tests] :: Running test case: {test_case_name}")
+
+        random_task = get_random_task()
+        task_actions.update_tasks_where(
+            filters={"creator_id": random_task["creator_id"]},
+            updated_data={"deadline": None},
+        )
+        all_tasks = task_actions.get_all_tasks()
+        expected_ids = [
+            task["id"]
+            for task in sorted(
+                all_tasks,
+                key=lambda task: (
+                    task["deadline"] is None,
+                    task["deadline"] or 0,
+                    task["id"],
+                ),
+            )
+        ]
+        assert any(
+            task["deadline"] is None for task in all_tasks
+        ), f"{test_case_name} :: No task has a NULL deadline"
+
+        for descending in (False, True):
+            page_ids, cursor = [], None
+            while True:
+                with assert_max_queries(1):
+                    page = task_actions.paginate(
+                        order_by=("deadline",),
+                        after=cursor,
+                        limit=2,
+                        descending=descending,
+                    )
+                page_ids.extend(task["id"] for task in page.items)
+                if not page.has_next:
+                    break
+                cursor = page.next_cursor
+            logger.info(
+                f"{test_case_name} :: Pages (descending={descending}): {page_ids}"
+            )
+
+            assert page_ids == (
+                expected_ids[::-1] if descending else expected_ids
+            ), f"{test_case_name} :: Keyset pages lost or reordered rows with NULL deadlines"
+
+    @pytest.mark.usefixtures(
+        "create_superuser",
+        "create_roles",
+        "create_users",
+        "create_statuses",
+        "create_priorities",
+        "create_tasks",
+    )
+    def test_get_tasks_by_filter_spec(self, task_actions, assert_max_queries):
+        test_case_name = f"{self.__class__.__name__}.test_get_tasks_by_filter_spec"
+        logger.info(f"[tasks_tests] :: Running test case: {test_case_name}")
+
+        tasks = task_actions.get_all_tasks()
+        random_task = get_random_task()
+        deadlines = sorted(task["deadline"] for task in tasks)
+        window = (deadlines[0], deadlines[len(deadlines) // 2])
+        status_ids = {task["status_id"] for task in tasks[:2]}
+
+        spec = (
+            FilterSpec()
+            .where("assignee_id", FilterOperator.NE, random_task["assignee_id"])
+            .where("deadline", FilterOperator.BETWEEN, window)
+            .where("status_id", FilterOperator.IN, status_ids)
+            .where("description", FilterOperator.IS_NOT_NULL)
+            .order("deadline", descending=True)
+            .order("id")
+            .take(3)
+        )
+        expected_ids = [
+            task["id"]
+            for task in sorted(
+                sorted(tasks, key=itemgetter("id")),
+                key=itemgetter("deadline"),
+                reverse=True,
+            )
+            if task["assignee_id"] != random_task["assignee_id"]
+            and window[0] <= task["deadline"] <= window[1]
+            and task["status_id"] in status_ids
+            and task["description"] is not None
+        ][:3]
+
+        with assert_max_queries(1):
+            filtered_tasks = task_actions.get_all_tasks_by_filter(spec)
+        logger.info(f"{test_case_name} :: Filtered tasks: {filtered_tasks}")
+
+        assert [
+            task["id"] for task in filtered_tasks or []
+        ] == expected_ids, (
+            f"{test_case_name} :: Filter spec results do not match Python filtering"
+        )
+
+        first_task = task_actions.get_task_by_filter(
+            FilterSpec().where("id", FilterOperator.IN, [random_task["id"]])
+        )
+        assert (
+            first_task["id"] == random_task["id"]
+        ), f"{test_case_name} :: filter_by did not accept a filter spec"
+
+        mapper = get_row_mapper(Task)
+        other_spec = FilterSpec().where("id", FilterOperator.IN, [1, 2, 3])
+        assert (
+            compile_filter(mapper, other_spec)[0]
+            is compile_filter(mapper, FilterSpec().where("id", FilterOperator.IN, []))[
+                0
+            ]
+        ), f"{test_case_name} :: Statements of the same shape were compiled twice"
+        assert (
+            task_actions.get_all_tasks_by_filter("deadline", None) is None
+        ), f"{test_case_name} :: A None filter value did not compile to IS NULL"
+
+        with pytest.raises(ValueError):
+            task_actions.get_all_tasks_by_filter(FilterSpec().order("unknown"))
+
+    @pytest.mark.usefixtures(
+        "create_superuser",
+        "create_roles",
+        "create_users",
+        "create_statuses",
+        "create_priorities",
+        "create_tasks",
+    )
+    def test_statement_registry_reuses_statements(self, task_actions):
+        test_case_name = (
+            f"{self.__class__.__name__}.test_statement_registry_reuses_statements"
+        )
+        logger.info(f"[tasks_tests] :: Running test case: {test_case_name}")
+
+        registry = get_statement_registry(Task)
+        tasks = task_actions.get_all_tasks()[:3]
+
+        def run_actions(task):
+            task_actions.get_task_by_id(task["id"])
+            task_actions.get_task_field("id", task["id"], "title")
+            task_actions.update_task_field(
+                "id", task["id"], "title", f"{task['title']}!"
+            )
+
+        run_actions(tasks[0])
+        registered = dict(registry.statements)
+        logger.info(f"{test_case_name} :: Registered statements: {len(registered)}")
+
+        for task in tasks[1:]:
+            run_actions(task)
+
+        assert registry.statements.keys() == registered.keys() and all(
+            registry.statements[key] is statement
+            for key, statement in registered.items()
+        ), f"{test_case_name} :: Repeated calls registered new statements"
+        assert (
+            task_actions.get_task_field("id", tasks[1]["id"], "title")
+            == f"{tasks[1]['title']}!"
+        ), f"{test_case_name} :: Registered update statement did not apply"
+
     @pytest.mark.usefixtures(
         "create_superuser",
         "create_roles",
@@ -323,7 +708,7 @@ class TestTasks:
         "create_priorities",
         "create_tasks",
     )
-    def test_get_task_creator(self, task_actions):
+    def test_get_task_creator(self, task_actions, assert_max_queries):
         test_case_name = f"{self.__class__.__name__}.test_get_task_creator"
         logger.info(f"[tasks_tests] :: Running test case: {test_case_name}")
 
@@ -335,9 +720,10 @@ class TestTasks:
 
         task_id = random_task["id"]
 
-        task_creator = task_actions.get_task_creator(
-            filter_param="id", filter_value=task_id
-        )
+        with assert_max_queries(2):
+            task_creator = task_actions.get_task_creator(
+                filter_param="id", filter_value=task_id
+            )
         if task_creator is not None:
             logger.info(f"{test_case_name} :: Task creator found: {task_creator}")
         else:
@@ -378,3 +764,491 @@ class TestTasks:
         assert (
             random_task["assignee_id"] == task_assignee["id"]
         ), f"{test_case_name} :: Task assignee does not contain the expected assignee"
+
+    @pytest.mark.usefixtures(
+        "create_superuser",
+        "create_role",
+        "create_user",
+        "create_status",
+        "create_priority",
+    )
+    def test_create_tasks_in_batches(self, task_actions):
+        test_case_name = f"{self.__class__.__name__}.test_create_tasks_in_batches"
+        logger.info(f"[tasks_tests] :: Running test case: {test_case_name}")
+
+        user_id = random_user_id()
+        tasks_data = [
+            {
+                "title": f"Task {index}",
+                "description": fake.text(max_nb_chars=255),
+                "priority_id": random_priority_id(),
+                "status_id": random_status_id(),
+                "creator_id": user_id,
+                "assignee_id": user_id,
+            }
+            | ({"deadline": fake.future_datetime()} if index % 2 else {})
+            for index in range(5)
+        ]
+
+        task_ids = task_actions.create_tasks(tasks_data, batch_size=2)
+        logger.info(f"{test_case_name} :: Created tasks with IDs: {task_ids}")
+
+        assert len(task_ids) == len(
+            tasks_data
+        ), f"{test_case_name} :: Not every task was created"
+
+        created_tasks = task_actions.get_all_tasks_by_filter(
+            filter_param="creator_id", filter_value=user_id
+        )
+        created_titles = {task["title"] for task in created_tasks}
+        assert {
+            task["title"] for task in tasks_data
+        } <= created_titles, f"{test_case_name} :: Created tasks were not found"
+
+        for task_id, task_data in zip(task_ids, tasks_data):
+            created_task = task_actions.get_task_by_id(task_id)
+            assert (
+                created_task["title"] == task_data["title"]
+            ), f"{test_case_name} :: Task IDs are not in input order"
+            assert (created_task["deadline"] is not None) == (
+                "deadline" in task_data
+            ), f"{test_case_name} :: Columns present only in later rows were dropped"
+
+    @pytest.mark.asyncio
+    @pytest.mark.db_isolation("truncate")
+    @pytest.mark.usefixtures(
+        "create_superuser",
+        "create_role",
+        "create_user",
+        "create_status",
+        "create_priority",
+    )
+    async def test_async_create_tasks_in_batches(self, async_task_actions):
+        test_case_name = f"{self.__class__.__name__}.test_async_create_tasks_in_batches"
+        logger.info(f"[tasks_tests] :: Running test case: {test_case_name}")
+
+        user_id = random_user_id()
+        tasks_data = [
+            {
+                "title": f"Async task {index}",
+                "description": fake.text(max_nb_chars=255),
+                "priority_id": random_priority_id(),
+                "status_id": random_status_id(),
+                "creator_id": user_id,
+                "assignee_id": user_id,
+            }
+            | ({"deadline": fake.future_datetime()} if index % 2 else {})
+            for index in range(5)
+        ]
+
+        task_ids = await async_task_actions.create_tasks(tasks_data, batch_size=2)
+        logger.info(f"{test_case_name} :: Created tasks with IDs: {task_ids}")
+
+        assert len(task_ids) == len(
+            tasks_data
+        ), f"{test_case_name} :: Not every task was created"
+
+        for task_id, task_data in zip(task_ids, tasks_data):
+            created_task = await async_task_actions.get_task_by_id(task_id)
+            assert (
+                created_task["title"] == task_data["title"]
+            ), f"{test_case_name} :: Task IDs are not in input order"
+            assert (created_task["deadline"] is not None) == (
+                "deadline" in task_data
+            ), f"{test_case_name} :: Columns present only in later rows were dropped"
+
+    @pytest.mark.usefixtures(
+        "create_superuser",
+        "create_roles",
+        "create_users",
+        "create_statuses",
+        "create_priorities",
+        "create_tasks",
+    )
+    def test_iter_all_tasks_in_chunks(self, task_actions):
+        test_case_name = f"{self.__class__.__name__}.test_iter_all_tasks_in_chunks"
+        logger.info(f"[tasks_tests] :: Running test case: {test_case_name}")
+
+        all_tasks = task_actions.get_all_tasks()
+        streamed_tasks = list(task_actions.iter_all_tasks(chunk_size=2))
+        logger.info(f"{test_case_name} :: Streamed tasks: {streamed_tasks}")
+
+        assert sorted(task["id"] for task in streamed_tasks) == sorted(
+            task["id"] for task in all_tasks
+        ), f"{test_case_name} :: Streamed tasks do not match all tasks"
+
+        random_task = get_random_task()
+        filtered_tasks = list(
+            task_actions.iter_all_tasks_by_filter(
+                filter_param="creator_id",
+                filter_value=random_task["creator_id"],
+                chunk_size=1,
+            )
+        )
+        assert filtered_tasks and all(
+            task["creator_id"] == random_task["creator_id"] for task in filtered_tasks
+        ), f"{test_case_name} :: Streamed tasks do not match the filter"
+
+        spec = FilterSpec.equals("creator_id", random_task["creator_id"]).where(
+            "id", FilterOperator.GE, min(task["id"] for task in filtered_tasks)
+        )
+        spec_tasks = list(task_actions.iter_all_tasks_by_filter(spec, chunk_size=1))
+        assert sorted(task["id"] for task in spec_tasks) == sorted(
+            task["id"] for task in filtered_tasks
+        ), f"{test_case_name} :: Streamed tasks do not match the filter spec"
+
+        with pytest.raises(ValueError):
+            task_actions.iter_all_tasks_by_filter("unknown_field", 1)
+
+    @pytest.mark.usefixtures(
+        "create_superuser",
+        "create_roles",
+        "create_users",
+        "create_statuses",
+        "create_priorities",
+        "create_tasks",
+    )
+    def test_get_random_task_with_each_strategy(self, task_actions):
+        test_case_name = (
+            f"{self.__class__.__name__}.test_get_random_task_with_each_strategy"
+        )
+        logger.info(f"[tasks_tests] :: Running test case: {test_case_name}")
+
+        task_ids = {task["id"] for task in task_actions.get_all_tasks()}
+
+        for strategy in SamplingStrategy:
+            random_task = task_actions.get_random_task(strategy=strategy)
+            logger.info(
+                f"{test_case_name} :: Random task with {strategy.value}: {random_task}"
+            )
+            assert (
+                random_task is not None and random_task["id"] in task_ids
+            ), f"{test_case_name} :: No existing task sampled with {strategy.value}"
+
+    @pytest.mark.usefixtures(
+        "create_superuser",
+        "create_roles",
+        "create_users",
+        "create_statuses",
+        "create_priorities",
+    )
+    def test_create_task_batch_without_foreign_key_selects(self, db_engine):
+        test_case_name = (
+            f"{self.__class__.__name__}"
+            ".test_create_task_batch_without_foreign_key_selects"
+        )
+        logger.info(f"[tasks_tests] :: Running test case: {test_case_name}")
+
+        TaskFactory.create()
+        select_statements = []
+
+        def record_select(conn, cursor, statement, parameters, context, executemany):
+            if statement.lstrip().upper().startswith("SELECT"):
+                select_statements.append(statement)
+
+        event.listen(db_engine, "before_cursor_execute", record_select)
+        try:
+            tasks = TaskFactory.create_batch(20)
+        finally:
+            event.remove(db_engine, "before_cursor_execute", record_select)
+        logger.info(f"{test_case_name} :: SELECT statements: {select_statements}")
+
+        assert len(tasks) == 20, f"{test_case_name} :: Not every task was created"
+        assert (
+            not select_statements
+        ), f"{test_case_name} :: Foreign key lookups issued SELECT statements"
+
+    @pytest.mark.usefixtures(
+        "create_superuser",
+        "create_roles",
+        "create_users",
+        "create_statuses",
+        "create_priorities",
+        "create_tasks",
+    )
+    def test_get_tasks_with_relations(self, task_actions, assert_max_queries):
+        test_case_name = f"{self.__class__.__name__}.test_get_tasks_with_relations"
+        logger.info(f"[tasks_tests] :: Running test case: {test_case_name}")
+
+        with assert_max_queries(1):
+            joined_tasks = task_actions.get_tasks_with_relations()
+        selectin_strategies = {
+            relationship_name: LoadStrategy.SELECTIN
+            for relationship_name in TASK_RELATIONSHIPS
+        }
+        with assert_max_queries(1 + len(TASK_RELATIONSHIPS)):
+            selectin_tasks = task_actions.get_tasks_with_relations(
+                strategies=selectin_strategies
+            )
+        logger.info(f"{test_case_name} :: Tasks with relations: {joined_tasks}")
+
+        assert sorted(joined_tasks, key=itemgetter("id")) == sorted(
+            selectin_tasks, key=itemgetter("id")
+        ), f"{test_case_name} :: Loader strategies returned different tasks"
+        for task in joined_tasks:
+            assert (
+                task["creator"]["id"] == task["creator_id"]
+                and task["assignee"]["id"] == task["assignee_id"]
+                and task["priority"]["id"] == task["priority_id"]
+                and task["status"]["id"] == task["status_id"]
+            ), f"{test_case_name} :: Related rows do not match the foreign keys"
+
+        with pytest.raises(ValueError):
+            task_actions.get_tasks_with_relations(
+                strategies={"creator": LoadStrategy.RAISE}
+            )
+
+    @pytest.mark.n_plus_one_threshold(100)
+    @pytest.mark.usefixtures(
+        "create_superuser",
+        "create_roles",
+        "create_users",
+        "create_statuses",
+        "create_priorities",
+        "create_tasks",
+    )
+    def test_n_plus_one_detector_flags_repeated_statements(self, task_actions):
+        test_case_name = f"{self.__class__.__name__}.test_n_plus_one_detector_flags_repeated_statements"
+        logger.info(f"[tasks_tests] :: Running test case: {test_case_name}")
+
+        task_ids = [task["id"] for task in task_actions.get_all_tasks()]
+
+        def get_task_creators():
+            return [
+                task_actions.get_task_creator(filter_param="id", filter_value=task_id)
+                for task_id in task_ids
+            ]
+
+        with NPlusOneDetector(threshold=1) as detector:
+            track_action("TestTasks.get_task_creators", get_task_creators)
+            task_actions.get_task_creator(filter_param="id", filter_value=task_ids[0])
+        logger.info(f"{test_case_name} :: Violations: {detector.describe()}")
+
+        assert (
+            len(detector.violations) == 2
+        ), f"{test_case_name} :: Expected the task and creator lookups to be flagged"
+        assert all(
+            violation.call.name == "TestTasks.get_task_creators"
+            and violation.count == len(task_ids)
+            for violation in detector.violations
+        ), f"{test_case_name} :: Violations were not attributed to the outer call"
+        assert (
+            "test_tasks.py" in detector.describe()
+        ), f"{test_case_name} :: Violation does not show the call stack"
+
+    @pytest.mark.usefixtures(
+        "create_superuser",
+        "create_roles",
+        "create_users",
+        "create_statuses",
+        "create_priorities",
+        "create_tasks",
+    )
+    def test_actions_record_statement_stats(self, task_actions, db_connection):
+        test_case_name = (
+            f"{self.__class__.__name__}.test_actions_record_statement_stats"
+        )
+        logger.info(f"[tasks_tests] :: Running test case: {test_case_name}")
+
+        filter_by_before = query_registry.action_summary("TaskActions.filter_by")
+        iter_all_count = query_registry.action_summary("TaskActions.iter_all")["count"]
+
+        random_task = get_random_task()
+        task_actions.get_task_by_title(filter_value=random_task["title"])
+        streamed_tasks = list(task_actions.iter_all_tasks(chunk_size=2))
+
+        filter_by_summary = query_registry.action_summary("TaskActions.filter_by")
+        iter_all_summary = query_registry.action_summary("TaskActions.iter_all")
+        logger.info(f"{test_case_name} :: filter_by stats: {filter_by_summary}")
+        logger.info(f"{test_case_name} :: iter_all stats: {iter_all_summary}")
+
+        assert (
+            filter_by_summary["count"] == filter_by_before["count"] + 1
+        ), f"{test_case_name} :: filter_by did not record exactly one statement"
+        assert (
+            filter_by_summary["rows"] == filter_by_before["rows"] + 1
+        ), f"{test_case_name} :: filter_by rows were not counted"
+        assert (
+            iter_all_summary["count"] == iter_all_count + 1
+        ), f"{test_case_name} :: Streaming was not attributed to iter_all"
+        assert streamed_tasks, f"{test_case_name} :: No tasks were streamed"
+        assert (
+            0 < filter_by_summary["p50_ms"] <= filter_by_summary["p99_ms"]
+        ), f"{test_case_name} :: Latency percentiles are out of order"
+
+        with pytest.raises(ValueError):
+            task_actions.execute_query(select(func.sqrt(-1)))
+        assert not db_connection.info.get(
+            "query_started_at"
+        ), f"{test_case_name} :: A failed statement left its start time behind"
+
+    @pytest.mark.asyncio
+    @pytest.mark.db_isolation("truncate")
+    @pytest.mark.usefixtures(
+        "create_superuser",
+        "create_roles",
+        "create_users",
+        "create_statuses",
+        "create_priorities",
+        "create_tasks",
+    )
+    async def test_async_iter_all_tasks_and_get_relationship(self, async_task_actions):
+        test_case_name = (
+            f"{self.__class__.__name__}"
+            ".test_async_iter_all_tasks_and_get_relationship"
+        )
+        logger.info(f"[tasks_tests] :: Running test case: {test_case_name}")
+
+        all_tasks = await async_task_actions.get_all_tasks()
+        streamed_tasks = [
+            task async for task in async_task_actions.iter_all_tasks(chunk_size=2)
+        ]
+        logger.info(f"{test_case_name} :: Streamed tasks: {streamed_tasks}")
+
+        assert sorted(task["id"] for task in streamed_tasks) == sorted(
+            task["id"] for task in all_tasks
+        ), f"{test_case_name} :: Streamed tasks do not match all tasks"
+
+        random_task = await async_task_actions.get_random_task()
+        task_priority = await async_task_actions.get_task_priority(
+            filter_param="id", filter_value=random_task["id"]
+        )
+        logger.info(f"{test_case_name} :: Task priority: {task_priority}")
+
+        assert (
+            task_priority["id"] == random_task["priority_id"]
+        ), f"{test_case_name} :: Task priority does not match"
+
+        tasks_with_relations = await async_task_actions.get_tasks_with_relations(
+            filter_param="id", filter_value=random_task["id"]
+        )
+        logger.info(f"{test_case_name} :: Task with relations: {tasks_with_relations}")
+
+        assert (
+            tasks_with_relations[0]["priority"] == task_priority
+        ), f"{test_case_name} :: Eagerly loaded priority does not match"
+
+        task_creators = await async_task_actions.get_relationship_many(
+            [random_task["id"]], "creator"
+        )
+        assert (
+            task_creators[random_task["id"]]["id"] == random_task["creator_id"]
+        ), f"{test_case_name} :: Batched task creator does not match"
+
+        first_page = await async_task_actions.paginate_tasks(limit=1)
+        second_page = await async_task_actions.paginate_tasks(
+            after=first_page.next_cursor, limit=1
+        )
+        assert (
+            first_page.items[0]["id"] != second_page.items[0]["id"]
+        ), f"{test_case_name} :: Async keyset pages overlap"
+
+    def test_seeded_snapshot_is_cloned_with_data(self, seeded_db_session):
+        test_case_name = (
+            f"{self.__class__.__name__}.test_seeded_snapshot_is_cloned_with_data"
+        )
+        logger.info(f"[tasks_tests] :: Running test case: {test_case_name}")
+
+        seeded_task_actions = TaskActions(seeded_db_session)
+        seeded_tasks = seeded_task_actions.get_all_tasks()
+        logger.info(f"{test_case_name} :: Seeded tasks: {len(seeded_tasks)}")
+
+        assert (
+            len(seeded_tasks) == SEEDED_TASKS.params["tasks"]
+        ), f"{test_case_name} :: Cloned database does not hold the seeded tasks"
+
+        random_task = seeded_task_actions.get_random_task()
+        task_creator = seeded_task_actions.get_task_creator(
+            filter_param="id", filter_value=random_task["id"]
+        )
+        assert (
+            task_creator["id"] == random_task["creator_id"]
+        ), f"{test_case_name} :: Seeded task creator does not match"
+
+        snapshot_manager = SnapshotManager()
+        changed_spec = replace(SEEDED_TASKS, params={**SEEDED_TASKS.params, "tasks": 1})
+        assert snapshot_manager.snapshot_name(
+            SEEDED_TASKS
+        ) != snapshot_manager.snapshot_name(
+            changed_spec
+        ), f"{test_case_name} :: A changed seeding spec must not reuse the snapshot"
+        assert snapshot_manager.snapshot_name(
+            SEEDED_TASKS
+        ) != snapshot_manager.snapshot_name(
+            replace(SEEDED_TASKS, version=SEEDED_TASKS.version + 1)
+        ), f"{test_case_name} :: A bumped seed version must not reuse the snapshot"
+        assert snapshot_manager.snapshot_name(
+            SEEDED_TASKS
+        ) != snapshot_manager.snapshot_name(
+            replace(SEEDED_TASKS, modules=SEEDED_TASKS.modules[:-1])
+        ), f"{test_case_name} :: Seed helper modules must be part of the snapshot key"
+
+    def test_generated_shards_are_deterministic(self):
+        test_case_name = (
+            f"{self.__class__.__name__}.test_generated_shards_are_deterministic"
+        )
+        logger.info(f"[tasks_tests] :: Running test case: {test_case_name}")
+
+        counts = {"roles": 3, "users": 40, "priorities": 3, "statuses": 5, "tasks": 60}
+        id_ranges = {
+            table_name: range(1, count + 1) for table_name, count in counts.items()
+        }
+
+        first_plan = plan_shards(counts, id_ranges, 7, 25, "")
+        second_plan = plan_shards(counts, id_ranges, 7, 25, "")
+        other_plan = plan_shards(counts, id_ranges, 8, 25, "")
+
+        first_tasks = [list(iter_shard_rows(shard)) for shard in first_plan[-1]]
+        second_tasks = [list(iter_shard_rows(shard)) for shard in second_plan[-1]]
+        other_tasks = [list(iter_shard_rows(shard)) for shard in other_plan[-1]]
+        logger.info(f"{test_case_name} :: Generated task shards: {len(first_tasks)}")
+
+        assert (
+            first_tasks == second_tasks
+        ), f"{test_case_name} :: The same seed generated different tasks"
+        assert (
+            first_tasks != other_tasks
+        ), f"{test_case_name} :: A different seed generated the same tasks"
+        assert all(
+            task["creator_id"] in id_ranges["users"]
+            for shard_tasks in first_tasks
+            for task in shard_tasks
+        ), f"{test_case_name} :: Task creators fall outside the users id range"
+
+    @pytest.mark.db_isolation("truncate")
+    def test_generate_dataset_in_parallel_shards(self, db_url, db_session):
+        test_case_name = (
+            f"{self.__class__.__name__}.test_generate_dataset_in_parallel_shards"
+        )
+        logger.info(f"[tasks_tests] :: Running test case: {test_case_name}")
+
+        counts = {
+            "roles": 3,
+            "users": 200,
+            "priorities": 3,
+            "statuses": 5,
+            "tasks": 1000,
+        }
+        load_reports = generate_dataset(
+            counts, seed=1, processes=2, shard_size=300, database_url=db_url
+        )
+        logger.info(f"{test_case_name} :: Load reports: {load_reports}")
+
+        assert sum(report.rows for report in load_reports) == sum(
+            counts.values()
+        ), f"{test_case_name} :: Not every generated row was loaded"
+
+        orphaned_tasks = db_session.execute(
+            select(func.count())
+            .select_from(Task)
+            .outerjoin(User, Task.creator_id == User.id)
+            .where(User.id.is_(None))
+        ).scalar_one()
+        assert (
+            orphaned_tasks == 0
+        ), f"{test_case_name} :: Generated tasks reference missing users"
+
+        created_user = UserFactoryActions.create_user()
+        assert (
+            created_user is not None
+        ), f"{test_case_name} :: Sequences were not advanced past generated ids"
@@ -1,8 +1,26 @@
+import math
+from concurrent.futures import ProcessPoolExecutor
+from itertools import chain
+from typing import List
+
 import pytest
+from sqlalchemy import select
 
+from src.db.loader import copy_rows
+from src.db.models import Task, User
 from src.logger.logger import logger
 from tests.factories.factories import fake
-from tests.factories.factory_utils import get_current_datetime, get_random_user
+from tests.factories.factory_actions import UserFactoryActions
+from tests.factories.factory_utils import (PRECOMPUTED_PASSWORD,
+                                           PasswordHashMode,
+                                           get_current_datetime,
+                                           get_random_user, pwd_context,
+                                           random_role_id)
+from tests.factories.value_pools import USERNAME_MAX_LENGTH, emails, usernames
+
+
+def take_usernames(count: int) -> List[str]:
+    return [usernames() for _ in range(count)]
 
 
 class TestUsers:
@@ -235,7 +253,7 @@ class TestUsers:
         "create_priorities",
         "create_tasks",
     )
-    def test_get_user_created_tasks(self, user_actions):
+    def test_get_user_created_tasks(self, user_actions, assert_max_queries):
         test_case_name = f"{self.__class__.__name__}.test_get_user_created_tasks"
         logger.info(f"[users_tests] :: Running test case: {test_case_name}")
 
@@ -247,9 +265,10 @@ class TestUsers:
 
         user_id = random_user["id"]
 
-        user_created_tasks = user_actions.get_user_created_tasks(
-            filter_param="id", filter_value=user_id
-        )
+        with assert_max_queries(2):
+            user_created_tasks = user_actions.get_user_created_tasks(
+                filter_param="id", filter_value=user_id
+            )
         if user_created_tasks is not None:
             logger.info(
                 f"{test_case_name} :: User created tasks found: {user_created_tasks}"
@@ -296,3 +315,326 @@ class TestUsers:
             assert (
                 task["assignee_id"] == random_user["id"]
             ), f"{test_case_name} :: User assigned tasks do not contain the expected tasks"
+
+    @pytest.mark.usefixtures(
+        "create_superuser",
+        "create_roles",
+        "create_users",
+        "create_statuses",
+        "create_priorities",
+        "create_tasks",
+    )
+    @pytest.mark.n_plus_one_threshold(100)
+    def test_get_users_assigned_tasks_in_batches(
+        self, user_actions, assert_max_queries
+    ):
+        test_case_name = (
+            f"{self.__class__.__name__}.test_get_users_assigned_tasks_in_batches"
+        )
+        logger.info(f"[users_tests] :: Running test case: {test_case_name}")
+
+        user_ids = [user["id"] for user in user_actions.get_all_users()]
+        missing_user_id = max(user_ids) + 1
+
+        with assert_max_queries(math.ceil((len(user_ids) + 1) / 2)):
+            assigned_tasks = user_actions.get_users_assigned_tasks(
+                user_ids + [missing_user_id], chunk_size=2
+            )
+        logger.info(f"{test_case_name} :: Assigned tasks by user: {assigned_tasks}")
+
+        for user_id in user_ids:
+            expected_tasks = user_actions.get_user_assigned_tasks(
+                filter_param="id", filter_value=user_id
+            )
+            assert sorted(task["id"] for task in assigned_tasks[user_id]) == sorted(
+                task["id"] for task in expected_tasks
+            ), f"{test_case_name} :: Batched tasks do not match user {user_id}"
+        assert (
+            assigned_tasks[missing_user_id] == []
+        ), f"{test_case_name} :: Missing user should have no assigned tasks"
+
+        user_roles = dict(user_actions.iter_relationship_many(user_ids, "role"))
+        assert all(
+            (user_roles[user["id"]] or {}).get("id") == user["role_id"]
+            for user in user_actions.get_all_users()
+        ), f"{test_case_name} :: Streamed roles do not match the users"
+
+    @pytest.mark.usefixtures(
+        "create_superuser",
+        "create_roles",
+        "create_users",
+        "create_statuses",
+        "create_priorities",
+        "create_tasks",
+    )
+    def test_get_users_with_tasks(self, user_actions, assert_max_queries):
+        test_case_name = f"{self.__class__.__name__}.test_get_users_with_tasks"
+        logger.info(f"[users_tests] :: Running test case: {test_case_name}")
+
+        with assert_max_queries(3):
+            users = user_actions.get_all_with_relationships(
+                ["created_tasks", "assigned_tasks"]
+            )
+        logger.info(f"{test_case_name} :: Users with tasks: {users}")
+
+        assert users, f"{test_case_name} :: No users were retrieved"
+        for user in users:
+            assert all(
+                task["creator_id"] == user["id"] for task in user["created_tasks"]
+            ), f"{test_case_name} :: Created tasks belong to another user"
+            assert all(
+                task["assignee_id"] == user["id"] for task in user["assigned_tasks"]
+            ), f"{test_case_name} :: Assigned tasks belong to another user"
+        assert sum(len(user["created_tasks"]) for user in users) == len(
+            user_actions.session.execute(select(Task.id)).all()
+        ), f"{test_case_name} :: Not every created task was loaded"
+
+    @pytest.mark.usefixtures("create_superuser", "create_role")
+    def test_create_users_in_batches(self, user_actions, n_plus_one_detector):
+        test_case_name = f"{self.__class__.__name__}.test_create_users_in_batches"
+        logger.info(f"[users_tests] :: Running test case: {test_case_name}")
+
+        role_id = random_role_id()
+        users_data = [
+            {
+                "username": f"{fake.user_name()[:15]}{index}",
+                "full_name": fake.name(),
+                "email": f"{index}{fake.email()}",
+                "hashed_password": fake.sha256(),
+                "role_id": role_id,
+            }
+            for index in range(10)
+        ]
+
+        user_ids = user_actions.create_users(users_data, batch_size=2)
+        logger.info(f"{test_case_name} :: Created users with IDs: {user_ids}")
+
+        assert len(user_ids) == len(
+            users_data
+        ), f"{test_case_name} :: Not every user was created"
+
+        for user_id, user_data in zip(user_ids, users_data):
+            created_user = user_actions.get_user_by_id(filter_value=user_id)
+            assert (
+                created_user["username"] == user_data["username"]
+            ), f"{test_case_name} :: Created user IDs do not match the input order"
+        assert (
+            not n_plus_one_detector.violations
+        ), f"{test_case_name} :: Batch inserts were reported as N+1 queries"
+
+    @pytest.mark.usefixtures("create_superuser", "create_role")
+    def test_upsert_users(self, create_user, user_actions, assert_max_queries):
+        test_case_name = f"{self.__class__.__name__}.test_upsert_users"
+        logger.info(f"[users_tests] :: Running test case: {test_case_name}")
+
+        role_id = random_role_id()
+        existing_user = {
+            "username": create_user["username"],
+            "full_name": fake.name(),
+            "email": create_user["email"],
+            "hashed_password": create_user["hashed_password"],
+            "role_id": role_id,
+        }
+        new_users = [
+            {
+                "username": usernames(),
+                "full_name": fake.name(),
+                "email": emails(),
+                "hashed_password": fake.sha256(),
+                "role_id": role_id,
+            }
+            for _ in range(3)
+        ]
+        repeated_user = new_users[0] | {"full_name": fake.name()}
+
+        with assert_max_queries(1):
+            report = user_actions.upsert_users(
+                [existing_user, *new_users, repeated_user],
+                update_columns=["full_name", "role_id"],
+            )
+        logger.info(f"{test_case_name} :: Upsert report: {report}")
+
+        assert (
+            report.inserted == len(new_users) and report.updated == 1
+        ), f"{test_case_name} :: Inserted and updated counts are wrong"
+        updated_user = user_actions.get_user_by_username(
+            filter_value=create_user["username"]
+        )
+        assert (
+            updated_user["full_name"] == existing_user["full_name"]
+        ), f"{test_case_name} :: Existing user was not updated"
+        assert (
+            user_actions.get_user_by_id(filter_value=report.ids[1])["full_name"]
+            == repeated_user["full_name"]
+        ), f"{test_case_name} :: The last duplicate row did not win"
+
+        report = user_actions.upsert_users(new_users, batch_size=2)
+        assert report.inserted == 0 and report.updated == len(
+            new_users
+        ), f"{test_case_name} :: Re-importing users inserted new rows"
+
+        activated_user = new_users[1] | {"is_active": True}
+        report = user_actions.upsert_users([new_users[0], activated_user, new_users[2]])
+        assert report.ids == [
+            user_actions.get_user_by_username(filter_value=user["username"])["id"]
+            for user in new_users
+        ], f"{test_case_name} :: Upserted IDs are not in input order"
+        assert (
+            user_actions.get_user_by_id(filter_value=report.ids[1])["is_active"] is True
+        ), f"{test_case_name} :: Columns present only in later rows were dropped"
+
+    @pytest.mark.db_isolation("truncate")
+    @pytest.mark.usefixtures("create_superuser", "create_role")
+    def test_copy_users_from_rows(self, user_actions):
+        test_case_name = f"{self.__class__.__name__}.test_copy_users_from_rows"
+        logger.info(f"[users_tests] :: Running test case: {test_case_name}")
+
+        role_id = random_role_id()
+        users_data = (
+            {
+                "username": f"copy_user_{index}",
+                "full_name": fake.name(),
+                "email": f"copy_user_{index}@example.com",
+                "hashed_password": fake.sha256(),
+                "role_id": role_id,
+            }
+            for index in range(5)
+        )
+
+        load_report = copy_rows("users", users_data, buffer_size=64)
+        logger.info(f"{test_case_name} :: Copied users: {load_report}")
+
+        assert load_report.rows == 5, f"{test_case_name} :: Not every user was copied"
+
+        copied_user = user_actions.get_user_by_username(filter_value="copy_user_4")
+        assert (
+            copied_user is not None and copied_user["role_id"] == role_id
+        ), f"{test_case_name} :: Copied user not found by username"
+
+        orm_user = User(
+            username="copy_user_orm",
+            full_name=fake.name(),
+            email="copy_user_orm@example.com",
+            hashed_password=fake.sha256(),
+            role_id=role_id,
+        )
+        copy_rows("users", [orm_user])
+
+        copied_user = user_actions.get_user_by_username(filter_value="copy_user_orm")
+        assert (
+            copied_user is not None
+            and copied_user["is_active"] is False
+            and copied_user["registered_at"] is not None
+        ), f"{test_case_name} :: Column defaults were not applied to ORM rows"
+
+    @pytest.mark.asyncio
+    @pytest.mark.db_isolation("truncate")
+    @pytest.mark.usefixtures("create_superuser", "create_role")
+    async def test_async_create_update_and_delete_user(self, async_user_actions):
+        test_case_name = (
+            f"{self.__class__.__name__}.test_async_create_update_and_delete_user"
+        )
+        logger.info(f"[users_tests] :: Running test case: {test_case_name}")
+
+        user_data = {
+            "username": fake.user_name(),
+            "full_name": fake.name(),
+            "email": fake.email(),
+            "hashed_password": fake.sha256(),
+            "role_id": random_role_id(),
+        }
+        created_user = await async_user_actions.create_user(user_data)
+        logger.info(f"{test_case_name} :: Created user: {created_user}")
+
+        user_id = created_user["id"]
+        result_user = await async_user_actions.get_user_by_username(
+            filter_value=user_data["username"]
+        )
+        assert (
+            result_user is not None and result_user["id"] == user_id
+        ), f"{test_case_name} :: User not found by username"
+
+        await async_user_actions.update_user_fields(
+            filter_param="id", filter_value=user_id, updated_data={"is_active": False}
+        )
+        updated_user = await async_user_actions.get_user_by_id(filter_value=user_id)
+        assert (
+            updated_user["is_active"] is False
+        ), f"{test_case_name} :: The user was not updated"
+
+        await async_user_actions.delete_user(filter_param="id", filter_value=user_id)
+        deleted_user = await async_user_actions.get_user_by_id(filter_value=user_id)
+        assert deleted_user is None, f"{test_case_name} :: The user was not deleted"
+
+    @pytest.mark.usefixtures("create_superuser", "create_role")
+    def test_create_users_with_each_password_hash_mode(self):
+        test_case_name = (
+            f"{self.__class__.__name__}.test_create_users_with_each_password_hash_mode"
+        )
+        logger.info(f"[users_tests] :: Running test case: {test_case_name}")
+
+        for mode in PasswordHashMode:
+            users = UserFactoryActions.create_users(2, password_hash_mode=mode)
+            hashes = [user["hashed_password"] for user in users]
+            logger.info(f"{test_case_name} :: Hashes with {mode.value}: {hashes}")
+
+            assert all(
+                pwd_context.identify(hashed_password) == "bcrypt"
+                for hashed_password in hashes
+            ), f"{test_case_name} :: {mode.value} did not produce bcrypt hashes"
+
+            if mode is PasswordHashMode.PRECOMPUTED:
+                assert all(
+                    pwd_context.verify(PRECOMPUTED_PASSWORD, hashed_password)
+                    for hashed_password in hashes
+                ), f"{test_case_name} :: Precomputed hashes do not verify"
+            elif mode is PasswordHashMode.LOW_ROUNDS:
+                assert all(
+                    hashed_password.startswith("$2b$04$") for hashed_password in hashes
+                ), f"{test_case_name} :: Low-rounds hashes use the wrong cost"
+            else:
+                assert len(set(hashes)) == len(
+                    hashes
+                ), f"{test_case_name} :: {mode.value} hashes are not unique"
+
+    @pytest.mark.usefixtures("create_superuser", "create_role")
+    def test_create_users_with_unique_pooled_values(self, user_actions):
+        test_case_name = (
+            f"{self.__class__.__name__}.test_create_users_with_unique_pooled_values"
+        )
+        logger.info(f"[users_tests] :: Running test case: {test_case_name}")
+
+        pooled_usernames = usernames.take(20_000)
+        pooled_emails = emails.take(20_000)
+
+        assert len(set(pooled_usernames)) == len(
+            pooled_usernames
+        ), f"{test_case_name} :: Pooled usernames are not unique"
+        assert len(set(pooled_emails)) == len(
+            pooled_emails
+        ), f"{test_case_name} :: Pooled emails are not unique"
+        assert all(
+            len(username) <= USERNAME_MAX_LENGTH for username in pooled_usernames
+        ), f"{test_case_name} :: Pooled usernames exceed the column length"
+
+        with ProcessPoolExecutor(max_workers=2) as executor:
+            worker_usernames = list(
+                chain.from_iterable(executor.map(take_usernames, [1000, 1000]))
+            )
+        parent_usernames = take_usernames(2000)
+        assert len(set(worker_usernames + parent_usernames)) == len(
+            worker_usernames
+        ) + len(
+            parent_usernames
+        ), f"{test_case_name} :: Pooled usernames repeat across processes"
+
+        users = UserFactoryActions.create_users(50)
+        logger.info(f"{test_case_name} :: Created {len(users)} users")
+
+        for user in users[:5]:
+            created_user = user_actions.get_user_by_username(
+                filter_value=user["username"]
+            )
+            assert (
+                created_user is not None and created_user["email"] == user["email"]
+            ), f"{test_case_name} :: Pooled user not found by username"